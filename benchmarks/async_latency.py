@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Measure the latency of short requests to an in-process stand-in for an ``asyncio`` server that
+tokenises (or sentence splits) texts while a client keeps sending it long documents, comparing
+processing the texts directly in the event loop against ``AsyncProcessor`` with and without
+cutting long texts into pieces.
+'''
+
+import argparse
+import asyncio
+import functools
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+from common import make_texts, make_document
+from malti.sent_splitter import KMSentSplitter
+from malti.tokeniser import KMTokeniser
+from malti.asynchronous import AsyncProcessor
+
+
+async def handle_blocking(
+    func: Callable[[str], Any],
+    text: str,
+) -> Any:
+    '''
+    Handle a request by processing its text directly in the event loop.
+
+    :param func: The function that processes the text.
+    :param text: The text of the request.
+    :return: The result.
+    '''
+    return func(text)
+
+
+async def run_load(
+    handle: Callable[[str], Awaitable[Any]],
+    short_texts: list[str],
+    long_texts: list[str],
+    num_clients: int,
+    interval: float,
+) -> tuple[list[float], float]:
+    '''
+    Send requests to a server stand-in from concurrent clients: one client sends the long texts
+    one after the other while the rest each send a short text every ``interval`` seconds.
+    The latency of a short request is measured from when it was due to be sent, so that time
+    spent waiting for a blocked event loop is included.
+
+    :param handle: The function that handles a request.
+    :param short_texts: The texts of the short requests.
+    :param long_texts: The texts of the long requests.
+    :param num_clients: The number of clients sending short requests.
+    :param interval: The time in seconds between the short requests of a client.
+    :return: A pair consisting of the latency of each short request and the total time, in
+        seconds.
+    '''
+    latencies: list[float] = []
+    start = time.perf_counter()
+
+    async def short_client(
+        client_index: int,
+        texts: list[str],
+    ) -> None:
+        '''
+        Send short requests and measure their latency.
+
+        :param client_index: The number of the client, used to spread out the clients.
+        :param texts: The texts of the requests.
+        '''
+        due_time = start + interval*client_index/num_clients
+        for text in texts:
+            await asyncio.sleep(max(0.0, due_time - time.perf_counter()))
+            await handle(text)
+            latencies.append(time.perf_counter() - due_time)
+            due_time = max(due_time + interval, time.perf_counter())
+
+    async def long_client(
+    ) -> None:
+        '''
+        Send the long requests.
+        '''
+        for text in long_texts:
+            await handle(text)
+
+    await asyncio.gather(
+        long_client(),
+        *[short_client(i, short_texts[i::num_clients]) for i in range(num_clients)],
+    )
+    return (latencies, time.perf_counter() - start)
+
+
+async def measure(
+    method: str,
+    args: argparse.Namespace,
+    short_texts: list[str],
+    long_texts: list[str],
+) -> tuple[list[float], float]:
+    '''
+    Measure the latencies of a method of handling requests.
+
+    :param method: The name of the method.
+    :param args: The command-line arguments.
+    :param short_texts: The texts of the short requests.
+    :param long_texts: The texts of the long requests.
+    :return: A pair consisting of the latency of each short request and the total time, in
+        seconds.
+    '''
+    if method == 'blocking':
+        func = KMTokeniser().tokenise if args.operation == 'tokenise' else KMSentSplitter().split
+        return await run_load(
+            functools.partial(handle_blocking, func), short_texts, long_texts,
+            args.num_clients, args.interval,
+        )
+
+    processor = AsyncProcessor(
+        args.workers, use_processes=method.startswith('processes'),
+        piece_size=args.piece_size if method.endswith('pieces') else max(map(len, long_texts)),
+    )
+    async with processor:
+        handle = processor.atokenise if args.operation == 'tokenise' else processor.asplit
+        await handle('Tisħin.') # Start the pool before measuring.
+        return await run_load(
+            handle, short_texts, long_texts, args.num_clients, args.interval,
+        )
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Measure the latency of short requests to an asyncio server under load.'
+    )
+    parser.add_argument(
+        '--operation', choices=['tokenise', 'split'], default='tokenise',
+        help='What the server does with the texts.',
+    )
+    parser.add_argument(
+        '--num_short', type=int, default=2000,
+        help='The number of short requests (of 10 to 50 words each).',
+    )
+    parser.add_argument(
+        '--num_long', type=int, default=10,
+        help='The number of long requests.',
+    )
+    parser.add_argument(
+        '--long_paragraphs', type=int, default=200,
+        help='The number of paragraphs (of 50 to 300 words each) in each long request.',
+    )
+    parser.add_argument(
+        '--num_clients', type=int, default=20,
+        help='The number of clients sending short requests concurrently.',
+    )
+    parser.add_argument(
+        '--interval', type=float, default=0.05,
+        help='The time in seconds between the short requests of a client.',
+    )
+    parser.add_argument(
+        '--workers', type=int, default=2,
+        help='The number of threads or processes in the pool of the asynchronous processor.',
+    )
+    parser.add_argument(
+        '--piece_size', type=int, default=AsyncProcessor.DEFAULT_PIECE_SIZE,
+        help='The number of characters that the asynchronous processor processes at a time.',
+    )
+    args = parser.parse_args()
+
+    short_texts = make_texts(args.num_short, 10, 50)
+    long_texts = [
+        make_document(args.long_paragraphs, seed=seed) for seed in range(args.num_long)
+    ]
+
+    print(
+        'method', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'max (ms)', 'total (s)', sep='\t',
+    )
+    for method in ['blocking', 'threads', 'threads with pieces', 'processes with pieces']:
+        (latencies, total_time) = asyncio.run(measure(method, args, short_texts, long_texts))
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(
+            method, f'{percentiles[49]*1000:.2f}', f'{percentiles[94]*1000:.2f}',
+            f'{percentiles[98]*1000:.2f}', f'{max(latencies)*1000:.2f}', f'{total_time:.2f}',
+            sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
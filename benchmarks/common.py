@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Common functions used by the benchmarks.
+'''
+
+import os
+import json
+import random
+import timeit
+from typing import Any, Callable
+import malti
+
+
+def load_test_set(
+    name: str,
+) -> list[dict[str, Any]]:
+    '''
+    Load one of the test sets used by the unit tests.
+
+    :param name: The path of the test set's directory relative to the ``tests`` directory, e.g.
+        ``'tokeniser/km_tokeniser'``.
+    :return: The list of test items.
+    '''
+    path = os.path.abspath(os.path.join(
+        malti.path, '..', '..', 'tests', *name.split('/'), 'test_set.json'
+    ))
+    with open(path, 'r', encoding='utf-8') as f:
+        test_set: list[dict[str, Any]] = json.load(f)
+    return test_set
+
+
+def get_vocabulary(
+) -> list[str]:
+    '''
+    Get a list of words taken from the tokeniser and sentence splitter test sets, with repetitions
+    kept so that sampling from it follows the words' frequencies.
+
+    :return: The list of words.
+    '''
+    words: list[str] = []
+    for test_item in load_test_set('tokeniser/km_tokeniser'):
+        words.extend(test_item['text'].split())
+    for test_item in load_test_set('sent_splitter/km_sent_splitter'):
+        words.extend(test_item['text'].split())
+    return words
+
+
+def make_texts(
+    num_texts: int,
+    min_words: int,
+    max_words: int,
+    seed: int = 0,
+) -> list[str]:
+    '''
+    Make a reproducible list of random texts consisting of words from the test sets.
+
+    :param num_texts: The number of texts to make.
+    :param min_words: The minimum number of words in a text.
+    :param max_words: The maximum number of words in a text.
+    :param seed: The random seed to use.
+    :return: The list of texts.
+    '''
+    rng = random.Random(seed)
+    words = get_vocabulary()
+    return [
+        ' '.join(rng.choices(words, k=rng.randint(min_words, max_words)))
+        for _ in range(num_texts)
+    ]
+
+
+def best_time(
+    func: Callable[[], Any],
+    repeat: int = 7,
+    number: int = 1,
+) -> float:
+    '''
+    Measure the best time taken to run a function.
+
+    :param func: The function to run (without arguments).
+    :param repeat: The number of times to repeat the measurement.
+    :param number: The number of times to run the function in each measurement.
+    :return: The best time in seconds for a single run of the function.
+    '''
+    return min(timeit.repeat(func, repeat=repeat, number=number))/number
+
+
+def make_document(
+    num_paragraphs: int,
+    line_width: int = 60,
+    seed: int = 0,
+) -> str:
+    '''
+    Make a document of paragraphs broken into lines, as extracted from a PDF, with some words
+    hyphenated at the end of a line.
+
+    :param num_paragraphs: The number of paragraphs (of 50 to 300 words each).
+    :param line_width: The approximate number of characters in a line.
+    :param seed: The random seed.
+    :return: The document.
+    '''
+    rng = random.Random(seed)
+    paragraphs: list[str] = []
+    for text in make_texts(num_paragraphs, 50, 300, seed):
+        lines = []
+        line = ''
+        for word in text.split(' '):
+            if len(line) + len(word) > line_width:
+                if len(word) > 4 and rng.random() < 0.5:
+                    cut = len(word)//2
+                    lines.append(line + word[:cut] + '-')
+                    line = word[cut:] + ' '
+                else:
+                    lines.append(line)
+                    line = word + ' '
+            else:
+                line += word + ' '
+        lines.append(line)
+        paragraphs.append('\n'.join(lines))
+    return '\n\n'.join(paragraphs) + '\n'
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the memory and time taken by the tokeniser's list of tuples indices against the compact
+array-backed indices.
+'''
+
+import argparse
+import functools
+import timeit
+import tracemalloc
+from typing import Any, Callable
+from common import make_texts
+from malti.tokeniser import KMTokeniser
+
+
+def measure(
+    func: Callable[[], Any],
+) -> tuple[float, int]:
+    '''
+    Measure the time taken by a function and the memory taken by its result.
+
+    :param func: The function to run (without arguments).
+    :return: A pair consisting of the time in seconds and the size of the result in bytes.
+    '''
+    duration = min(timeit.repeat(func, repeat=3, number=1))
+
+    tracemalloc.start()
+    result = func()
+    (size, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return (duration, size)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the memory taken by the tokeniser\'s list and compact indices.'
+    )
+    parser.add_argument(
+        '--num_texts', type=int, nargs='+', default=[1000, 10000, 100000],
+        help='The number of texts (of 5 to 30 words each) in the tokenised document.',
+    )
+    args = parser.parse_args()
+
+    tokeniser = KMTokeniser()
+
+    print(
+        'tokens', 'list (MB)', 'compact (MB)', 'list (B/token)', 'compact (B/token)',
+        'list (s)', 'compact (s)', sep='\t',
+    )
+    for num_texts in args.num_texts:
+        text = '\n'.join(make_texts(num_texts, 5, 30))
+        num_tokens = len(tokeniser.tokenise_indices_compact(text))
+
+        (list_time, list_size) = measure(functools.partial(tokeniser.tokenise_indices, text))
+        (compact_time, compact_size) = measure(
+            functools.partial(tokeniser.tokenise_indices_compact, text)
+        )
+        print(
+            num_tokens,
+            f'{list_size/1024**2:.2f}', f'{compact_size/1024**2:.2f}',
+            f'{list_size/num_tokens:.1f}', f'{compact_size/num_tokens:.1f}',
+            f'{list_time:.4f}', f'{compact_time:.4f}',
+            sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
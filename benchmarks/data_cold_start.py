@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the time taken to load each data resource in a new process (a cold start) from its source
+file against loading it from its compiled cache file.
+'''
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from typing import Optional
+from malti.data import Data
+
+
+COLD_START_SCRIPT = '''
+import sys
+import time
+from malti.data import Data
+if sys.argv[2] != '':
+    Data.set_cache_directory(sys.argv[2])
+start = time.perf_counter()
+if sys.argv[1] == '':
+    Data.preload()
+else:
+    Data.get(sys.argv[1])
+print(time.perf_counter() - start)
+'''
+'''The script that measures the time taken to load a resource in a new process.'''
+
+
+def measure_cold_start(
+    name: Optional[str],
+    cache_directory: Optional[str],
+    repeat: int,
+) -> float:
+    '''
+    Measure the best time taken to load a data resource in a new process.
+
+    :param name: The name of the resource or ``None`` to preload all the resources.
+    :param cache_directory: The directory with the cache files or ``None`` to not use them.
+    :param repeat: The number of processes to measure.
+    :return: The best time in seconds.
+    '''
+    durations = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', COLD_START_SCRIPT, name or '', cache_directory or ''],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        durations.append(float(output))
+    return min(durations)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the cold start time of the data resources with and without a cache.'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=10,
+        help='The number of new processes to measure for each resource.',
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_directory:
+        Data.set_cache_directory(cache_directory)
+        Data.compile()
+
+        names: list[Optional[str]] = ['tokens_with_dash_end', 'non_breaking_prefixes', None]
+        print('resource', 'source (ms)', 'cache (ms)', 'speedup', sep='\t')
+        for name in names:
+            source_time = measure_cold_start(name, None, args.repeat)
+            cache_time = measure_cold_start(name, cache_directory, args.repeat)
+            print(
+                name or 'preload', f'{source_time*1000:.3f}', f'{cache_time*1000:.3f}',
+                f'{source_time/cache_time:.1f}x', sep='\t',
+            )
+
+
+if __name__ == '__main__':
+    main()
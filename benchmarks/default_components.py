@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the per call cost of the convenience functions (which reuse cached default components)
+against creating a new component on every call (as was done before the components were cached).
+'''
+
+import argparse
+import timeit
+from common import make_texts
+import malti.tokeniser
+import malti.sent_splitter
+import malti.line_joiner
+from malti.defaults import Defaults
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the per call cost of the convenience functions.'
+    )
+    parser.add_argument(
+        '--num_calls', type=int, default=200,
+        help='The number of calls to make to each function.',
+    )
+    args = parser.parse_args()
+
+    texts = make_texts(args.num_calls, 5, 30)
+    lines_list = [text.split(' ') for text in texts]
+
+    cold_start = timeit.timeit(Defaults.warm_up, number=1)
+    print(f'warm_up: {cold_start*1000:.2f}ms')
+    print()
+
+    print('function', 'new component (ms/call)', 'cached component (ms/call)', 'speedup', sep='\t')
+    for (name, uncached, cached) in [
+        (
+            'tokenise',
+            lambda: [malti.tokeniser.KMTokeniser().tokenise(text) for text in texts],
+            lambda: [malti.tokeniser.tokenise(text) for text in texts],
+        ),
+        (
+            'split',
+            lambda: [malti.sent_splitter.KMSentSplitter().split(text) for text in texts],
+            lambda: [malti.sent_splitter.split(text) for text in texts],
+        ),
+        (
+            'join_lines',
+            lambda: [malti.line_joiner.RBLineJoiner().join_lines(lines) for lines in lines_list],
+            lambda: [malti.line_joiner.join_lines(lines) for lines in lines_list],
+        ),
+    ]:
+        uncached_time = min(timeit.repeat(uncached, repeat=3, number=1))/args.num_calls
+        cached_time = min(timeit.repeat(cached, repeat=3, number=1))/args.num_calls
+        print(
+            name, f'{uncached_time*1000:.4f}', f'{cached_time*1000:.4f}',
+            f'{uncached_time/cached_time:.1f}x', sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the throughput of the KM tokeniser's ``detokenise`` with its token classification cache
+against classifying every token with regular expressions (as was done before the cache).
+'''
+
+import argparse
+import functools
+from common import make_texts, best_time
+from malti.tokeniser import KMTokeniser
+
+
+def detokenise_uncached(
+    tokeniser: KMTokeniser,
+    tokens: list[str],
+) -> str:
+    '''
+    Detokenise a list of tokens by matching every token against the detokenisation regular
+    expressions, which is how ``KMTokeniser.detokenise`` worked before it had a cache.
+
+    :param tokeniser: The tokeniser whose regular expressions to use.
+    :param tokens: The tokenised text.
+    :return: The text.
+    '''
+    # pylint: disable=protected-access
+    tokens_with_spaces: list[str] = []
+
+    for token in tokens:
+        if tokeniser._detok_no_space_after_re.match(token):
+            tokens_with_spaces.append(token)
+        elif tokeniser._detok_no_space_before_re.match(token):
+            if tokens_with_spaces and tokens_with_spaces[-1] == ' ':
+                tokens_with_spaces.pop()
+                tokens_with_spaces.append(token)
+                tokens_with_spaces.append(' ')
+        else:
+            tokens_with_spaces.append(token)
+            tokens_with_spaces.append(' ')
+
+    text = ''.join(tokens_with_spaces)
+    return text.strip()
+
+
+def detokenise_all_uncached(
+    tokeniser: KMTokeniser,
+    token_lists: list[list[str]],
+) -> list[str]:
+    '''
+    Detokenise a list of token lists with ``detokenise_uncached``.
+
+    :param tokeniser: The tokeniser whose regular expressions to use.
+    :param token_lists: The tokenised texts.
+    :return: The list of texts.
+    '''
+    return [detokenise_uncached(tokeniser, tokens) for tokens in token_lists]
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the throughput of the KM tokeniser\'s detokenise with its cache.'
+    )
+    parser.add_argument(
+        '--num_texts', type=int, default=10000,
+        help='The number of texts (of 5 to 30 words each) to detokenise.',
+    )
+    parser.add_argument(
+        '--cache_sizes', type=int, nargs='+', default=[0, 100, 1000, 10000],
+        help='The cache sizes to try.',
+    )
+    args = parser.parse_args()
+
+    tokeniser = KMTokeniser()
+    token_lists = tokeniser.tokenise_batch(make_texts(args.num_texts, 5, 30))
+    num_tokens = sum(len(tokens) for tokens in token_lists)
+    expected = detokenise_all_uncached(tokeniser, token_lists)
+
+    duration = best_time(functools.partial(detokenise_all_uncached, tokeniser, token_lists))
+    print('cache size', 'tokens/s', 'speedup', 'hit rate', sep='\t')
+    print('uncached', f'{num_tokens/duration:.0f}', '1.00x', '-', sep='\t')
+    baseline = duration
+
+    for cache_size in args.cache_sizes:
+        tokeniser = KMTokeniser(detokenise_cache_size=cache_size)
+        assert tokeniser.detokenise_batch(token_lists) == expected
+        stats = tokeniser.get_detokenise_cache_stats()
+        hit_rate = stats['hits']/(stats['hits'] + stats['misses'])
+
+        duration = best_time(functools.partial(tokeniser.detokenise_batch, token_lists))
+        print(
+            cache_size, f'{num_tokens/duration:.0f}', f'{baseline/duration:.2f}x',
+            f'{hit_rate:.2%}', sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
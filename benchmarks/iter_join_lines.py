@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the time and peak memory taken by joining the paragraphs of a whole file of lines with
+``join_lines`` against streaming it through ``iter_join_lines``.
+'''
+
+import argparse
+import functools
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+from common import make_document
+from malti.line_joiner import RBLineJoiner
+
+
+def join_whole(
+    line_joiner: RBLineJoiner,
+    path: str,
+) -> int:
+    '''
+    Read a whole file into memory and join the lines of each paragraph.
+
+    :param line_joiner: The line joiner to use.
+    :param path: The path to the file.
+    :return: The number of paragraphs.
+    '''
+    with open(path, 'r', encoding='utf-8') as f:
+        paragraphs = f.read().split('\n\n')
+    return len([
+        line_joiner.join_lines(paragraph.split('\n'), fix_hyphenated_words=True)
+        for paragraph in paragraphs
+    ])
+
+
+def join_streamed(
+    line_joiner: RBLineJoiner,
+    path: str,
+) -> int:
+    '''
+    Join the lines of each paragraph of a file as it is read.
+
+    :param line_joiner: The line joiner to use.
+    :param path: The path to the file.
+    :return: The number of paragraphs.
+    '''
+    with open(path, 'r', encoding='utf-8') as f:
+        return sum(1 for _ in line_joiner.iter_join_lines(f, fix_hyphenated_words=True))
+
+
+def measure(
+    func: Callable[[], Any],
+) -> tuple[float, int]:
+    '''
+    Measure the time taken by a function and the peak memory it allocates.
+
+    :param func: The function to run (without arguments).
+    :return: A pair consisting of the time in seconds and the peak memory in bytes.
+    '''
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (duration, peak)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the time and peak memory of join_lines and iter_join_lines.'
+    )
+    parser.add_argument(
+        '--num_paragraphs', type=int, nargs='+', default=[1000, 5000, 10000],
+        help='The number of paragraphs (of 50 to 300 words each) in the file.',
+    )
+    args = parser.parse_args()
+
+    line_joiner = RBLineJoiner()
+
+    print(
+        'file (MB)', 'join_lines (s)', 'iter_join_lines (s)', 'join_lines peak (MB)',
+        'iter_join_lines peak (MB)', sep='\t',
+    )
+    with tempfile.TemporaryDirectory() as tmp_path:
+        path = os.path.join(tmp_path, 'document.txt')
+        for num_paragraphs in args.num_paragraphs:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(make_document(num_paragraphs))
+            (whole_time, whole_peak) = measure(functools.partial(join_whole, line_joiner, path))
+            (streamed_time, streamed_peak) = measure(
+                functools.partial(join_streamed, line_joiner, path)
+            )
+            print(
+                f'{os.path.getsize(path)/1024**2:.2f}',
+                f'{whole_time:.3f}', f'{streamed_time:.3f}',
+                f'{whole_peak/1024**2:.2f}', f'{streamed_peak/1024**2:.2f}',
+                sep='\t',
+            )
+
+
+if __name__ == '__main__':
+    main()
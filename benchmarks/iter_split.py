@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the time and peak memory taken by splitting a whole text read from a file with ``split``
+against streaming it through ``iter_split``.
+'''
+
+import argparse
+import functools
+import io
+import time
+import tracemalloc
+from typing import Any, Callable
+from common import make_texts
+from malti.sent_splitter import SentSplitter, KMSentSplitter, RBSentSplitter
+
+
+def split_whole(
+    splitter: SentSplitter,
+    text: str,
+) -> int:
+    '''
+    Read a whole file into memory and split it.
+
+    :param splitter: The sentence splitter to use.
+    :param text: The content of the file.
+    :return: The number of sentences.
+    '''
+    with io.StringIO(text) as f:
+        return len(splitter.split(f.read()))
+
+
+def split_streamed(
+    splitter: SentSplitter,
+    text: str,
+) -> int:
+    '''
+    Split a file as it is read.
+
+    :param splitter: The sentence splitter to use.
+    :param text: The content of the file.
+    :return: The number of sentences.
+    '''
+    with io.StringIO(text) as f:
+        return sum(1 for _ in splitter.iter_split(f))
+
+
+def measure(
+    func: Callable[[], Any],
+) -> tuple[float, int]:
+    '''
+    Measure the time taken by a function and the peak memory it allocates.
+
+    :param func: The function to run (without arguments).
+    :return: A pair consisting of the time in seconds and the peak memory in bytes.
+    '''
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (duration, peak)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the time and peak memory of split and iter_split.'
+    )
+    parser.add_argument(
+        '--num_texts', type=int, nargs='+', default=[1000, 5000, 10000],
+        help='The number of paragraphs (of 5 to 30 words each) in the file.',
+    )
+    args = parser.parse_args()
+
+    splitters: dict[str, SentSplitter] = {
+        'KMSentSplitter': KMSentSplitter(),
+        'RBSentSplitter': RBSentSplitter(),
+    }
+
+    print(
+        'splitter', 'file (MB)', 'split (s)', 'iter_split (s)', 'split peak (MB)',
+        'iter_split peak (MB)', sep='\t',
+    )
+    for (name, splitter) in splitters.items():
+        for num_texts in args.num_texts:
+            text = '\n'.join(make_texts(num_texts, 5, 30))
+            (whole_time, whole_peak) = measure(functools.partial(split_whole, splitter, text))
+            (streamed_time, streamed_peak) = measure(
+                functools.partial(split_streamed, splitter, text)
+            )
+            print(
+                name, f'{len(text.encode("utf-8"))/1024**2:.2f}',
+                f'{whole_time:.3f}', f'{streamed_time:.3f}',
+                f'{whole_peak/1024**2:.2f}', f'{streamed_peak/1024**2:.2f}',
+                sep='\t',
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the throughput of ``RBLineJoiner.join_lines``, which finds all the line ends in one go and
+only looks at the ends of lines, against checking one line at a time with regular expressions
+that scan whole lines (as was done before) on lines of different lengths.
+'''
+
+import argparse
+import functools
+import random
+from common import get_vocabulary, best_time
+from malti.data import Data
+from malti.line_joiner import RBLineJoiner
+
+
+def is_hyphenated_word_at_end_whole_line(
+    line_joiner: RBLineJoiner,
+    line: str,
+) -> bool:
+    '''
+    Check if a line ends with a hyphenated word by matching the rules against the whole line,
+    which is how ``RBLineJoiner.is_hyphenated_word_at_end`` worked before.
+
+    :param line_joiner: The line joiner whose regular expressions to use.
+    :param line: The line to check.
+    :return: Whether the line ends with a hyphenated word.
+    '''
+    if line[-1] != '-':
+        return False
+    match = line_joiner.last_word_re.match(line)
+    assert match is not None
+    last_word = match.group('last_word').lower()
+    return not (
+        last_word == '-'
+        or last_word in Data.get_tokens_with_dash_end()
+        or line_joiner.url_re.match(line)
+        or line_joiner.num_re.match(line)
+    )
+
+
+def join_lines_per_line(
+    line_joiner: RBLineJoiner,
+    lines: list[str],
+) -> str:
+    '''
+    Join lines (fixing hyphenated words) one line at a time, which is how
+    ``RBLineJoiner.join_lines`` worked before.
+
+    :param line_joiner: The line joiner whose regular expressions to use.
+    :param lines: The lines.
+    :return: The joined lines.
+    '''
+    lines = [line.strip() for line in lines]
+    lines = [line for line in lines if line != '']
+    new_lines = []
+    last_line_index = len(lines) - 1
+    for (i, line) in enumerate(lines):
+        new_lines.append(line)
+        if i == last_line_index:
+            pass
+        elif line[-1] in line_joiner.no_space_end_chars:
+            if len(line) > 1 and line[-2] == ' ':
+                new_lines.append(' ')
+            elif is_hyphenated_word_at_end_whole_line(line_joiner, line):
+                new_lines.pop()
+                new_lines.append(line[:-1])
+        else:
+            new_lines.append(' ')
+    return ''.join(new_lines)
+
+
+def make_lines(
+    num_characters: int,
+    line_width: int,
+    seed: int = 0,
+) -> list[str]:
+    '''
+    Make a reproducible list of lines of about the same width, half of which end with a
+    hyphenated word.
+
+    :param num_characters: The approximate total number of characters in the lines.
+    :param line_width: The approximate number of characters in a line.
+    :param seed: The random seed to use.
+    :return: The list of lines.
+    '''
+    rng = random.Random(seed)
+    words = [word for word in get_vocabulary() if len(word) > 4 and word.isalpha()]
+    lines: list[str] = []
+    line: list[str] = []
+    line_size = 0
+    while len(lines)*line_width < num_characters:
+        word = rng.choice(words)
+        if line_size + len(word) > line_width:
+            if rng.random() < 0.5:
+                cut = len(word)//2
+                line.append(word[:cut] + '-')
+                lines.append(' '.join(line))
+                line = [word[cut:]]
+                line_size = len(word) - cut
+            else:
+                lines.append(' '.join(line))
+                line = [word]
+                line_size = len(word)
+        else:
+            line.append(word)
+            line_size += len(word) + 1
+    lines.append(' '.join(line))
+    return lines
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the throughput of join_lines with joining one line at a time.'
+    )
+    parser.add_argument(
+        '--num_characters', type=int, default=2000000,
+        help='The approximate number of characters in the lines.',
+    )
+    parser.add_argument(
+        '--line_widths', type=int, nargs='+', default=[60, 1000, 10000, 100000],
+        help='The line widths to try.',
+    )
+    args = parser.parse_args()
+
+    line_joiner = RBLineJoiner()
+
+    print('line width', 'lines', 'per line (MB/s)', 'join_lines (MB/s)', 'speedup', sep='\t')
+    for line_width in args.line_widths:
+        lines = make_lines(args.num_characters, line_width)
+        assert line_joiner.join_lines(lines, True) == join_lines_per_line(line_joiner, lines)
+
+        num_megabytes = sum(len(line.encode('utf-8')) for line in lines)/1024**2
+        per_line_time = best_time(
+            functools.partial(join_lines_per_line, line_joiner, lines), repeat=3,
+        )
+        document_time = best_time(
+            functools.partial(line_joiner.join_lines, lines, True), repeat=3,
+        )
+        print(
+            line_width, len(lines), f'{num_megabytes/per_line_time:.1f}',
+            f'{num_megabytes/document_time:.1f}', f'{per_line_time/document_time:.1f}x',
+            sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the start up time, lookup throughput, and memory taken by a memory-mapped ``Lexicon``
+against reading a word list into a set.
+'''
+
+import argparse
+import concurrent.futures
+import functools
+import os
+import random
+import tempfile
+import time
+from typing import Any, Callable, Container
+from common import best_time
+from malti.data import Lexicon
+
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyzċġħż'
+'''The letters to make random words from.'''
+
+
+def make_words(
+    num_words: int,
+    seed: int = 0,
+) -> list[str]:
+    '''
+    Make a reproducible list of distinct random words.
+
+    :param num_words: The number of words to make.
+    :param seed: The random seed to use.
+    :return: The list of words.
+    '''
+    rng = random.Random(seed)
+    words: set[str] = set()
+    while len(words) < num_words:
+        words.add(''.join(rng.choices(LETTERS, k=rng.randint(3, 15))))
+    return sorted(words)
+
+
+def read_word_set(
+    path: str,
+) -> set[str]:
+    '''
+    Read a word list with one word per line into a set.
+
+    :param path: The path to the word list.
+    :return: The set of words.
+    '''
+    with open(path, 'r', encoding='utf-8') as f:
+        return {line.strip() for line in f}
+
+
+def count_known(
+    words: Container[str],
+    queries: list[str],
+) -> int:
+    '''
+    Look up a list of words.
+
+    :param words: The known words.
+    :param queries: The words to look up.
+    :return: The number of known words.
+    '''
+    return sum(1 for query in queries if query in words)
+
+
+def get_memory(
+) -> tuple[int, int]:
+    '''
+    Get the resident memory of the current process from ``/proc`` (only available on Linux).
+
+    :return: A pair consisting of the total resident memory and the part of it that is private to
+        the process (not backed by a file), in bytes.
+    '''
+    fields = {}
+    with open('/proc/self/status', 'r', encoding='utf-8') as f:
+        for line in f:
+            (name, _, value) = line.partition(':')
+            fields[name] = value.strip()
+    return (int(fields['VmRSS'].split()[0])*1024, int(fields['RssAnon'].split()[0])*1024)
+
+
+def measure_memory(
+    load: Callable[[str], Any],
+    path: str,
+    queries: list[str],
+) -> tuple[int, int]:
+    '''
+    Measure the memory taken by loading the words and looking up all of them (meant to be run in
+    a separate process).
+
+    :param load: The function that loads the words from a file.
+    :param path: The path to the file.
+    :param queries: The words to look up.
+    :return: A pair consisting of the increase in total resident memory and in private memory, in
+        bytes.
+    '''
+    (rss_before, private_before) = get_memory()
+    words = load(path)
+    count_known(words, queries)
+    (rss_after, private_after) = get_memory()
+    return (rss_after - rss_before, private_after - private_before)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare a memory-mapped lexicon with a set of words.'
+    )
+    parser.add_argument(
+        '--num_words', type=int, nargs='+', default=[10000, 100000, 1000000],
+        help='The number of words in the lexicon.',
+    )
+    parser.add_argument(
+        '--num_queries', type=int, default=100000,
+        help='The number of words to look up (half of which are known).',
+    )
+    args = parser.parse_args()
+
+    print(
+        'words', 'method', 'start up (ms)', 'lookups/s', 'RSS (MB)', 'private (MB)', sep='\t',
+    )
+    with tempfile.TemporaryDirectory() as path:
+        word_file = os.path.join(path, 'words.txt')
+        lexicon_file = os.path.join(path, 'lexicon.bin')
+        for num_words in args.num_words:
+            words = make_words(num_words)
+            with open(word_file, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(words))
+            Lexicon.build(words, lexicon_file)
+
+            rng = random.Random(0)
+            queries = rng.choices(words, k=args.num_queries//2) + [
+                word + 'x' for word in rng.choices(words, k=args.num_queries//2)
+            ]
+            rng.shuffle(queries)
+
+            loaders: list[tuple[str, Callable[[str], Container[str]], str]] = [
+                ('set', read_word_set, word_file),
+                ('Lexicon', Lexicon, lexicon_file),
+            ]
+            for (method, load, file_name) in loaders:
+                start = time.perf_counter()
+                loaded_words = load(file_name)
+                start_up_time = time.perf_counter() - start
+                duration = best_time(
+                    functools.partial(count_known, loaded_words, queries), repeat=3,
+                )
+                with concurrent.futures.ProcessPoolExecutor(1) as executor:
+                    (rss, private) = executor.submit(
+                        measure_memory, load, file_name, queries
+                    ).result()
+                print(
+                    num_words, method, f'{start_up_time*1000:.2f}',
+                    f'{len(queries)/duration:.0f}', f'{rss/1024**2:.2f}',
+                    f'{private/1024**2:.2f}', sep='\t',
+                )
+                if isinstance(loaded_words, Lexicon):
+                    loaded_words.close()
+                del loaded_words # Do not include freeing the words in the next start up time.
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the time taken to find the source line and column of every token of a joined document
+using ``join_lines_with_mapping`` against aligning the joined text with its lines using a diff.
+'''
+
+import argparse
+import difflib
+import functools
+from common import make_document, best_time
+from malti.line_joiner import RBLineJoiner
+from malti.tokeniser import KMTokeniser
+
+
+def locate_with_mapping(
+    line_joiner: RBLineJoiner,
+    tokeniser: KMTokeniser,
+    lines: list[str],
+) -> int:
+    '''
+    Join the lines and find the source line and column of the start of every token using the
+    mapping given by ``join_lines_with_mapping``.
+
+    :param line_joiner: The line joiner to use.
+    :param tokeniser: The tokeniser to use.
+    :param lines: The lines of the document.
+    :return: The number of tokens located.
+    '''
+    (text, mapping) = line_joiner.join_lines_with_mapping(lines, fix_hyphenated_words=True)
+    return len([mapping[start] for start in tokeniser.tokenise_indices_compact(text).starts])
+
+
+def locate_with_diff(
+    line_joiner: RBLineJoiner,
+    tokeniser: KMTokeniser,
+    lines: list[str],
+) -> int:
+    '''
+    Join the lines and find the source line and column of the start of every token by aligning
+    the joined text with the lines using ``difflib``.
+
+    :param line_joiner: The line joiner to use.
+    :param tokeniser: The tokeniser to use.
+    :param lines: The lines of the document.
+    :return: The number of tokens located.
+    '''
+    text = line_joiner.join_lines(lines, fix_hyphenated_words=True)
+    source = '\n'.join(lines)
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    source_positions = [-1]*len(text)
+    matcher = difflib.SequenceMatcher(None, text, source, autojunk=False)
+    for (text_start, source_start, size) in matcher.get_matching_blocks():
+        for i in range(size):
+            source_positions[text_start + i] = source_start + i
+
+    num_located = 0
+    line_index = 0
+    for start in tokeniser.tokenise_indices_compact(text).starts:
+        position = source_positions[start]
+        while line_starts[line_index + 1] <= position:
+            line_index += 1
+        num_located += 1
+    return num_located
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the time taken to locate tokens with a line mapping and a diff.'
+    )
+    parser.add_argument(
+        '--num_paragraphs', type=int, nargs='+', default=[2, 5, 10],
+        help='The number of paragraphs (of 50 to 300 words each) in the document.',
+    )
+    args = parser.parse_args()
+
+    line_joiner = RBLineJoiner()
+    tokeniser = KMTokeniser()
+
+    print(
+        'lines', 'join_lines (s)', 'join_lines_with_mapping (s)', 'mapping (KB)',
+        'locate with mapping (s)', 'locate with diff (s)', sep='\t',
+    )
+    for num_paragraphs in args.num_paragraphs:
+        lines = make_document(num_paragraphs).replace('\n\n', '\n').split('\n')
+        (_, mapping) = line_joiner.join_lines_with_mapping(lines, fix_hyphenated_words=True)
+        join_time = best_time(functools.partial(line_joiner.join_lines, lines, True))
+        mapping_time = best_time(
+            functools.partial(line_joiner.join_lines_with_mapping, lines, True)
+        )
+        locate_mapping_time = best_time(
+            functools.partial(locate_with_mapping, line_joiner, tokeniser, lines)
+        )
+        locate_diff_time = best_time(
+            functools.partial(locate_with_diff, line_joiner, tokeniser, lines), repeat=1,
+        )
+        print(
+            len(lines), f'{join_time:.4f}', f'{mapping_time:.4f}', f'{mapping.nbytes/1024:.1f}',
+            f'{locate_mapping_time:.4f}', f'{locate_diff_time:.4f}', sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Measure how the throughput of sentence splitting and tokenising documents with
+``malti.parallel.process_documents`` scales with the number of worker processes.
+'''
+
+import argparse
+import time
+from common import make_texts
+from malti.sent_splitter import KMSentSplitter
+from malti.tokeniser import KMTokeniser
+from malti.parallel import process_documents
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Measure the scaling of parallel document processing.'
+    )
+    parser.add_argument(
+        '--num_documents', type=int, default=2000,
+        help='The number of documents (of 5 sentences of 5 to 30 words each) to process.',
+    )
+    parser.add_argument(
+        '--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+        help='The numbers of worker processes to try.',
+    )
+    parser.add_argument(
+        '--chunksize', type=int, default=16,
+        help='The number of documents to send to a worker process at a time.',
+    )
+    args = parser.parse_args()
+
+    sentences = make_texts(5*args.num_documents, 5, 30)
+    documents = [
+        ' '.join(sentences[i:i + 5]) + '.'
+        for i in range(0, len(sentences), 5)
+    ]
+    num_megabytes = sum(len(document.encode('utf-8')) for document in documents)/1024**2
+
+    splitter = KMSentSplitter()
+    tokeniser = KMTokeniser()
+    start = time.perf_counter()
+    expected = [tokeniser.tokenise_batch(splitter.split(document)) for document in documents]
+    baseline = time.perf_counter() - start
+
+    print('workers', 'time (s)', 'MB/s', 'speedup', sep='\t')
+    print('serial', f'{baseline:.2f}', f'{num_megabytes/baseline:.2f}', '1.00x', sep='\t')
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = list(process_documents(documents, workers, args.chunksize))
+        duration = time.perf_counter() - start
+        assert results == expected
+        print(
+            workers, f'{duration:.2f}', f'{num_megabytes/duration:.2f}',
+            f'{baseline/duration:.2f}x', sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
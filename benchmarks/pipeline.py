@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the time and peak memory taken to join the lines, split, and tokenise a whole file by
+running each component over the fully materialised output of the previous one against streaming
+the file through a ``Pipeline``.
+'''
+
+import argparse
+import functools
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+from common import make_document
+from malti.line_joiner import RBLineJoiner
+from malti.sent_splitter import KMSentSplitter
+from malti.tokeniser import KMTokeniser
+from malti.pipeline import Pipeline
+
+
+def process_materialised(
+    path: str,
+) -> int:
+    '''
+    Process a file by reading it into memory and running each component over the whole output
+    of the previous one.
+
+    :param path: The path to the file.
+    :return: The number of tokens.
+    '''
+    line_joiner = RBLineJoiner()
+    splitter = KMSentSplitter()
+    tokeniser = KMTokeniser()
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    paragraphs = list(line_joiner.iter_join_lines(lines, fix_hyphenated_words=True))
+    sentence_lists = [splitter.split(paragraph) for paragraph in paragraphs]
+    token_lists = [tokeniser.tokenise_batch(sentences) for sentences in sentence_lists]
+    return sum(len(tokens) for sentences in token_lists for tokens in sentences)
+
+
+def process_streamed(
+    path: str,
+    chunk_size: int,
+    batch_size: int,
+) -> int:
+    '''
+    Process a file by streaming it through a pipeline.
+
+    :param path: The path to the file.
+    :param chunk_size: The number of paragraphs to process at a time.
+    :param batch_size: The maximum number of sentences to pass to each call of
+        ``tokenise_batch``.
+    :return: The number of tokens.
+    '''
+    pipeline = Pipeline(
+        line_joiner=RBLineJoiner(), sent_splitter=KMSentSplitter(), tokeniser=KMTokeniser(),
+        fix_hyphenated_words=True, chunk_size=chunk_size, batch_size=batch_size,
+    )
+    with open(path, 'r', encoding='utf-8') as f:
+        return sum(
+            len(tokens) for result in pipeline.run(f) for tokens in result['tokenise']
+        )
+
+
+def measure(
+    func: Callable[[], Any],
+) -> tuple[float, int]:
+    '''
+    Measure the time taken by a function and the peak memory it allocates.
+
+    :param func: The function to run (without arguments).
+    :return: A pair consisting of the time in seconds and the peak memory in bytes.
+    '''
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (duration, peak)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the time and peak memory of materialised and streamed processing.'
+    )
+    parser.add_argument(
+        '--num_paragraphs', type=int, nargs='+', default=[1000, 5000, 10000],
+        help='The number of paragraphs (of 50 to 300 words each) in the file.',
+    )
+    parser.add_argument(
+        '--chunk_sizes', type=int, nargs='+', default=[16, 256],
+        help='The number of paragraphs that the pipeline processes at a time.',
+    )
+    parser.add_argument(
+        '--batch_size', type=int, default=1024,
+        help='The maximum number of sentences that the pipeline tokenises at a time.',
+    )
+    args = parser.parse_args()
+
+    print('file (MB)', 'method', 'time (s)', 'MB/s', 'peak (MB)', sep='\t')
+    with tempfile.TemporaryDirectory() as tmp_path:
+        path = os.path.join(tmp_path, 'corpus.txt')
+        for num_paragraphs in args.num_paragraphs:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(make_document(num_paragraphs))
+            num_megabytes = os.path.getsize(path)/1024**2
+
+            methods: list[tuple[str, Callable[[], Any]]] = [
+                ('materialised', functools.partial(process_materialised, path)),
+            ]
+            for chunk_size in args.chunk_sizes:
+                methods.append((
+                    f'pipeline (chunk {chunk_size})',
+                    functools.partial(process_streamed, path, chunk_size, args.batch_size),
+                ))
+            assert len({func() for (_, func) in methods}) == 1
+            for (method, func) in methods:
+                (duration, peak) = measure(func)
+                print(
+                    f'{num_megabytes:.2f}', method, f'{duration:.3f}',
+                    f'{num_megabytes/duration:.2f}', f'{peak/1024**2:.2f}', sep='\t',
+                )
+
+
+if __name__ == '__main__':
+    main()
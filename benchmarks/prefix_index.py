@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Measure the time taken to create sentence splitters, which share the non-breaking prefix index
+in ``malti.data.Data``, against reading the prefix file every time (as was done before the index
+was shared), the time taken to load the index from its text and binary files, and the time
+taken by ``KMSentSplitter.split`` right after a prefix is added to its index.
+'''
+
+import argparse
+import functools
+import os
+import tempfile
+import timeit
+from typing import Any, Callable
+import sentence_splitter
+from malti.data import Data, NonBreakingPrefixIndex
+from malti.sent_splitter import KMSentSplitter, RBSentSplitter
+
+
+def create_library_splitter(
+) -> sentence_splitter.SentenceSplitter:
+    '''
+    Create a ``sentence_splitter`` package sentence splitter that reads the prefix file, as
+    ``KMSentSplitter`` did before the index was shared.
+
+    :return: The sentence splitter.
+    '''
+    return sentence_splitter.SentenceSplitter(
+        language='it', non_breaking_prefix_file=Data.NON_BREAKING_PREFIX_FILE,
+    )
+
+
+def create_rb_splitter_from_file(
+) -> RBSentSplitter:
+    '''
+    Create an ``RBSentSplitter`` that reads the prefix file.
+
+    :return: The sentence splitter.
+    '''
+    return RBSentSplitter(Data.NON_BREAKING_PREFIX_FILE)
+
+
+_ADDITION_INDEX = NonBreakingPrefixIndex.from_file(Data.NON_BREAKING_PREFIX_FILE)
+'''The index that ``split_after_addition`` adds prefixes to.'''
+
+_ADDITION_SPLITTER = KMSentSplitter(_ADDITION_INDEX)
+'''The sentence splitter used by ``split_after_addition``.'''
+
+
+def split_after_addition(
+) -> list[str]:
+    '''
+    Add a prefix to an index and then split a short text with a ``KMSentSplitter`` that uses the
+    index, which rebuilds the splitter of the ``sentence_splitter`` package.
+
+    :return: The sentences.
+    '''
+    _ADDITION_INDEX.add(f'Abbr{_ADDITION_INDEX.version}')
+    return _ADDITION_SPLITTER.split('Il-kelb. Il-qattus.')
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Measure the time taken to create sentence splitters and load prefixes.'
+    )
+    parser.add_argument(
+        '--number', type=int, default=1000,
+        help='The number of times to run each function.',
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path:
+        binary_file = os.path.join(path, 'prefixes.bin')
+        NonBreakingPrefixIndex.from_file(Data.NON_BREAKING_PREFIX_FILE).save(binary_file)
+
+        functions: list[tuple[str, Callable[[], Any]]] = [
+            ('KMSentSplitter (reading the file)', create_library_splitter),
+            ('KMSentSplitter (shared index)', KMSentSplitter),
+            ('RBSentSplitter (reading the file)', create_rb_splitter_from_file),
+            ('RBSentSplitter (shared index)', RBSentSplitter),
+            (
+                'NonBreakingPrefixIndex.from_file',
+                functools.partial(NonBreakingPrefixIndex.from_file, Data.NON_BREAKING_PREFIX_FILE),
+            ),
+            (
+                'NonBreakingPrefixIndex.load',
+                functools.partial(NonBreakingPrefixIndex.load, binary_file),
+            ),
+            ('KMSentSplitter.split after an addition', split_after_addition),
+        ]
+
+        print('operation', 'us/call', sep='\t')
+        for (name, func) in functions:
+            duration = min(timeit.repeat(func, repeat=5, number=args.number))/args.number
+            print(name, f'{duration*1000000:.1f}', sep='\t')
+
+if __name__ == '__main__':
+    main()
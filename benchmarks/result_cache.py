@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the throughput of the KM tokeniser and sentence splitter with and without a result cache
+on a corpus with different proportions of duplicate texts.
+'''
+
+import argparse
+import random
+from typing import Any, Callable
+from common import make_texts, best_time
+from malti.tokeniser import KMTokeniser, CachedTokeniser
+from malti.sent_splitter import KMSentSplitter, CachedSentSplitter
+
+
+def compare(
+    uncached: Callable[[str], Any],
+    make_cached: Callable[[], Callable[[str], Any]],
+    texts: list[str],
+) -> tuple[float, float]:
+    '''
+    Measure the time taken to process a list of texts with and without a cache.
+    A new cache is made for every repetition so that it starts empty.
+
+    :param uncached: The function that processes a text without a cache.
+    :param make_cached: A function that makes a new function that processes a text with a cache.
+    :param texts: The texts to process.
+    :return: A pair consisting of the uncached time and the cached time in seconds.
+    '''
+    uncached_time = best_time(lambda: [uncached(text) for text in texts], repeat=3)
+
+    def run_cached(
+    ) -> None:
+        '''
+        Process the texts with a new cache.
+        '''
+        cached = make_cached()
+        for text in texts:
+            cached(text)
+    cached_time = best_time(run_cached, repeat=3)
+
+    return (uncached_time, cached_time)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the throughput of the KM components with and without a cache.'
+    )
+    parser.add_argument(
+        '--num_texts', type=int, default=10000,
+        help='The number of texts (of 5 to 30 words each) to process.',
+    )
+    parser.add_argument(
+        '--duplicate_rates', type=float, nargs='+', default=[0.0, 0.25, 0.5, 0.9],
+        help='The proportions of texts that are duplicates of earlier texts.',
+    )
+    args = parser.parse_args()
+
+    tokeniser = KMTokeniser()
+    splitter = KMSentSplitter()
+    unique_texts = make_texts(args.num_texts, 5, 30)
+    rng = random.Random(0)
+
+    print('duplicates', 'component', 'uncached (texts/s)', 'cached (texts/s)', 'speedup', sep='\t')
+    for duplicate_rate in args.duplicate_rates:
+        num_unique = max(1, round(args.num_texts*(1 - duplicate_rate)))
+        texts = unique_texts[:num_unique] + rng.choices(
+            unique_texts[:num_unique], k=args.num_texts - num_unique
+        )
+        rng.shuffle(texts)
+
+        for (name, uncached, make_cached) in [
+            ('tokeniser', tokeniser.tokenise, lambda: CachedTokeniser(tokeniser).tokenise),
+            ('sent_splitter', splitter.split, lambda: CachedSentSplitter(splitter).split),
+        ]:
+            (uncached_time, cached_time) = compare(uncached, make_cached, texts)
+            print(
+                f'{duplicate_rate:.0%}', name,
+                f'{len(texts)/uncached_time:.0f}', f'{len(texts)/cached_time:.0f}',
+                f'{uncached_time/cached_time:.2f}x', sep='\t',
+            )
+
+
+if __name__ == '__main__':
+    main()
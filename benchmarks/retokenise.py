@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the time taken by the KM tokeniser to update the token indices of a document after a
+single character edit (such as a key stroke in an editor) with ``retokenise_indices`` against
+tokenising the whole document again with ``tokenise_indices``.
+'''
+
+import argparse
+import functools
+import random
+from common import make_texts, best_time
+from malti.tokeniser import KMTokeniser
+
+
+def tokenise_all(
+    tokeniser: KMTokeniser,
+    edited_texts: list[str],
+) -> list[list[tuple[int, int]]]:
+    '''
+    Tokenise each edited text in full.
+
+    :param tokeniser: The tokeniser to use.
+    :param edited_texts: The edited texts.
+    :return: The token indices of each edited text.
+    '''
+    return [tokeniser.tokenise_indices(edited_text) for edited_text in edited_texts]
+
+
+def retokenise_all(
+    tokeniser: KMTokeniser,
+    text: str,
+    indices: list[tuple[int, int]],
+    edits: list[tuple[int, int, str]],
+) -> list[list[tuple[int, int]]]:
+    '''
+    Update the token indices of a text after each edit (separately) incrementally.
+
+    :param tokeniser: The tokeniser to use.
+    :param text: The text before the edits.
+    :param indices: The token indices of the text before the edits.
+    :param edits: The edits, each of which is a triple consisting of the start and end of the
+        replaced part of the text and its replacement.
+    :return: The token indices of the text after each edit.
+    '''
+    return [
+        tokeniser.retokenise_indices(text, indices, start, end, replacement)
+        for (start, end, replacement) in edits
+    ]
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare incremental and full tokenisation after an edit.'
+    )
+    parser.add_argument(
+        '--num_texts', type=int, nargs='+', default=[10, 100, 1000, 10000],
+        help='The number of texts (of 5 to 30 words each) in the document.',
+    )
+    parser.add_argument(
+        '--num_edits', type=int, default=100,
+        help='The number of random single character edits to make.',
+    )
+    args = parser.parse_args()
+
+    tokeniser = KMTokeniser()
+    rng = random.Random(0)
+
+    print('characters', 'full (ms/edit)', 'incremental (ms/edit)', 'speedup', sep='\t')
+    for num_texts in args.num_texts:
+        text = '\n'.join(make_texts(num_texts, 5, 30))
+        indices = tokeniser.tokenise_indices(text)
+        edits = [
+            (position, position, rng.choice('abċ. '))
+            for position in (rng.randint(0, len(text)) for _ in range(args.num_edits))
+        ]
+        edited_texts = [
+            text[:start] + replacement + text[end:] for (start, end, replacement) in edits
+        ]
+
+        full_time = best_time(
+            functools.partial(tokenise_all, tokeniser, edited_texts), repeat=3,
+        )
+        incremental_time = best_time(
+            functools.partial(retokenise_all, tokeniser, text, indices, edits), repeat=3,
+        )
+        print(
+            len(text),
+            f'{full_time/args.num_edits*1000:.4f}',
+            f'{incremental_time/args.num_edits*1000:.4f}',
+            f'{full_time/incremental_time:.1f}x',
+            sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the throughput of the ``KMSentSplitter`` (which uses the ``sentence_splitter`` package)
+against the single scan ``RBSentSplitter``.
+'''
+
+import argparse
+from functools import partial
+from common import load_test_set, make_texts, best_time
+from malti.sent_splitter import SentSplitter, KMSentSplitter, RBSentSplitter
+
+
+def split_all(
+    splitter: SentSplitter,
+    texts: list[str],
+) -> list[list[str]]:
+    '''
+    Split a list of texts into sentences.
+
+    :param splitter: The sentence splitter to use.
+    :param texts: The texts to split.
+    :return: The list of sentences of each text.
+    '''
+    return [splitter.split(text) for text in texts]
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the throughput of the sentence splitters.'
+    )
+    parser.add_argument(
+        '--repetitions', type=int, default=100,
+        help='The number of times to repeat the test set texts in the natural texts.',
+    )
+    parser.add_argument(
+        '--num_texts', type=int, default=5000,
+        help='The number of random sentences in the synthetic texts.',
+    )
+    args = parser.parse_args()
+
+    natural_texts = [
+        test_item['text']
+        for test_item in load_test_set('sent_splitter/km_sent_splitter')
+    ]*args.repetitions
+    sentences = make_texts(args.num_texts, 5, 30)
+    synthetic_texts = [
+        ' '.join(sentence[0].upper() + sentence[1:] + '.' for sentence in sentences[i:i + 10])
+        for i in range(0, len(sentences), 10)
+    ]
+    splitters = {
+        'km': KMSentSplitter(),
+        'rb': RBSentSplitter(),
+    }
+
+    print('texts', 'splitter', 'MB/s', 'sentences/s', 'speedup', sep='\t')
+    for (name, texts) in [('natural', natural_texts), ('synthetic', synthetic_texts)]:
+        num_megabytes = sum(len(text.encode('utf-8')) for text in texts)/1024**2
+        expected = split_all(splitters['km'], texts)
+        num_sentences = sum(len(text_sentences) for text_sentences in expected)
+        baseline = None
+        for (splitter_name, splitter) in splitters.items():
+            assert split_all(splitter, texts) == expected
+            duration = best_time(partial(split_all, splitter, texts), repeat=3)
+            if baseline is None:
+                baseline = duration
+            print(
+                name, splitter_name,
+                f'{num_megabytes/duration:.2f}', f'{num_sentences/duration:.0f}',
+                f'{baseline/duration:.1f}x', sep='\t',
+            )
+
+
+if __name__ == '__main__':
+    main()
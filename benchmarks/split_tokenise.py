@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare sentence splitting a text and then tokenising each sentence against splitting and
+tokenising together with ``malti.corpus.split_tokenise_indices``.
+'''
+
+import argparse
+import functools
+import tracemalloc
+from typing import Any, Callable
+from common import make_texts, best_time
+from malti.sent_splitter import SentSplitter, KMSentSplitter, RBSentSplitter
+from malti.tokeniser import Tokeniser, KMTokeniser
+from malti.corpus import split_tokenise_indices
+
+
+def split_then_tokenise(
+    text: str,
+    splitter: SentSplitter,
+    tokeniser: Tokeniser,
+) -> list[list[tuple[int, int]]]:
+    '''
+    Split a text into sentences and then tokenise each sentence.
+
+    :param text: The text.
+    :param splitter: The sentence splitter to use.
+    :param tokeniser: The tokeniser to use.
+    :return: The token indices of each sentence (into the sentence).
+    '''
+    return tokeniser.tokenise_indices_batch(splitter.split(text))
+
+
+def result_size(
+    func: Callable[[], Any],
+) -> int:
+    '''
+    Measure the memory taken by the result of a function.
+
+    :param func: The function to run (without arguments).
+    :return: The size of the result in bytes.
+    '''
+    tracemalloc.start()
+    result = func()
+    (size, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def run_all(
+    func: Callable[[str, SentSplitter, Tokeniser], Any],
+    texts: list[str],
+    splitter: SentSplitter,
+    tokeniser: Tokeniser,
+) -> list[Any]:
+    '''
+    Run a split and tokenise function on every text.
+
+    :param func: The function.
+    :param texts: The texts.
+    :param splitter: The sentence splitter to use.
+    :param tokeniser: The tokeniser to use.
+    :return: The list of results.
+    '''
+    return [func(text, splitter, tokeniser) for text in texts]
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare two stage and fused sentence splitting and tokenisation.'
+    )
+    parser.add_argument(
+        '--num_texts', type=int, default=500,
+        help='The number of paragraphs of 5 sentences (of 5 to 30 words each).',
+    )
+    args = parser.parse_args()
+
+    sentences = make_texts(5*args.num_texts, 5, 30)
+    texts = [
+        '. '.join(sentences[i:i + 5]) + '.'
+        for i in range(0, len(sentences), 5)
+    ]
+    num_megabytes = sum(len(text.encode('utf-8')) for text in texts)/1024**2
+    tokeniser = KMTokeniser()
+
+    methods: list[tuple[str, Callable[[str, SentSplitter, Tokeniser], Any]]] = [
+        ('split then tokenise', split_then_tokenise),
+        ('split_tokenise_indices', split_tokenise_indices),
+    ]
+
+    print('splitter', 'method', 'MB/s', 'result (MB)', sep='\t')
+    for splitter in [KMSentSplitter(), RBSentSplitter()]:
+        for (method, func) in methods:
+            run = functools.partial(run_all, func, texts, splitter, tokeniser)
+            duration = best_time(run, repeat=3)
+            print(
+                type(splitter).__name__, method, f'{num_megabytes/duration:.2f}',
+                f'{result_size(run)/1024**2:.2f}', sep='\t',
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Measure the throughput and peak memory of the main text processors on synthetic Maltese corpora
+(see ``synthetic_corpus.py``) of several sizes, optionally saving the results as JSON and
+comparing them against the results of a previous run (a baseline) to catch performance
+regressions.
+
+Typical use is to save a baseline on a machine before a change and then compare against it after
+the change on the same machine::
+
+    python suite.py --output baseline.json
+    python suite.py --baseline baseline.json --threshold 0.1
+
+The program exits with status 1 if any result is a regression, that is, if its throughput dropped
+or its peak memory rose by more than the threshold (as a fraction of the baseline).
+'''
+
+import argparse
+import functools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+from common import best_time
+from synthetic_corpus import make_corpus
+import malti
+from malti.line_joiner import RBLineJoiner
+from malti.sent_splitter import KMSentSplitter
+from malti.tokeniser import KMTokeniser
+
+
+TASKS = [
+    'KMTokeniser.tokenise',
+    'KMTokeniser.tokenise_indices',
+    'KMTokeniser.detokenise',
+    'KMSentSplitter.split',
+    'RBLineJoiner.join_lines',
+]
+'''The names of the tasks that are measured.'''
+
+
+def split_all(
+    splitter: KMSentSplitter,
+    paragraphs: list[str],
+) -> list[list[str]]:
+    '''
+    Split each paragraph into sentences.
+
+    :param splitter: The sentence splitter to use.
+    :param paragraphs: The paragraphs.
+    :return: The sentences of each paragraph.
+    '''
+    return [splitter.split(paragraph) for paragraph in paragraphs]
+
+
+def join_all(
+    line_joiner: RBLineJoiner,
+    lines: list[str],
+) -> list[str]:
+    '''
+    Join the lines of each paragraph, fixing hyphenated words.
+
+    :param line_joiner: The line joiner to use.
+    :param lines: The lines of all the paragraphs, with paragraphs separated by blank lines.
+    :return: The paragraphs.
+    '''
+    return list(line_joiner.iter_join_lines(lines, fix_hyphenated_words=True))
+
+
+def make_tasks(
+    corpus: str,
+) -> dict[str, tuple[str, int, Callable[[], Any]]]:
+    '''
+    Prepare the inputs of each task from a corpus.
+    The tokenisers and sentence splitter work on the paragraphs made by joining the lines of the
+    corpus and the detokeniser works on the tokens of each sentence.
+
+    :param corpus: The corpus.
+    :return: A dictionary mapping the name of each task to a triple consisting of the name of the
+        units processed (such as tokens), the number of units processed, and the function that
+        performs the task (without arguments).
+    '''
+    tokeniser = KMTokeniser()
+    splitter = KMSentSplitter()
+    line_joiner = RBLineJoiner()
+
+    lines = corpus.split('\n')
+    paragraphs = join_all(line_joiner, lines)
+    text = '\n'.join(paragraphs)
+    sentences = [sentence for paragraph in paragraphs for sentence in splitter.split(paragraph)]
+    token_lists = tokeniser.tokenise_batch(sentences)
+    num_tokens = sum(len(tokens) for tokens in token_lists)
+
+    return {
+        'KMTokeniser.tokenise': (
+            'tokens', num_tokens, functools.partial(tokeniser.tokenise, text),
+        ),
+        'KMTokeniser.tokenise_indices': (
+            'tokens', num_tokens, functools.partial(tokeniser.tokenise_indices, text),
+        ),
+        'KMTokeniser.detokenise': (
+            'tokens', num_tokens, functools.partial(tokeniser.detokenise_batch, token_lists),
+        ),
+        'KMSentSplitter.split': (
+            'sentences', len(sentences), functools.partial(split_all, splitter, paragraphs),
+        ),
+        'RBLineJoiner.join_lines': (
+            'lines', len(lines), functools.partial(join_all, line_joiner, lines),
+        ),
+    }
+
+
+def measure_peak_memory(
+    func: Callable[[], Any],
+) -> int:
+    '''
+    Measure the peak memory allocated by a function, including its result.
+
+    :param func: The function to run (without arguments).
+    :return: The peak memory in bytes.
+    '''
+    tracemalloc.start()
+    result = func()
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def run_suite(
+    tasks: list[str],
+    sizes: list[int],
+    seed: int,
+    repeat: int,
+) -> list[dict[str, Any]]:
+    '''
+    Measure each task on a corpus of each size.
+
+    :param tasks: The names of the tasks to measure.
+    :param sizes: The approximate number of characters in each corpus.
+    :param seed: The random seed of the corpora.
+    :param repeat: The number of times to repeat each time measurement (the best is kept).
+    :return: The list of results, each of which is a dictionary with the task, the size of the
+        corpus, the time taken, the throughput, and the peak memory.
+    '''
+    results = []
+    for size in sizes:
+        corpus = make_corpus(size, seed)
+        num_megabytes = len(corpus.encode('utf-8'))/1024**2
+        prepared_tasks = make_tasks(corpus)
+        for task in tasks:
+            (units, num_units, func) = prepared_tasks[task]
+            duration = best_time(func, repeat=repeat)
+            peak = measure_peak_memory(func)
+            results.append({
+                'task': task,
+                'characters': size,
+                'megabytes': num_megabytes,
+                'seconds': duration,
+                'megabytes_per_second': num_megabytes/duration,
+                'units': units,
+                'units_per_second': num_units/duration,
+                'peak_megabytes': peak/1024**2,
+            })
+    return results
+
+
+def compare_results(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    threshold: float,
+) -> list[tuple[dict[str, Any], Optional[float], Optional[float], str]]:
+    '''
+    Compare results against a baseline.
+
+    :param results: The results.
+    :param baseline: The results of the baseline run.
+    :param threshold: The fraction of the baseline by which the throughput must drop or the peak
+        memory must rise for a result to be a regression (or the throughput must rise for it to
+        be an improvement).
+    :return: A list of quadruples, one for each result, consisting of the result, the relative
+        change in throughput and in peak memory (or ``None`` if the result is not in the
+        baseline), and the status of the result, which is one of ``'regression'``,
+        ``'improvement'``, ``'ok'``, or ``'new'``.
+    '''
+    baseline_results = {(result['task'], result['characters']): result for result in baseline}
+    comparisons: list[tuple[dict[str, Any], Optional[float], Optional[float], str]] = []
+    for result in results:
+        baseline_result = baseline_results.get((result['task'], result['characters']))
+        if baseline_result is None:
+            comparisons.append((result, None, None, 'new'))
+            continue
+        speed_change = result['megabytes_per_second']/baseline_result['megabytes_per_second'] - 1
+        memory_change = result['peak_megabytes']/max(baseline_result['peak_megabytes'], 1e-9) - 1
+        if speed_change < -threshold or memory_change > threshold:
+            status = 'regression'
+        elif speed_change > threshold:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        comparisons.append((result, speed_change, memory_change, status))
+    return comparisons
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Measure the throughput and peak memory of the text processors.'
+    )
+    parser.add_argument(
+        '--tasks', nargs='+', choices=TASKS, default=TASKS,
+        help='The tasks to measure.',
+    )
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[100000, 1000000],
+        help='The approximate number of characters in each corpus.',
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help='The random seed of the corpora.',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='The number of times to repeat each time measurement (the best is kept).',
+    )
+    parser.add_argument(
+        '--output', default=None,
+        help='The path to the JSON file to save the results in.',
+    )
+    parser.add_argument(
+        '--baseline', default=None,
+        help='The path to the JSON file with the results of a previous run to compare against.',
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help=(
+            'The fraction of the baseline by which the throughput must drop or the peak memory'
+            ' must rise for a result to be a regression.'
+        ),
+    )
+    args = parser.parse_args()
+
+    results = run_suite(args.tasks, args.sizes, args.seed, args.repeat)
+
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'environment': {
+                        'python': platform.python_version(),
+                        'implementation': platform.python_implementation(),
+                        'platform': platform.platform(),
+                        'malti': malti.__version__,
+                        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    },
+                    'settings': {
+                        'seed': args.seed,
+                        'repeat': args.repeat,
+                    },
+                    'results': results,
+                },
+                f, indent=4,
+            )
+
+    if args.baseline is None:
+        print('task', 'characters', 'MB/s', 'units/s', 'peak (MB)', sep='\t')
+        for result in results:
+            print(
+                result['task'], result['characters'], f'{result["megabytes_per_second"]:.2f}',
+                f'{result["units_per_second"]:.0f} {result["units"]}',
+                f'{result["peak_megabytes"]:.2f}', sep='\t',
+            )
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    comparisons = compare_results(results, baseline, args.threshold)
+    print(
+        'task', 'characters', 'MB/s', 'speed change', 'peak (MB)', 'memory change', 'status',
+        sep='\t',
+    )
+    for (result, speed_change, memory_change, status) in comparisons:
+        print(
+            result['task'], result['characters'], f'{result["megabytes_per_second"]:.2f}',
+            f'{speed_change:+.1%}' if speed_change is not None else '-',
+            f'{result["peak_megabytes"]:.2f}',
+            f'{memory_change:+.1%}' if memory_change is not None else '-',
+            status, sep='\t',
+        )
+    if any(status == 'regression' for (_, _, _, status) in comparisons):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
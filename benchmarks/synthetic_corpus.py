@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Generate a reproducible synthetic Maltese corpus that exercises the hard cases of the text
+processors: words with articles, hyphenated words broken across lines, dates, URLs, abbreviations
+from the list of non-breaking prefixes, and paragraphs that are not broken into lines at all.
+The corpus consists of paragraphs separated by blank lines, as extracted from a PDF.
+'''
+
+import argparse
+import random
+from common import get_vocabulary
+from malti.data import Data
+
+
+ARTICLES = [
+    'il-', 'l-', 'iċ-', 'id-', 'in-', 'ir-', 'is-', 'it-', 'ix-', 'iż-', 'tal-', 'fil-', 'mill-',
+    'għall-', 'bil-', 'mal-', 'sal-', 'tat-', 'fit-', 'mix-', 'lill-',
+]
+'''The forms of the definite article (on their own or joined to a preposition).'''
+
+MONTHS = [
+    'Jannar', 'Frar', 'Marzu', 'April', 'Mejju', 'Ġunju', 'Lulju', 'Awwissu', 'Settembru',
+    'Ottubru', 'Novembru', 'Diċembru',
+]
+'''The names of the months.'''
+
+DOMAINS = ['gov.mt', 'um.edu.mt', 'timesofmalta.com', 'tvm.com.mt', 'example.org']
+'''The domain names to make URLs with.'''
+
+
+def read_non_breaking_prefixes(
+) -> tuple[list[str], list[str]]:
+    '''
+    Read the Maltese non-breaking prefixes from the file used by the sentence splitters.
+
+    :return: A pair consisting of the prefixes that never end a sentence and the prefixes that
+        only do not end a sentence when followed by a number.
+    '''
+    prefixes: list[str] = []
+    numeric_only_prefixes: list[str] = []
+    with open(Data.NON_BREAKING_PREFIX_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            prefix = line.split('#', 1)[0].strip()
+            if prefix == '':
+                continue
+            if '#NUMERIC_ONLY#' in line:
+                numeric_only_prefixes.append(prefix)
+            else:
+                prefixes.append(prefix)
+    return (prefixes, numeric_only_prefixes)
+
+
+class CorpusGenerator:
+    '''
+    A generator of reproducible synthetic Maltese text.
+    '''
+
+    def __init__(
+        self,
+        seed: int = 0,
+        line_width: int = 70,
+        long_line_probability: float = 0.1,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param seed: The random seed.
+        :param line_width: The approximate number of characters in a line.
+        :param long_line_probability: The probability that a paragraph is not broken into lines.
+        '''
+        self.rng = random.Random(seed)
+        self.words = [word for word in get_vocabulary() if word.isalpha()]
+        (self.prefixes, self.numeric_only_prefixes) = read_non_breaking_prefixes()
+        self.line_width = line_width
+        self.long_line_probability = long_line_probability
+
+    def make_date(
+        self,
+    ) -> str:
+        '''
+        Make a random date in one of the common formats.
+
+        :return: The date.
+        '''
+        rng = self.rng
+        (day, month, year) = (rng.randint(1, 28), rng.randint(1, 12), rng.randint(1950, 2030))
+        return rng.choice([
+            f'{day}/{month:02d}/{year}',
+            f'{year}-{month:02d}-{day:02d}',
+            f'{day} ta\' {MONTHS[month - 1]} {year}',
+            f'{day}.{month}.{year}',
+        ])
+
+    def make_url(
+        self,
+    ) -> str:
+        '''
+        Make a random URL.
+
+        :return: The URL.
+        '''
+        rng = self.rng
+        path = '/'.join(word.lower() for word in rng.choices(self.words, k=rng.randint(0, 3)))
+        return f'{rng.choice(["http", "https"])}://www.{rng.choice(DOMAINS)}/{path}'
+
+    def make_sentence(
+        self,
+    ) -> str:
+        '''
+        Make a random sentence.
+
+        :return: The sentence.
+        '''
+        rng = self.rng
+        items: list[str] = []
+        for _ in range(rng.randint(5, 30)):
+            roll = rng.random()
+            if roll < 0.02:
+                items.append(self.make_date())
+            elif roll < 0.03:
+                items.append(self.make_url())
+            elif roll < 0.05:
+                items.append(rng.choice(self.prefixes) + '.')
+                items.append(rng.choice(self.words).capitalize())
+            elif roll < 0.06:
+                items.append(rng.choice(self.numeric_only_prefixes or self.prefixes) + '.')
+                items.append(str(rng.randint(1, 500)))
+            elif roll < 0.25:
+                items.append(rng.choice(ARTICLES) + rng.choice(self.words).lower())
+            else:
+                items.append(rng.choice(self.words))
+            if rng.random() < 0.05:
+                items[-1] += ','
+        items[0] = items[0][0].upper() + items[0][1:]
+        return ' '.join(items) + rng.choice(['.', '.', '.', '.', '?', '!'])
+
+    def make_paragraph(
+        self,
+    ) -> str:
+        '''
+        Make a random paragraph, which is either a long line of 10 to 100 sentences or 1 to 8
+        sentences broken into lines (with some words hyphenated at the end of a line).
+
+        :return: The paragraph.
+        '''
+        rng = self.rng
+        if rng.random() < self.long_line_probability:
+            return ' '.join(self.make_sentence() for _ in range(rng.randint(10, 100)))
+        text = ' '.join(self.make_sentence() for _ in range(rng.randint(1, 8)))
+
+        lines = []
+        line = ''
+        for word in text.split(' '):
+            if len(line) + len(word) > self.line_width:
+                if len(word) > 4 and word.isalpha() and rng.random() < 0.3:
+                    cut = rng.randint(2, len(word) - 2)
+                    lines.append(line + word[:cut] + '-')
+                    line = word[cut:] + ' '
+                else:
+                    lines.append(line.rstrip())
+                    line = word + ' '
+            else:
+                line += word + ' '
+        lines.append(line.rstrip())
+        return '\n'.join(lines)
+
+    def make_corpus(
+        self,
+        num_characters: int,
+    ) -> str:
+        '''
+        Make a corpus of paragraphs separated by blank lines.
+
+        :param num_characters: The approximate number of characters in the corpus.
+        :return: The corpus.
+        '''
+        paragraphs: list[str] = []
+        size = 0
+        while size < num_characters:
+            paragraph = self.make_paragraph()
+            paragraphs.append(paragraph)
+            size += len(paragraph) + 2
+        return '\n\n'.join(paragraphs) + '\n'
+
+
+def make_corpus(
+    num_characters: int,
+    seed: int = 0,
+) -> str:
+    '''
+    Make a reproducible synthetic Maltese corpus with the default settings.
+
+    :param num_characters: The approximate number of characters in the corpus.
+    :param seed: The random seed.
+    :return: The corpus.
+    '''
+    return CorpusGenerator(seed).make_corpus(num_characters)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Generate a reproducible synthetic Maltese corpus.'
+    )
+    parser.add_argument(
+        '--num_characters', type=int, default=1000000,
+        help='The approximate number of characters in the corpus.',
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help='The random seed.',
+    )
+    parser.add_argument(
+        '--line_width', type=int, default=70,
+        help='The approximate number of characters in a line.',
+    )
+    parser.add_argument(
+        '--long_line_probability', type=float, default=0.1,
+        help='The probability that a paragraph is not broken into lines.',
+    )
+    parser.add_argument(
+        '--output', required=True,
+        help='The path to the file to write the corpus to.',
+    )
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(args.seed, args.line_width, args.long_line_probability)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(generator.make_corpus(args.num_characters))
+
+
+if __name__ == '__main__':
+    main()
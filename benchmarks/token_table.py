@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the memory taken by a sentence split and tokenised corpus as nested lists against a
+columnar token table, both in memory and memory mapped from a file.
+'''
+
+import argparse
+import functools
+import os
+import tempfile
+import timeit
+import tracemalloc
+from typing import Any, Callable
+from common import make_texts
+from malti.corpus import TokenTable
+from malti.sent_splitter import KMSentSplitter
+from malti.tokeniser import KMTokeniser
+
+
+def tokenise_nested(
+    splitter: KMSentSplitter,
+    tokeniser: KMTokeniser,
+    documents: list[str],
+) -> list[list[list[str]]]:
+    '''
+    Sentence split and tokenise documents into nested lists.
+
+    :param splitter: The sentence splitter to use.
+    :param tokeniser: The tokeniser to use.
+    :param documents: The documents.
+    :return: The list of documents, each of which is a list of sentences, each of which is a list
+        of tokens.
+    '''
+    return [
+        [tokeniser.tokenise(sentence) for sentence in splitter.split(document)]
+        for document in documents
+    ]
+
+
+def measure(
+    func: Callable[[], Any],
+) -> tuple[float, int, Any]:
+    '''
+    Measure the time taken by a function and the memory taken by its result.
+
+    :param func: The function to run (without arguments).
+    :return: A triple consisting of the time in seconds, the size of the result in bytes, and the
+        result.
+    '''
+    duration = timeit.timeit(func, number=1)
+
+    tracemalloc.start()
+    result = func()
+    (size, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (duration, size, result)
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the memory taken by nested lists and token tables.'
+    )
+    parser.add_argument(
+        '--num_documents', type=int, nargs='+', default=[100, 1000, 10000],
+        help='The number of documents (of 5 sentences each) in the corpus.',
+    )
+    args = parser.parse_args()
+
+    splitter = KMSentSplitter()
+    tokeniser = KMTokeniser()
+
+    print(
+        'tokens', 'text (MB)', 'nested (MB)', 'table (MB)', 'mmap (MB)', 'nested (s)',
+        'table (s)', 'mmap load (s)', sep='\t',
+    )
+    for num_documents in args.num_documents:
+        sentences = make_texts(5*num_documents, 5, 30)
+        documents = [
+            ' '.join(sentence + '.' for sentence in sentences[i:i + 5])
+            for i in range(0, len(sentences), 5)
+        ]
+        text_size = sum(len(document.encode('utf-8')) for document in documents)
+
+        (nested_time, nested_size, _) = measure(
+            functools.partial(tokenise_nested, splitter, tokeniser, documents)
+        )
+        (table_time, table_size, table) = measure(
+            functools.partial(TokenTable.build, documents, splitter, tokeniser)
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'table.bin')
+            table.save(path)
+            (load_time, mmap_size, loaded) = measure(functools.partial(TokenTable.load, path))
+            loaded.close()
+
+        print(
+            len(table), f'{text_size/1024**2:.2f}', f'{nested_size/1024**2:.2f}',
+            f'{table_size/1024**2:.2f}', f'{mmap_size/1024**2:.4f}',
+            f'{nested_time:.3f}', f'{table_time:.3f}', f'{load_time:.5f}',
+            sep='\t',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the tokeniser's batch methods against calling the single text methods in a loop.
+'''
+
+import argparse
+from common import make_texts, best_time
+from malti.tokeniser import KMTokeniser
+
+
+def compare(
+    tokeniser: KMTokeniser,
+    texts: list[str],
+) -> None:
+    '''
+    Time and print the loop and the batch versions of the tokenisation methods on some texts.
+
+    :param tokeniser: The tokeniser to use.
+    :param texts: The batch of texts to tokenise.
+    '''
+    assert tokeniser.tokenise_batch(texts) == [tokeniser.tokenise(text) for text in texts]
+    assert tokeniser.tokenise_indices_batch(texts) == [
+        tokeniser.tokenise_indices(text) for text in texts
+    ]
+
+    loop_time = best_time(lambda: [tokeniser.tokenise(text) for text in texts])
+    batch_time = best_time(lambda: tokeniser.tokenise_batch(texts))
+    print(
+        len(texts), 'tokenise', f'{loop_time:.5f}', f'{batch_time:.5f}',
+        f'{loop_time/batch_time:.2f}x', sep='\t',
+    )
+
+    loop_time = best_time(lambda: [tokeniser.tokenise_indices(text) for text in texts])
+    batch_time = best_time(lambda: tokeniser.tokenise_indices_batch(texts))
+    print(
+        len(texts), 'tokenise_indices', f'{loop_time:.5f}', f'{batch_time:.5f}',
+        f'{loop_time/batch_time:.2f}x', sep='\t',
+    )
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the tokeniser\'s batch methods against a loop over texts.'
+    )
+    parser.add_argument(
+        '--batch_sizes', type=int, nargs='+', default=[10, 100, 1000, 10000],
+        help='The number of texts in each batch.',
+    )
+    parser.add_argument(
+        '--min_words', type=int, default=1,
+        help='The minimum number of words in a text.',
+    )
+    parser.add_argument(
+        '--max_words', type=int, default=20,
+        help='The maximum number of words in a text.',
+    )
+    args = parser.parse_args()
+
+    tokeniser = KMTokeniser()
+
+    print('batch size', 'method', 'loop (s)', 'batch (s)', 'speedup', sep='\t')
+    for batch_size in args.batch_sizes:
+        compare(tokeniser, make_texts(batch_size, args.min_words, args.max_words))
+
+
+if __name__ == '__main__':
+    main()
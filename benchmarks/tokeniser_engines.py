@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Kurt Micallef & Marc Tanti
+#
+# This file is part of malti project.
+'''
+Compare the throughput of the regular expression ``KMTokeniser`` against the hand-written
+``KMScannerTokeniser``.
+'''
+
+import argparse
+import functools
+from common import load_test_set, make_texts, best_time
+from malti.tokeniser import KMTokeniser, KMScannerTokeniser
+
+
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Compare the throughput of the KM tokeniser engines.'
+    )
+    parser.add_argument(
+        '--repetitions', type=int, default=200,
+        help='The number of times to repeat the test set texts in the natural text.',
+    )
+    parser.add_argument(
+        '--num_texts', type=int, default=5000,
+        help='The number of random texts in the synthetic text.',
+    )
+    args = parser.parse_args()
+
+    texts = {
+        'natural': '\n'.join(
+            test_item['text']
+            for name in ['tokeniser/km_tokeniser', 'sent_splitter/km_sent_splitter']
+            for test_item in load_test_set(name)
+        )*args.repetitions,
+        'synthetic': '\n'.join(make_texts(args.num_texts, 5, 30)),
+    }
+    engines = {
+        'regex': KMTokeniser(),
+        'scanner': KMScannerTokeniser(),
+    }
+
+    print('text', 'method', 'engine', 'MB/s', 'tokens/s', sep='\t')
+    for (text_name, text) in texts.items():
+        num_megabytes = len(text.encode('utf-8'))/1024**2
+        num_tokens = len(engines['regex'].tokenise(text))
+        for method in ['tokenise', 'tokenise_indices', 'tokenise_indices_compact']:
+            for (engine_name, engine) in engines.items():
+                duration = best_time(functools.partial(getattr(engine, method), text))
+                print(
+                    text_name, method, engine_name,
+                    f'{num_megabytes/duration:.2f}', f'{num_tokens/duration:.0f}',
+                    sep='\t',
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,8 @@ echo #########################################
 echo mypy
 echo ..checking tools
 call python -m mypy tools\ || pause && exit /b
+echo ..checking benchmarks
+call python -m mypy benchmarks\ || pause && exit /b
 echo ..checking tests
 call python -m mypy tests\ || pause && exit /b
 echo ..checking malti
@@ -16,6 +18,8 @@ echo #########################################
 echo pylint
 echo ..checking tools
 call python -m pylint tools\ || pause && exit /b
+echo ..checking benchmarks
+call python -m pylint benchmarks\ || pause && exit /b
 echo ..checking tests
 call python -m pylint tests\ || pause && exit /b
 echo ..checking malti
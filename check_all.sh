@@ -7,6 +7,8 @@ echo "#########################################"
 echo "mypy"
 echo "..checking tools"
 python -m mypy tools/
+echo "..checking benchmarks"
+python -m mypy benchmarks/
 echo "..checking tests"
 python -m mypy tests/
 echo "..checking malti"
@@ -17,6 +19,8 @@ echo "#########################################"
 echo "pylint"
 echo "..checking tools"
 python -m pylint tools/
+echo "..checking benchmarks"
+python -m pylint benchmarks/
 echo "..checking tests"
 python -m pylint tests/
 echo "..checking malti"
@@ -0,0 +1,10 @@
+'''
+Run the ``malti`` command-line program with ``python -m malti``.
+'''
+
+import sys
+from malti.cli import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
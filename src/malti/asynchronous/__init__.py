@@ -0,0 +1,39 @@
+'''
+Sentence splitting and tokenising from ``asyncio`` code without blocking the event loop.
+'''
+
+from malti.asynchronous.async_processor import AsyncProcessor
+from malti.defaults import Defaults
+
+
+Defaults.register('async_processor', AsyncProcessor, AsyncProcessor.close)
+
+
+async def asplit(
+    text: str,
+) -> list[str]:
+    '''
+    Default asynchronous sentence splitter.
+    The default sentence splitter is run on a thread pool that is created once and reused on
+    every call (see ``malti.defaults.Defaults``).
+
+    :param text: The text to split.
+    :return: The list of sentences.
+    '''
+    processor: AsyncProcessor = Defaults.get('async_processor')
+    return await processor.asplit(text)
+
+
+async def atokenise(
+    text: str,
+) -> list[str]:
+    '''
+    Default asynchronous tokeniser.
+    The default tokeniser is run on a thread pool that is created once and reused on every call
+    (see ``malti.defaults.Defaults``).
+
+    :param text: The text to tokenise.
+    :return: The list of tokens.
+    '''
+    processor: AsyncProcessor = Defaults.get('async_processor')
+    return await processor.atokenise(text)
@@ -0,0 +1,394 @@
+'''
+Sentence splitting and tokenising from ``asyncio`` code without blocking the event loop.
+'''
+
+import asyncio
+import concurrent.futures
+import functools
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Optional, Union
+from malti.data import Data
+from malti.defaults import Defaults
+from malti.parallel.parallel import _init_worker, _worker_components
+from malti.sent_splitter import SentSplitter
+from malti.sent_splitter.sent_splitter import (
+    _LAST_LINE_START_REGEX, _LINE_START_REGEX, _LineStartCutter, _split_cut_piece,
+)
+from malti.tokeniser import Tokeniser
+
+
+__all__ = [
+    'AsyncProcessor',
+]
+
+
+def _split_piece(
+    split: Callable[[str], list[str]],
+    piece: str,
+    next_word: str,
+) -> list[str]:
+    '''
+    Split a piece of a text into sentences.
+
+    :param split: The ``split`` method of the sentence splitter.
+    :param piece: The piece.
+    :param next_word: The first word of the line after the piece (see ``_split_cut_piece``) or
+        an empty string if the piece is the end of the text.
+    :return: The list of sentences.
+    '''
+    if next_word == '':
+        return split(piece)
+    return _split_cut_piece(split, piece, next_word)
+
+
+def _tokenise_piece(
+    tokenise: Callable[[str], list[str]],
+    piece: str,
+    next_word: str, # pylint: disable=unused-argument
+) -> list[str]:
+    '''
+    Tokenise a piece of a text.
+
+    :param tokenise: The ``tokenise`` method of the tokeniser.
+    :param piece: The piece.
+    :param next_word: The first word of the line after the piece, which is not needed.
+    :return: The list of tokens.
+    '''
+    return tokenise(piece)
+
+
+def _split_in_worker(
+    piece: str,
+    next_word: str,
+) -> list[str]:
+    '''
+    Split a piece of a text into sentences in a worker process using the sentence splitter
+    created by ``malti.parallel.parallel._init_worker``.
+
+    :param piece: The piece.
+    :param next_word: The first word of the line after the piece (see ``_split_piece``).
+    :return: The list of sentences.
+    '''
+    splitter: SentSplitter = _worker_components['sent_splitter']
+    return _split_piece(splitter.split, piece, next_word)
+
+
+def _tokenise_in_worker(
+    piece: str,
+    next_word: str,
+) -> list[str]:
+    '''
+    Tokenise a piece of a text in a worker process using the tokeniser created by
+    ``malti.parallel.parallel._init_worker``.
+
+    :param piece: The piece.
+    :param next_word: The first word of the line after the piece, which is not needed.
+    :return: The list of tokens.
+    '''
+    tokeniser: Tokeniser = _worker_components['tokeniser']
+    return _tokenise_piece(tokeniser.tokenise, piece, next_word)
+
+
+def _iter_text_pieces(
+    text: str,
+    piece_size: int,
+) -> Iterator[tuple[str, str]]:
+    '''
+    Cut a text into pieces right after new lines matched by
+    ``malti.sent_splitter.sent_splitter._LINE_START_REGEX``, each of which is after the last
+    such new line within the first ``piece_size`` characters of the rest of the text or, if
+    there is none, after the first such new line.
+
+    :param text: The text.
+    :param piece_size: The preferred maximum number of characters in a piece.
+    :return: An iterator of pairs with each piece and the first word of the line after it (or
+        an empty string for the last piece).
+    '''
+    start = 0
+    while len(text) - start > piece_size:
+        match = _LAST_LINE_START_REGEX.match(text, start, start + piece_size)
+        if match is None:
+            match = _LINE_START_REGEX.search(text, start)
+            if match is None:
+                break
+        cut = match.start(1)
+        yield (text[start:cut], match.group(1))
+        start = cut
+    if start < len(text):
+        yield (text[start:], '')
+
+
+def _next_chunk(
+    iterator: Iterator[str],
+) -> Optional[str]:
+    '''
+    Read the next chunk of a stream.
+
+    :param iterator: The iterator of the chunks of the stream.
+    :return: The chunk or ``None`` if there are no more chunks.
+    '''
+    return next(iterator, None)
+
+
+async def _aiter_stream_pieces(
+    stream: Union[Iterable[str], AsyncIterable[str]],
+    piece_size: int,
+) -> AsyncIterator[tuple[str, str]]:
+    '''
+    Cut a text that is read from a stream of text chunks into pieces, each of which is cut
+    right after the last new line matched by
+    ``malti.sent_splitter.sent_splitter._LINE_START_REGEX`` once more than ``piece_size``
+    characters were read.
+
+    :param stream: An iterable or asynchronous iterable of text chunks.
+        The chunks of an iterable that is not asynchronous are read in the default executor of
+        the event loop, since reading them may block (such as when reading a file).
+    :param piece_size: The preferred maximum number of characters in a piece.
+    :return: An asynchronous iterator of pairs with each piece and the first word of the line
+        after it (or an empty string for the last piece).
+    '''
+    async def aiter_chunks(
+    ) -> AsyncIterator[str]:
+        '''
+        Iterate over the chunks of the stream, whether it is asynchronous or not.
+
+        :return: An asynchronous iterator of the chunks.
+        '''
+        if isinstance(stream, AsyncIterable):
+            async for chunk in stream:
+                yield chunk
+        else:
+            loop = asyncio.get_running_loop()
+            iterator = iter(stream)
+            while True:
+                next_chunk = await loop.run_in_executor(None, _next_chunk, iterator)
+                if next_chunk is None:
+                    break
+                yield next_chunk
+
+    cutter = _LineStartCutter(piece_size)
+    async for chunk in aiter_chunks():
+        cut = cutter.add(chunk)
+        if cut is not None:
+            yield cut
+    text = cutter.finish()
+    if text != '':
+        yield (text, '')
+
+
+class AsyncProcessor:
+    '''
+    Sentence split and tokenise texts from ``asyncio`` code by running the work on a pool of
+    threads or processes, so that the event loop is not blocked.
+
+    Texts longer than ``piece_size`` characters are cut into pieces right after new lines that
+    are followed by a word (possibly indented with spaces), which is where the sentence
+    splitters of this package can be resumed (see ``SentSplitter.iter_split``) and where the
+    tokenisers never join text across, and each piece is sent to the pool separately, one after
+    the other.
+    This keeps the latency of short texts low even while long texts are being processed, since
+    the pieces of a long text wait in the queue of the pool together with the other texts.
+    It also means that cancelling a call stops it after the piece that is being processed, if
+    any, rather than processing the whole text.
+    Texts without such new lines are processed in one piece.
+
+    A thread pool (the default) keeps the event loop responsive but, due to the global
+    interpreter lock, runs the work on one CPU at a time.
+    A process pool runs the work on several CPUs at the cost of sending the texts and results to
+    the worker processes.
+    '''
+
+    DEFAULT_PIECE_SIZE = 16384
+    '''The default preferred maximum number of characters sent to the pool at a time.'''
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        use_processes: bool = False,
+        sent_splitter_factory: Optional[Callable[[], SentSplitter]] = None,
+        tokeniser_factory: Optional[Callable[[], Tokeniser]] = None,
+        piece_size: int = DEFAULT_PIECE_SIZE,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param workers: The number of threads or processes in the pool or ``None`` to use the
+            default of ``concurrent.futures``.
+        :param use_processes: Whether to use a pool of processes rather than threads.
+        :param sent_splitter_factory: A function without arguments (or class) that creates the
+            sentence splitter or ``None`` to use the default sentence splitter (see
+            ``malti.defaults.Defaults``).
+            With a pool of processes, this is called in each process and must be picklable, such
+            as a function or class defined at the top level of a module.
+        :param tokeniser_factory: A function without arguments (or class) that creates the
+            tokeniser or ``None`` to use the default tokeniser, in the same way as
+            ``sent_splitter_factory``.
+        :param piece_size: The preferred maximum number of characters sent to the pool at a
+            time.
+        '''
+        if workers is not None and workers < 1:
+            raise ValueError('workers must be a positive integer.')
+        if piece_size < 1:
+            raise ValueError('piece_size must be a positive integer.')
+        self.piece_size = piece_size
+
+        self._executor: concurrent.futures.Executor
+        self._split: Callable[[str, str], list[str]]
+        self._tokenise: Callable[[str, str], list[str]]
+        if use_processes:
+            Data.preload()
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                workers, initializer=_init_worker,
+                initargs=(True, True, sent_splitter_factory, tokeniser_factory),
+            )
+            self._split = _split_in_worker
+            self._tokenise = _tokenise_in_worker
+        else:
+            self._executor = concurrent.futures.ThreadPoolExecutor(workers)
+            splitter: SentSplitter = (
+                sent_splitter_factory()
+                if sent_splitter_factory is not None
+                else Defaults.get('sent_splitter')
+            )
+            tokeniser: Tokeniser = (
+                tokeniser_factory()
+                if tokeniser_factory is not None
+                else Defaults.get('tokeniser')
+            )
+            self._split = functools.partial(_split_piece, splitter.split)
+            self._tokenise = functools.partial(_tokenise_piece, tokeniser.tokenise)
+
+    async def asplit(
+        self,
+        text: str,
+    ) -> list[str]:
+        '''
+        Split a text into a list of sentences.
+
+        :param text: The text to split.
+        :return: The list of sentences.
+        '''
+        return await self._process(self._split, text)
+
+    async def atokenise(
+        self,
+        text: str,
+    ) -> list[str]:
+        '''
+        Tokenise a text into a list of tokens.
+
+        :param text: The text to tokenise.
+        :return: The list of tokens.
+        '''
+        return await self._process(self._tokenise, text)
+
+    async def aiter_split(
+        self,
+        stream: Union[str, Iterable[str], AsyncIterable[str]],
+    ) -> AsyncIterator[str]:
+        '''
+        Split a text or a text that is read from a stream, giving the sentences of each piece as
+        soon as it is processed.
+        The sentences are the same as those returned by ``asplit`` on the whole text.
+        Only the current piece of the text is kept in memory.
+
+        :param stream: A text or an iterable or asynchronous iterable of text chunks.
+            The chunks of an iterable that is not asynchronous are read in the default executor
+            of the event loop, so the iterable can block while reading them.
+        :return: An asynchronous iterator of sentences.
+        '''
+        async for sentence in self._aiter_process(self._split, stream):
+            yield sentence
+
+    async def aiter_tokenise(
+        self,
+        stream: Union[str, Iterable[str], AsyncIterable[str]],
+    ) -> AsyncIterator[str]:
+        '''
+        Tokenise a text or a text that is read from a stream, giving the tokens of each piece as
+        soon as it is processed.
+        The tokens are the same as those returned by ``atokenise`` on the whole text.
+        Only the current piece of the text is kept in memory.
+
+        :param stream: A text or an iterable or asynchronous iterable of text chunks.
+            The chunks of an iterable that is not asynchronous are read in the default executor
+            of the event loop, so the iterable can block while reading them.
+        :return: An asynchronous iterator of tokens.
+        '''
+        async for token in self._aiter_process(self._tokenise, stream):
+            yield token
+
+    def close(
+        self,
+    ) -> None:
+        '''
+        Shut down the pool, waiting for the work that was already sent to it to finish.
+        The processor cannot be used afterwards.
+        '''
+        self._executor.shutdown()
+
+    async def __aenter__(
+        self,
+    ) -> 'AsyncProcessor':
+        '''
+        Use the processor in an ``async with`` statement, which closes it at the end.
+
+        :return: The processor.
+        '''
+        return self
+
+    async def __aexit__(
+        self,
+        *exc_info: Any,
+    ) -> None:
+        '''
+        Close the processor at the end of an ``async with`` statement without blocking the
+        event loop.
+
+        :param exc_info: The exception raised in the statement, if any.
+        '''
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _process(
+        self,
+        func: Callable[[str, str], list[str]],
+        text: str,
+    ) -> list[str]:
+        '''
+        Process a text in pieces on the pool and join the results.
+
+        :param func: The function that processes a piece given the first word of the line after
+            it (see ``_split_piece``).
+        :param text: The text.
+        :return: The joined results of all the pieces.
+        '''
+        loop = asyncio.get_running_loop()
+        if len(text) <= self.piece_size:
+            return await loop.run_in_executor(self._executor, func, text, '')
+        result: list[str] = []
+        for (piece, next_word) in _iter_text_pieces(text, self.piece_size):
+            result.extend(await loop.run_in_executor(self._executor, func, piece, next_word))
+        return result
+
+    async def _aiter_process(
+        self,
+        func: Callable[[str, str], list[str]],
+        stream: Union[str, Iterable[str], AsyncIterable[str]],
+    ) -> AsyncIterator[str]:
+        '''
+        Process a text or a stream of text chunks in pieces on the pool, giving the results of
+        each piece as soon as it is processed.
+
+        :param func: The function that processes a piece given the first word of the line after
+            it (see ``_split_piece``).
+        :param stream: A text or an iterable or asynchronous iterable of text chunks.
+        :return: An asynchronous iterator of the results.
+        '''
+        loop = asyncio.get_running_loop()
+        if isinstance(stream, str):
+            for (piece, next_word) in _iter_text_pieces(stream, self.piece_size):
+                for item in await loop.run_in_executor(self._executor, func, piece, next_word):
+                    yield item
+        else:
+            async for (piece, next_word) in _aiter_stream_pieces(stream, self.piece_size):
+                for item in await loop.run_in_executor(self._executor, func, piece, next_word):
+                    yield item
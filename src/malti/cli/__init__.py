@@ -0,0 +1,5 @@
+'''
+The ``malti`` command-line program.
+'''
+
+from malti.cli.cli import main
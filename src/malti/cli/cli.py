@@ -0,0 +1,580 @@
+'''
+The ``malti`` command-line program for processing files in bulk.
+'''
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Generator, Iterable, Iterator, Optional, TextIO
+from malti.defaults import Defaults
+from malti.tokeniser import Tokeniser
+from malti.pipeline import Pipeline
+from malti.parallel import process_documents
+
+
+__all__ = [
+    'main',
+]
+
+
+BUFFER_SIZE = 1024**2
+'''The size in bytes of the buffers used to read and write files.'''
+
+
+class _Report:
+    '''
+    Counts of what was processed, used to report the throughput.
+    '''
+
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Constructor.
+        '''
+        self.num_bytes = 0
+        self.num_documents = 0
+        self.num_sentences = 0
+        self.num_tokens = 0
+        self.start_time = time.perf_counter()
+
+    def summarise(
+        self,
+    ) -> str:
+        '''
+        Summarise the counts and the throughput since the report was created.
+
+        :return: The summary.
+        '''
+        duration = max(time.perf_counter() - self.start_time, 1e-9)
+        num_megabytes = self.num_bytes/1024**2
+        return (
+            f'Read {num_megabytes:.2f} MB in {duration:.2f} s ({num_megabytes/duration:.2f} MB/s).'
+            f' Processed {self.num_documents} documents, {self.num_sentences} sentences, and'
+            f' {self.num_tokens} tokens ({self.num_tokens/duration:.0f} tokens/s).'
+        )
+
+
+def _iter_input_paths(
+    inputs: list[str],
+) -> Iterator[Optional[str]]:
+    '''
+    Iterate over the input files, with the files in directories listed recursively in order of
+    their path.
+
+    :param inputs: The paths to files and directories, where ``'-'`` stands for the standard
+        input.
+        If empty, only the standard input is read.
+    :return: An iterator of the paths to the files or ``None`` for the standard input.
+    '''
+    if not inputs:
+        yield None
+    for path in inputs:
+        if path == '-':
+            yield None
+        elif os.path.isdir(path):
+            for (directory, dir_names, file_names) in os.walk(path):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    yield os.path.join(directory, file_name)
+        else:
+            yield path
+
+
+def _open_file(
+    path: Optional[str],
+    mode: str,
+) -> TextIO:
+    '''
+    Open a UTF-8 text file with a large buffer.
+
+    :param path: The path to the file or ``None`` for the standard input or output.
+    :param mode: ``'r'`` to read or ``'w'`` to write.
+    :return: The file object.
+    '''
+    if path is None:
+        stream = sys.stdin if mode == 'r' else sys.stdout
+        if not hasattr(stream, 'buffer'):
+            return stream
+        stream.flush()
+        return io.TextIOWrapper(stream.buffer, encoding='utf-8')
+    if mode == 'r':
+        return open(path, 'r', encoding='utf-8', buffering=BUFFER_SIZE)
+    return open(path, 'w', encoding='utf-8', buffering=BUFFER_SIZE)
+
+
+def _close_file(
+    f: TextIO,
+) -> None:
+    '''
+    Close a file opened with ``_open_file``, leaving the standard input and output open.
+
+    :param f: The file object.
+    '''
+    if f in (sys.stdin, sys.stdout):
+        f.flush()
+    elif isinstance(f, io.TextIOWrapper) and f.buffer in (
+        getattr(sys.stdin, 'buffer', None), getattr(sys.stdout, 'buffer', None),
+    ):
+        f.flush()
+        f.detach()
+    else:
+        f.close()
+
+
+def _get_input_name(
+    path: Optional[str],
+) -> str:
+    '''
+    Get the name of an input file to show in error messages.
+
+    :param path: The path to the file or ``None`` for the standard input.
+    :return: The name.
+    '''
+    return '<stdin>' if path is None else path
+
+
+def _iter_file_lines(
+    path: Optional[str],
+    report: Optional[_Report],
+) -> Generator[str, None, None]:
+    '''
+    Iterate over the lines of an input file.
+
+    :param path: The path to the file or ``None`` for the standard input.
+    :param report: The report to count the bytes read in, if any.
+    :return: An iterator of lines.
+    :raises ValueError: If the file is not valid UTF-8, with the name of the file in the message.
+    '''
+    f = _open_file(path, 'r')
+    try:
+        if report is None:
+            # Not yield from, which would close the standard input when the generator is closed.
+            for line in f: # pylint: disable=use-yield-from
+                yield line
+        else:
+            for line in f:
+                report.num_bytes += len(line.encode('utf-8'))
+                yield line
+    except UnicodeDecodeError as e:
+        raise ValueError(f'{_get_input_name(path)}: {e}') from e
+    finally:
+        _close_file(f)
+
+
+def _iter_input_lines(
+    inputs: list[str],
+    report: Optional[_Report],
+) -> Iterator[str]:
+    '''
+    Iterate over the lines of all the input files, with a blank line after each file so that no
+    paragraph continues from one file to the next.
+
+    :param inputs: The paths to files and directories (see ``_iter_input_paths``).
+    :param report: The report to count the bytes read in, if any.
+    :return: An iterator of lines.
+    :raises ValueError: If a file is not valid UTF-8, with the name of the file in the message.
+    '''
+    for path in _iter_input_paths(inputs):
+        yield from _iter_file_lines(path, report)
+        yield '\n'
+
+
+def _iter_documents(
+    args: argparse.Namespace,
+    report: Optional[_Report],
+) -> Iterator[str]:
+    '''
+    Iterate over the documents in the input files, which are either the non-blank lines or, if
+    ``--join-lines`` is given, the paragraphs made by joining the lines.
+
+    :param args: The command-line arguments.
+    :param report: The report to count the bytes read in, if any.
+    :return: An iterator of documents.
+    '''
+    lines = _iter_input_lines(args.inputs, report)
+    if args.join_lines:
+        yield from Defaults.get('line_joiner').iter_join_lines(
+            lines, args.fix_hyphenated_words, args.paragraph_separator,
+        )
+    else:
+        for line in lines:
+            line = line.strip()
+            if line != '':
+                yield line
+
+
+def _count_tokens(
+    tokens: list[str],
+    report: Optional[_Report],
+) -> list[str]:
+    '''
+    Count the tokens in a token list in a report.
+
+    :param tokens: The token list.
+    :param report: The report to count the tokens in, if any.
+    :return: The same token list.
+    '''
+    if report is not None:
+        report.num_tokens += len(tokens)
+    return tokens
+
+
+def _iter_token_lists(
+    args: argparse.Namespace,
+    report: Optional[_Report],
+) -> Iterator[list[str]]:
+    '''
+    Iterate over the token lists in the input files of the ``detokenise`` command.
+
+    :param args: The command-line arguments.
+    :param report: The report to count the bytes read in, if any.
+    :return: An iterator of token lists.
+    :raises ValueError: If a file is not valid UTF-8 or, for the ``jsonl`` input format, has a
+        line that is not a JSON object with tokens, with the name of the file in the message.
+    '''
+    if args.input_format == 'tokens':
+        tokens: list[str] = []
+        for line in _iter_input_lines(args.inputs, report):
+            token = line.rstrip('\r\n')
+            if token != '':
+                tokens.append(token)
+            elif tokens:
+                yield _count_tokens(tokens, report)
+                tokens = []
+    elif args.input_format == 'sentences':
+        for line in _iter_input_lines(args.inputs, report):
+            tokens = line.split()
+            if tokens:
+                yield _count_tokens(tokens, report)
+    else:
+        for path in _iter_input_paths(args.inputs):
+            # The file is closed as soon as a line fails to parse, not when the generator is
+            # garbage collected, by which time the standard input may already be closed.
+            with contextlib.closing(_iter_file_lines(path, report)) as file_lines:
+                for (line_number, line) in enumerate(file_lines, 1):
+                    if line.strip() == '':
+                        continue
+                    try:
+                        token_lists = json.loads(line)['tokens']
+                    except json.JSONDecodeError as e:
+                        raise ValueError(
+                            f'{_get_input_name(path)}: line {line_number} is not valid JSON ({e})'
+                        ) from e
+                    except (KeyError, TypeError) as e:
+                        raise ValueError(
+                            f'{_get_input_name(path)}: line {line_number} is not a JSON object with'
+                            ' \'tokens\''
+                        ) from e
+                    if token_lists and isinstance(token_lists[0], str):
+                        token_lists = [token_lists]
+                    for tokens in token_lists:
+                        yield _count_tokens(tokens, report)
+
+
+def _format_join(
+    paragraph: str,
+    output_format: str,
+    report: Optional[_Report],
+) -> str:
+    '''
+    Format the output of the ``join`` command for a paragraph.
+
+    :param paragraph: The joined paragraph.
+    :param output_format: The output format.
+    :param report: The report to count the output in, if any.
+    :return: The text to write.
+    '''
+    if report is not None:
+        report.num_documents += 1
+    if output_format == 'jsonl':
+        return json.dumps({'text': paragraph}, ensure_ascii=False) + '\n'
+    return paragraph + '\n'
+
+
+def _format_split(
+    sentences: list[str],
+    output_format: str,
+    report: Optional[_Report],
+) -> str:
+    '''
+    Format the output of the ``split`` command for a document.
+
+    :param sentences: The sentences of the document.
+    :param output_format: The output format.
+    :param report: The report to count the output in, if any.
+    :return: The text to write.
+    '''
+    if report is not None:
+        report.num_documents += 1
+        report.num_sentences += len(sentences)
+    if output_format == 'jsonl':
+        return json.dumps({'sentences': sentences}, ensure_ascii=False) + '\n'
+    return ''.join(sentence + '\n' for sentence in sentences) + '\n'
+
+
+def _format_tokenise(
+    sentences: list[list[str]],
+    output_format: str,
+    report: Optional[_Report],
+) -> str:
+    '''
+    Format the output of the ``tokenise`` command for a document.
+
+    :param sentences: The token lists of the sentences of the document (a single one if the
+        document was not split).
+    :param output_format: The output format.
+    :param report: The report to count the output in, if any.
+    :return: The text to write.
+    '''
+    if report is not None:
+        report.num_documents += 1
+        report.num_sentences += len(sentences)
+        report.num_tokens += sum(map(len, sentences))
+    if output_format == 'jsonl':
+        return json.dumps({'tokens': sentences}, ensure_ascii=False) + '\n'
+    if output_format == 'sentences':
+        return ''.join(' '.join(tokens) + '\n' for tokens in sentences) + '\n'
+    return ''.join(''.join(token + '\n' for token in tokens) + '\n' for tokens in sentences)
+
+
+def _format_detokenise(
+    text: str,
+    output_format: str,
+    report: Optional[_Report],
+) -> str:
+    '''
+    Format the output of the ``detokenise`` command for a token list.
+
+    :param text: The detokenised text.
+    :param output_format: The output format.
+    :param report: The report to count the output in, if any.
+    :return: The text to write.
+    '''
+    if report is not None:
+        report.num_sentences += 1
+    if output_format == 'jsonl':
+        return json.dumps({'text': text}, ensure_ascii=False) + '\n'
+    return text + '\n'
+
+
+def _iter_results(
+    args: argparse.Namespace,
+    report: Optional[_Report],
+) -> Iterator[Any]:
+    '''
+    Process the input files with the command given in the command-line arguments.
+
+    :param args: The command-line arguments.
+    :param report: The report to count the bytes read in, if any.
+    :return: An iterator of the results to format, one for each paragraph, document, or token
+        list.
+    '''
+    if args.command == 'join':
+        pipeline = Pipeline(
+            ['join_lines'], fix_hyphenated_words=args.fix_hyphenated_words,
+            paragraph_separator=args.paragraph_separator, chunk_size=args.chunk_size,
+        )
+        for result in pipeline.run(_iter_input_lines(args.inputs, report)):
+            yield result['join_lines']
+
+    elif args.command == 'detokenise':
+        tokeniser: Tokeniser = Defaults.get('tokeniser')
+        token_lists = _iter_token_lists(args, report)
+        while True:
+            batch = [tokens for (_, tokens) in zip(range(args.chunk_size), token_lists)]
+            if not batch:
+                break
+            yield from tokeniser.detokenise_batch(batch)
+
+    else:
+        split = args.command == 'split' or not args.no_split
+        tokenise = args.command == 'tokenise'
+        documents = _iter_documents(args, report)
+        if args.workers > 1:
+            results: Iterable[Any] = process_documents(
+                documents, args.workers, args.chunk_size, split, tokenise,
+            )
+        else:
+            stages = [stage for (stage, used) in [('split', split), ('tokenise', tokenise)] if used]
+            pipeline = Pipeline(stages, chunk_size=args.chunk_size)
+            results = (result[stages[-1]] for result in pipeline.run(documents))
+        if tokenise and not split:
+            results = ([tokens] for tokens in results)
+        yield from results
+
+
+def _make_parser(
+) -> argparse.ArgumentParser:
+    '''
+    Make the parser of the command-line arguments.
+
+    :return: The parser.
+    '''
+    parser = argparse.ArgumentParser(
+        prog='malti',
+        description='Process Maltese text files in bulk.',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    common_parser = argparse.ArgumentParser(add_help=False)
+    common_parser.add_argument(
+        'inputs', nargs='*',
+        help=(
+            'The input files or directories (all the files in which are read) or - for the'
+            ' standard input, which is read if no inputs are given.'
+        ),
+    )
+    common_parser.add_argument(
+        '--output', '-o', default='-',
+        help='The output file or - for the standard output (the default).',
+    )
+    common_parser.add_argument(
+        '--chunk-size', type=int, default=64,
+        help='The number of documents to process and write at a time.',
+    )
+    common_parser.add_argument(
+        '--report', action='store_true',
+        help='Print the throughput to the standard error when done.',
+    )
+
+    join_parser = argparse.ArgumentParser(add_help=False)
+    join_parser.add_argument(
+        '--fix-hyphenated-words', action='store_true',
+        help='Join hyphenated word segments at the ends of lines back together.',
+    )
+    join_parser.add_argument(
+        '--paragraph-separator', default=None,
+        help='A line that separates paragraphs, in addition to blank lines and page breaks.',
+    )
+
+    document_parser = argparse.ArgumentParser(add_help=False, parents=[join_parser])
+    document_parser.add_argument(
+        '--join-lines', action='store_true',
+        help='Join the lines into paragraphs first instead of treating each line as a document.',
+    )
+    document_parser.add_argument(
+        '--workers', type=int, default=1,
+        help='The number of worker processes.',
+    )
+
+    subparser = subparsers.add_parser(
+        'join', parents=[common_parser, join_parser],
+        help='Join the lines of each paragraph.',
+    )
+    subparser.add_argument(
+        '--format', choices=['text', 'jsonl'], default='text',
+        help='Write one paragraph per line (text) or one JSON object per paragraph (jsonl).',
+    )
+
+    subparser = subparsers.add_parser(
+        'split', parents=[common_parser, document_parser],
+        help='Split each document into sentences.',
+    )
+    subparser.add_argument(
+        '--format', choices=['sentences', 'jsonl'], default='sentences',
+        help=(
+            'Write one sentence per line with a blank line after each document (sentences) or'
+            ' one JSON object per document (jsonl).'
+        ),
+    )
+
+    subparser = subparsers.add_parser(
+        'tokenise', parents=[common_parser, document_parser],
+        help='Split each document into sentences and tokenise them.',
+    )
+    subparser.add_argument(
+        '--format', choices=['tokens', 'sentences', 'jsonl'], default='tokens',
+        help=(
+            'Write one token per line with a blank line after each sentence (tokens), one'
+            ' sentence per line with the tokens separated by spaces and a blank line after each'
+            ' document (sentences), or one JSON object per document (jsonl).'
+        ),
+    )
+    subparser.add_argument(
+        '--no-split', action='store_true',
+        help='Tokenise each document as a whole without splitting it into sentences.',
+    )
+
+    subparser = subparsers.add_parser(
+        'detokenise', parents=[common_parser],
+        help='Detokenise token lists back into texts.',
+    )
+    subparser.add_argument(
+        '--input-format', choices=['tokens', 'sentences', 'jsonl'], default='tokens',
+        help=(
+            'Read one token per line with a blank line after each token list (tokens), one'
+            ' token list per line with the tokens separated by spaces (sentences), or one JSON'
+            ' object per line with a "tokens" list of tokens or of token lists (jsonl), as'
+            ' written by the tokenise command.'
+        ),
+    )
+    subparser.add_argument(
+        '--format', choices=['text', 'jsonl'], default='text',
+        help='Write one text per line (text) or one JSON object per text (jsonl).',
+    )
+
+    return parser
+
+
+def main(
+    argv: Optional[list[str]] = None,
+) -> int:
+    '''
+    Run the ``malti`` command-line program.
+
+    :param argv: The command-line arguments (without the program name) or ``None`` to use
+        ``sys.argv``.
+    :return: The exit status.
+    '''
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be a positive integer.')
+    if getattr(args, 'workers', 1) < 1:
+        parser.error('--workers must be a positive integer.')
+
+    formatters: dict[str, Callable[[Any, str, Optional[_Report]], str]] = {
+        'join': _format_join,
+        'split': _format_split,
+        'tokenise': _format_tokenise,
+        'detokenise': _format_detokenise,
+    }
+    formatter = formatters[args.command]
+    report = _Report() if args.report else None
+
+    output: Optional[TextIO] = None
+    try:
+        output = _open_file(None if args.output == '-' else args.output, 'w')
+        results = _iter_results(args, report)
+        while True:
+            chunk = [
+                formatter(result, args.format, report)
+                for (_, result) in zip(range(args.chunk_size), results)
+            ]
+            if not chunk:
+                break
+            output.write(''.join(chunk))
+    except BrokenPipeError:
+        # Whatever reads the output (such as head) stopped reading, so stop quietly and send
+        # anything still buffered to the null device so that flushing it does not fail again.
+        if args.output == '-':
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            os.close(devnull)
+        return 1
+    except (OSError, ValueError) as e:
+        # Files that cannot be opened or read, such as those that are not valid UTF-8.
+        print(f'{parser.prog}: error: {e}', file=sys.stderr)
+        return 1
+    finally:
+        if output is not None:
+            _close_file(output)
+
+    if report is not None:
+        print(report.summarise(), file=sys.stderr)
+    return 0
@@ -0,0 +1,6 @@
+'''
+Corpus-level data structures for tokenised Maltese text.
+'''
+
+from malti.corpus.token_table import TokenTable
+from malti.corpus.split_tokenise import split_tokenise_indices
@@ -0,0 +1,40 @@
+'''
+Sentence splitting and tokenising a text together.
+'''
+
+from typing import Optional
+from malti.defaults import Defaults
+from malti.sent_splitter import SentSplitter
+from malti.tokeniser import Tokeniser, SentenceTokenIndices
+
+
+__all__ = [
+    'split_tokenise_indices',
+]
+
+
+def split_tokenise_indices(
+    text: str,
+    splitter: Optional[SentSplitter] = None,
+    tokeniser: Optional[Tokeniser] = None,
+) -> SentenceTokenIndices:
+    '''
+    Sentence split and tokenise a text, returning the indices of the tokens in the original text
+    grouped by sentence in compact arrays.
+    The tokens of each sentence are the same as those returned by tokenising each sentence
+    returned by the sentence splitter's ``split``, but the sentences are never copied into
+    strings of their own.
+
+    :param text: The text to split and tokenise.
+    :param splitter: The sentence splitter to use.
+        If ``None`` then the default sentence splitter is used (see ``malti.defaults.Defaults``).
+    :param tokeniser: The tokeniser to use.
+        If ``None`` then the default tokeniser is used (see ``malti.defaults.Defaults``).
+    :return: The ``SentenceTokenIndices`` sequence of the token indices of each sentence, which
+        also has the indices of the sentences as ``sentence_indices``.
+    '''
+    if splitter is None:
+        splitter = Defaults.get('sent_splitter')
+    if tokeniser is None:
+        tokeniser = Defaults.get('tokeniser')
+    return tokeniser.tokenise_sentences_indices(text, splitter.split_indices(text))
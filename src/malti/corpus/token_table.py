@@ -0,0 +1,382 @@
+'''
+A columnar table of the tokens in a corpus.
+'''
+
+import bisect
+import mmap
+import re
+import struct
+from array import array
+from itertools import repeat
+from operator import add
+from typing import Iterable, Iterator, Optional, Sequence, Union
+from malti.defaults import Defaults
+from malti.sent_splitter import SentSplitter
+from malti.tokeniser import Tokeniser
+
+
+__all__ = [
+    'TokenTable',
+]
+
+
+class TokenTable:
+    '''
+    A memory efficient table of all the tokens in a sentence split and tokenised corpus.
+
+    Instead of nested lists of documents, sentences, and token strings, the table consists of a
+    single UTF-8 encoded text buffer together with the following columns of 64-bit integers, with
+    one row for each token:
+
+    * ``token_starts``: The byte offset of the start of the token in the text buffer.
+    * ``token_ends``: The byte offset of the end of the token in the text buffer.
+    * ``sentence_ids``: The number of the sentence in the corpus that the token belongs to.
+    * ``doc_ids``: The number of the document in the corpus that the token belongs to.
+
+    A further column, ``doc_sentence_starts``, has one row for each document plus one more, such
+    that the sentences of document ``d`` are numbered from ``doc_sentence_starts[d]`` up to (but
+    excluding) ``doc_sentence_starts[d + 1]``, so that sentences without tokens are kept.
+
+    The text buffer consists of the sentences of all the documents in order, each followed by a
+    new line.
+    Sentence and document numbers start from zero and are in increasing order, so the tokens of a
+    sentence are found by binary search.
+    Token strings are only created when they are accessed.
+
+    Tables can be saved to a binary file and loaded back with memory mapping, in which case the
+    columns and text buffer are read-only memory views over the file that are only read into
+    memory by the operating system as they are accessed.
+    '''
+
+    TYPECODE = 'q'
+    '''The ``array`` type code of the columns (signed 64-bit integer).'''
+
+    FILE_MAGIC = b'MALTITT2'
+    '''The bytes that start a saved token table file.'''
+
+    _HEADER = struct.Struct('=8s5q')
+    '''The header of a saved token table file: the magic bytes, the number 1 (to check the byte
+    order), the number of tokens, sentences, and documents, and the size of the text buffer.'''
+
+    def __init__(
+        self,
+        text: Union[bytes, memoryview],
+        token_starts: Sequence[int],
+        token_ends: Sequence[int],
+        sentence_ids: Sequence[int],
+        doc_ids: Sequence[int],
+        doc_sentence_starts: Sequence[int],
+        num_sentences: int,
+        num_documents: int,
+    ) -> None:
+        '''
+        Constructor.
+        Use ``build`` or ``load`` instead of calling this directly.
+
+        :param text: The UTF-8 encoded text buffer.
+        :param token_starts: The byte offset of the start of each token.
+        :param token_ends: The byte offset of the end of each token.
+        :param sentence_ids: The sentence number of each token.
+        :param doc_ids: The document number of each token.
+        :param doc_sentence_starts: The number of the first sentence of each document, followed
+            by the number of sentences in the corpus.
+        :param num_sentences: The number of sentences in the corpus.
+        :param num_documents: The number of documents in the corpus.
+        '''
+        if not len(token_starts) == len(token_ends) == len(sentence_ids) == len(doc_ids):
+            raise ValueError('The columns must all have the same length.')
+        if len(doc_sentence_starts) != num_documents + 1:
+            raise ValueError('There must be one more document sentence start than documents.')
+        self.text = text
+        self.token_starts = token_starts
+        self.token_ends = token_ends
+        self.sentence_ids = sentence_ids
+        self.doc_ids = doc_ids
+        self.doc_sentence_starts = doc_sentence_starts
+        self.num_sentences = num_sentences
+        self.num_documents = num_documents
+        self._mmap: Optional[mmap.mmap] = None
+
+    _NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+    '''A regular expression that matches a character that takes more than one byte in UTF-8.'''
+
+    @staticmethod
+    def _to_byte_offsets(
+        text: str,
+        encoded: bytes,
+        offsets: array,
+        base: int,
+    ) -> array:
+        '''
+        Convert character offsets in a text to byte offsets in its UTF-8 encoding.
+
+        :param text: The text.
+        :param encoded: The UTF-8 encoding of the text.
+        :param offsets: The character offsets in increasing order.
+        :param base: A number to add to every byte offset.
+        :return: The byte offsets.
+        '''
+        if len(encoded) == len(text):
+            return array(TokenTable.TYPECODE, map(base.__add__, offsets))
+
+        # Add the number of extra bytes taken by the non-ASCII characters before each offset.
+        positions: list[int] = []
+        extra_bytes = [base]
+        for match in TokenTable._NON_ASCII_RE.finditer(text):
+            positions.append(match.start())
+            extra_bytes.append(extra_bytes[-1] + len(match.group().encode('utf-8')) - 1)
+        return array(TokenTable.TYPECODE, map(
+            add,
+            offsets,
+            map(extra_bytes.__getitem__, map(bisect.bisect_left, repeat(positions), offsets)),
+        ))
+
+    @staticmethod
+    def build(
+        documents: Iterable[str],
+        splitter: Optional[SentSplitter] = None,
+        tokeniser: Optional[Tokeniser] = None,
+    ) -> 'TokenTable':
+        '''
+        Sentence split and tokenise a corpus of documents into a token table.
+
+        :param documents: The texts of the documents.
+        :param splitter: The sentence splitter to use.
+            If ``None`` then the default sentence splitter is used (see
+            ``malti.defaults.Defaults``).
+        :param tokeniser: The tokeniser to use.
+            If ``None`` then the default tokeniser is used (see ``malti.defaults.Defaults``).
+        :return: The token table.
+        '''
+        if splitter is None:
+            splitter = Defaults.get('sent_splitter')
+        if tokeniser is None:
+            tokeniser = Defaults.get('tokeniser')
+
+        text = bytearray()
+        token_starts = array(TokenTable.TYPECODE)
+        token_ends = array(TokenTable.TYPECODE)
+        sentence_ids = array(TokenTable.TYPECODE)
+        doc_ids = array(TokenTable.TYPECODE)
+        doc_sentence_starts = array(TokenTable.TYPECODE, [0])
+        num_sentences = 0
+        num_documents = 0
+        for document in documents:
+            for sentence in splitter.split(document):
+                base = len(text)
+                encoded = sentence.encode('utf-8')
+                offsets = TokenTable._to_byte_offsets(
+                    sentence, encoded, tokeniser.tokenise_indices_compact(sentence).data, base,
+                )
+                token_starts.extend(offsets[0::2])
+                token_ends.extend(offsets[1::2])
+                num_tokens = len(offsets)//2
+                sentence_ids.extend(array(TokenTable.TYPECODE, [num_sentences])*num_tokens)
+                doc_ids.extend(array(TokenTable.TYPECODE, [num_documents])*num_tokens)
+                text += encoded
+                text += b'\n'
+                num_sentences += 1
+            doc_sentence_starts.append(num_sentences)
+            num_documents += 1
+
+        return TokenTable(
+            bytes(text), token_starts, token_ends, sentence_ids, doc_ids, doc_sentence_starts,
+            num_sentences, num_documents,
+        )
+
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of tokens in the table.
+
+        :return: The number of tokens.
+        '''
+        return len(self.token_starts)
+
+    @property
+    def nbytes(
+        self,
+    ) -> int:
+        '''
+        The number of bytes taken by the text buffer and the columns.
+
+        :return: The number of bytes.
+        '''
+        return len(self.text) + 4*8*len(self) + 8*len(self.doc_sentence_starts)
+
+    def get_token(
+        self,
+        index: int,
+    ) -> str:
+        '''
+        Get a token.
+
+        :param index: The row of the token in the table.
+        :return: The token.
+        '''
+        return str(self.text[self.token_starts[index]:self.token_ends[index]], 'utf-8')
+
+    def get_tokens(
+        self,
+        start: int,
+        end: int,
+    ) -> list[str]:
+        '''
+        Get the tokens in a range of rows.
+
+        :param start: The first row.
+        :param end: The row after the last row.
+        :return: The list of tokens.
+        '''
+        text = self.text
+        return [
+            str(text[i:j], 'utf-8')
+            for (i, j) in zip(self.token_starts[start:end], self.token_ends[start:end])
+        ]
+
+    def get_sentence(
+        self,
+        sentence_id: int,
+    ) -> list[str]:
+        '''
+        Get the tokens of a sentence.
+
+        :param sentence_id: The sentence number.
+        :return: The list of tokens.
+        '''
+        return self.get_tokens(
+            bisect.bisect_left(self.sentence_ids, sentence_id),
+            bisect.bisect_right(self.sentence_ids, sentence_id),
+        )
+
+    def get_document(
+        self,
+        doc_id: int,
+    ) -> list[list[str]]:
+        '''
+        Get the tokens of a document grouped by sentence.
+
+        :param doc_id: The document number.
+        :return: The list of sentences, each of which is a list of tokens.
+        '''
+        return [
+            self.get_sentence(sentence_id)
+            for sentence_id in range(
+                self.doc_sentence_starts[doc_id], self.doc_sentence_starts[doc_id + 1],
+            )
+        ]
+
+    def iter_sentences(
+        self,
+    ) -> Iterator[list[str]]:
+        '''
+        Iterate over the sentences in the table (excluding sentences without tokens).
+
+        :return: An iterator of sentences, each of which is a list of tokens.
+        '''
+        sentence_ids = self.sentence_ids
+        size = len(self)
+        start = 0
+        while start < size:
+            end = bisect.bisect_right(sentence_ids, sentence_ids[start], start)
+            yield self.get_tokens(start, end)
+            start = end
+
+    def save(
+        self,
+        path: str,
+    ) -> None:
+        '''
+        Save the table to a binary file that can be loaded with ``load``.
+        The integers are saved in the byte order of the machine.
+
+        :param path: The path to the file.
+        '''
+        with open(path, 'wb') as f:
+            f.write(self._HEADER.pack(
+                self.FILE_MAGIC, 1, len(self), self.num_sentences, self.num_documents,
+                len(self.text),
+            ))
+            for column in [
+                self.token_starts, self.token_ends, self.sentence_ids, self.doc_ids,
+                self.doc_sentence_starts,
+            ]:
+                if isinstance(column, (array, memoryview)):
+                    f.write(column)
+                else:
+                    f.write(array(self.TYPECODE, column))
+            f.write(self.text)
+
+    @staticmethod
+    def load(
+        path: str,
+        use_mmap: bool = True,
+    ) -> 'TokenTable':
+        '''
+        Load a table that was saved with ``save``.
+
+        :param path: The path to the file.
+        :param use_mmap: Whether to memory map the file instead of reading it into memory.
+            The file remains open until ``close`` is called.
+        :return: The token table.
+        '''
+        with open(path, 'rb') as f:
+            if use_mmap:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                data: Union[bytes, memoryview] = memoryview(mapped)
+            else:
+                mapped = None
+                data = f.read()
+
+        header_size = TokenTable._HEADER.size
+        if len(data) < header_size:
+            raise ValueError('The file is not a token table.')
+        (magic, byte_order, num_tokens, num_sentences, num_documents, text_size) = (
+            TokenTable._HEADER.unpack(data[:header_size])
+        )
+        if magic != TokenTable.FILE_MAGIC:
+            raise ValueError('The file is not a token table.')
+        if byte_order != 1:
+            raise ValueError('The file was saved on a machine with a different byte order.')
+        # The token starts, token ends, sentence ids, and document ids, followed by the document
+        # sentence starts.
+        column_sizes = [8*num_tokens]*4 + [8*(num_documents + 1)]
+        if len(data) != header_size + sum(column_sizes) + text_size:
+            raise ValueError('The token table file is truncated or corrupted.')
+
+        columns: list[Sequence[int]] = []
+        start = header_size
+        for column_size in column_sizes:
+            if isinstance(data, memoryview):
+                columns.append(data[start:start + column_size].cast('q'))
+            else:
+                column = array(TokenTable.TYPECODE)
+                column.frombytes(data[start:start + column_size])
+                columns.append(column)
+            start += column_size
+        text = data[start:]
+
+        table = TokenTable(
+            text, columns[0], columns[1], columns[2], columns[3], columns[4],
+            num_sentences, num_documents,
+        )
+        table._mmap = mapped # pylint: disable=protected-access
+        return table
+
+    def close(
+        self,
+    ) -> None:
+        '''
+        Close the file of a table that was loaded with memory mapping.
+        The table cannot be used afterwards.
+        Nothing is done if the table was not memory mapped.
+        '''
+        if self._mmap is None:
+            return
+        for view in [self.text, self.token_starts, self.token_ends, self.sentence_ids,
+                     self.doc_ids, self.doc_sentence_starts]:
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+        self._mmap = None
@@ -2,4 +2,6 @@
 Data resources.
 '''
 
+from malti.data.non_breaking_prefix_index import NonBreakingPrefixIndex
+from malti.data.lexicon import Lexicon
 from malti.data.data import Data
@@ -4,7 +4,10 @@ Data resources.
 
 import os
 import json
-from typing import Optional
+import struct
+import threading
+from typing import Any, Callable, Iterable, Optional
+from malti.data.non_breaking_prefix_index import NonBreakingPrefixIndex
 
 
 __all__ = [
@@ -12,11 +15,281 @@ __all__ = [
 ]
 
 
+def _read_json_set(
+    path: str,
+) -> set[str]:
+    '''
+    Read a JSON file with a list of strings into a set.
+
+    :param path: The path to the file.
+    :return: The set of strings.
+    '''
+    with open(path, 'r', encoding='utf-8') as f:
+        return set(json.load(f))
+
+
+def _words_to_bytes(
+    words: set[str],
+) -> bytes:
+    '''
+    Write a set of words (without new lines) as their sorted UTF-8 encoding separated by new
+    lines.
+
+    :param words: The set of words.
+    :return: The bytes.
+    '''
+    return '\n'.join(sorted(words)).encode('utf-8')
+
+
+def _bytes_to_words(
+    data: bytes,
+) -> set[str]:
+    '''
+    Read a set of words from the bytes written by ``_words_to_bytes``.
+
+    :param data: The bytes.
+    :return: The set of words.
+    '''
+    return set(data.decode('utf-8').split('\n')) if data != b'' else set()
+
+
 class Data:
     '''
     Singleton class for lazily loading and caching data from files.
+
+    Each data resource is registered under a name together with the file it is read from and the
+    function that reads it, and is loaded on first use in a thread-safe way.
+    Call ``preload`` to load all the resources in advance, such as before forking worker
+    processes so that they share the loaded resources instead of each loading their own.
+
+    Optionally, ``compile`` saves every resource that was registered with a binary form in a
+    cache file next to its source file (or in the directory set with ``set_cache_directory``),
+    which is then loaded instead of parsing the source file for as long as the source file is not
+    modified.
+    Cache files only hold plain data that is read without parsing line by line (such as the
+    sorted words of a set), never code or pickled objects.
     '''
 
+    NON_BREAKING_PREFIX_FILE = os.path.join(
+        os.path.dirname(__file__), '..', 'sent_splitter', 'km_sent_splitter',
+        'mt_non_breaking_prefixes.txt',
+    )
+    '''The path to the text file with the Maltese non-breaking prefixes.'''
+
+    TOKENS_WITH_DASH_END_FILE = os.path.join(os.path.dirname(__file__), 'tokens_with_dash_end.json')
+    '''The path to the JSON file with the common Maltese tokens that end with a dash.'''
+
+    CACHE_FILE_MAGIC = b'MALTIDC3'
+    '''The bytes that start a cache file.'''
+
+    CACHE_FILE_EXTENSION = '.cache'
+    '''The extension added to the name of a source file to get the name of its cache file.'''
+
+    _CACHE_HEADER = struct.Struct('=8s2q')
+    '''The header of a cache file, which is followed by the binary form of the resource: the magic
+    bytes and the modification time (in nanoseconds) and size of the source file that it was made
+    from.'''
+
+    @staticmethod
+    def register(
+        name: str,
+        path: str,
+        loader: Callable[[str], Any],
+        to_bytes: Optional[Callable[[Any], bytes]] = None,
+        from_bytes: Optional[Callable[[bytes], Any]] = None,
+    ) -> None:
+        '''
+        Register a data resource.
+        Any previously loaded resource with the same name is discarded.
+
+        :param name: The name of the resource, such as ``'tokens_with_dash_end'``.
+        :param path: The path to the file that the resource is read from.
+        :param loader: A function that reads the resource from the file given its path.
+        :param to_bytes: A function that writes the resource in a binary form to save in its cache
+            file.
+            If ``None`` then the resource is not cached by ``compile``.
+        :param from_bytes: A function that reads the resource back from the binary form written by
+            ``to_bytes``, raising ``ValueError`` if the data is not valid.
+        '''
+        if (to_bytes is None) != (from_bytes is None):
+            raise ValueError('Either both or neither of to_bytes and from_bytes must be given.')
+        with Data.__lock:
+            Data.__resources[name] = (path, loader, to_bytes, from_bytes)
+            Data.__values.pop(name, None)
+
+    @staticmethod
+    def get(
+        name: str,
+    ) -> Any:
+        '''
+        Get a data resource, loading it if this is the first time it is requested.
+
+        :param name: The name of the resource, such as ``'tokens_with_dash_end'``.
+        :return: The resource.
+        '''
+        value = Data.__values.get(name)
+        if value is None:
+            with Data.__lock:
+                value = Data.__values.get(name)
+                if value is None:
+                    if name not in Data.__resources:
+                        raise KeyError(f'No data resource registered with name \'{name}\'.')
+                    (path, loader, _, from_bytes) = Data.__resources[name]
+                    value = None
+                    if from_bytes is not None:
+                        data = Data.__read_cache(path)
+                        if data is not None:
+                            try:
+                                value = from_bytes(data)
+                            except ValueError:
+                                value = None
+                    if value is None:
+                        value = loader(path)
+                    Data.__values[name] = value
+        return value
+
+    @staticmethod
+    def preload(
+        names: Optional[Iterable[str]] = None,
+    ) -> None:
+        '''
+        Load data resources in advance, such as before forking worker processes so that they
+        inherit the loaded resources rather than each loading their own.
+
+        :param names: The names of the resources to load.
+            If ``None`` then all the registered resources are loaded.
+        '''
+        if names is None:
+            with Data.__lock:
+                names = list(Data.__resources)
+        for name in names:
+            Data.get(name)
+
+    @staticmethod
+    def clear(
+        names: Optional[Iterable[str]] = None,
+    ) -> None:
+        '''
+        Discard loaded data resources so that they are loaded again when next requested.
+        Anything that already holds a reference to a resource keeps using it.
+
+        :param names: The names of the resources to discard.
+            If ``None`` then all the loaded resources are discarded.
+        '''
+        with Data.__lock:
+            if names is None:
+                Data.__values.clear()
+            else:
+                for name in names:
+                    Data.__values.pop(name, None)
+
+    @staticmethod
+    def set_cache_directory(
+        directory: Optional[str],
+    ) -> None:
+        '''
+        Set the directory where the cache files are saved by ``compile`` and looked for
+        when loading resources, such as when the package directory is not writable.
+
+        :param directory: The path to the directory.
+            If ``None`` then each cache file is next to its source file.
+        '''
+        with Data.__lock:
+            Data.__cache_directory = directory
+
+    @staticmethod
+    def get_cache_path(
+        path: str,
+    ) -> str:
+        '''
+        Get the path to the cache file of a source file.
+
+        :param path: The path to the source file.
+        :return: The path to the cache file.
+        '''
+        directory = Data.__cache_directory
+        if directory is None:
+            directory = os.path.dirname(path)
+        return os.path.join(directory, os.path.basename(path) + Data.CACHE_FILE_EXTENSION)
+
+    @staticmethod
+    def compile(
+        names: Optional[Iterable[str]] = None,
+    ) -> list[str]:
+        '''
+        Save data resources in cache files that load faster than their source files.
+        The resources are read afresh from their source files, so any changes made to loaded
+        resources (such as with ``add_non_breaking_prefixes``) are not saved.
+
+        :param names: The names of the resources to save, which must have been registered with
+            a binary form.
+            If ``None`` then all the registered resources with a binary form are saved.
+        :return: The paths to the cache files.
+        '''
+        with Data.__lock:
+            if names is None:
+                names = [
+                    name for (name, resource) in Data.__resources.items()
+                    if resource[2] is not None
+                ]
+            resources: list[tuple[str, Callable[[str], Any], Callable[[Any], bytes]]] = []
+            for name in names:
+                (path, loader, to_bytes, _) = Data.__resources[name]
+                if to_bytes is None:
+                    raise ValueError(f'The data resource \'{name}\' has no binary form to cache.')
+                resources.append((path, loader, to_bytes))
+
+        cache_paths = []
+        for (path, loader, to_bytes) in resources:
+            stat = os.stat(path)
+            cache_path = Data.get_cache_path(path)
+            temp_path = cache_path + '.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(Data._CACHE_HEADER.pack(
+                    Data.CACHE_FILE_MAGIC, stat.st_mtime_ns, stat.st_size,
+                ))
+                f.write(to_bytes(loader(path)))
+            os.replace(temp_path, cache_path)
+            cache_paths.append(cache_path)
+        return cache_paths
+
+    @staticmethod
+    def __read_cache(
+        path: str,
+    ) -> Optional[bytes]:
+        '''
+        Read the binary form of a resource from the cache file of its source file, provided that
+        the cache file exists and was made from the current version of the source file.
+
+        :param path: The path to the source file.
+        :return: The binary form or ``None`` if there is no valid cache file.
+        '''
+        header = Data._CACHE_HEADER
+        try:
+            with open(Data.get_cache_path(path), 'rb') as f:
+                data = f.read()
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if len(data) < header.size:
+            return None
+        if header.unpack_from(data) != (Data.CACHE_FILE_MAGIC, stat.st_mtime_ns, stat.st_size):
+            return None
+        return data[header.size:]
+
+    __lock = threading.RLock()
+    __resources: dict[
+        str,
+        tuple[
+            str,
+            Callable[[str], Any],
+            Optional[Callable[[Any], bytes]],
+            Optional[Callable[[bytes], Any]],
+        ],
+    ] = {}
+    __values: dict[str, Any] = {}
+    __cache_directory: Optional[str] = None
+
     @staticmethod
     def get_tokens_with_dash_end(
     ) -> set[str]:
@@ -25,9 +298,45 @@ class Data:
 
         :return: The set of tokens.
         '''
-        if Data.__tokens_with_dash_end is None:
-            path = os.path.join(os.path.dirname(__file__), 'tokens_with_dash_end.json')
-            with open(path, 'r', encoding='utf-8') as f:
-                Data.__tokens_with_dash_end = set(json.load(f))
-        return Data.__tokens_with_dash_end
-    __tokens_with_dash_end: Optional[set[str]] = None
+        return Data.get('tokens_with_dash_end')
+
+    @staticmethod
+    def get_non_breaking_prefixes(
+    ) -> NonBreakingPrefixIndex:
+        '''
+        Get the index of Maltese non-breaking prefixes (words that do not end a sentence when
+        followed by a full stop) used by the sentence splitters.
+        The index is read once per process and shared by all the sentence splitters that use it,
+        so prefixes added to it (such as with ``add_non_breaking_prefixes``) affect all of them.
+
+        :return: The index.
+        '''
+        return Data.get('non_breaking_prefixes')
+
+    @staticmethod
+    def add_non_breaking_prefixes(
+        prefixes: Iterable[str],
+        numeric_only: bool = False,
+    ) -> None:
+        '''
+        Add domain specific prefixes (such as abbreviations) to the shared index of Maltese
+        non-breaking prefixes, affecting all the sentence splitters that use it, including
+        existing ones.
+
+        :param prefixes: The prefixes without the full stop.
+        :param numeric_only: Whether the prefixes only do not end a sentence when followed by a
+            number.
+        '''
+        index = Data.get_non_breaking_prefixes()
+        with Data.__lock:
+            index.add_all(prefixes, numeric_only)
+
+
+Data.register(
+    'tokens_with_dash_end', Data.TOKENS_WITH_DASH_END_FILE, _read_json_set,
+    _words_to_bytes, _bytes_to_words,
+)
+Data.register(
+    'non_breaking_prefixes', Data.NON_BREAKING_PREFIX_FILE, NonBreakingPrefixIndex.from_file,
+    NonBreakingPrefixIndex.to_bytes, NonBreakingPrefixIndex.from_bytes,
+)
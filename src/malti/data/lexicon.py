@@ -0,0 +1,169 @@
+'''
+A compact read-only list of known words that is memory-mapped from a file.
+'''
+
+import os
+import mmap
+import struct
+from array import array
+from typing import Any, Iterable, Iterator
+
+
+__all__ = [
+    'Lexicon',
+]
+
+
+class Lexicon:
+    '''
+    A read-only set of known words (such as a Maltese word list) kept in a binary file that is
+    memory-mapped rather than read into memory.
+    This makes opening a lexicon instant regardless of its size and lets all the processes that
+    open the same file (such as the workers of a process pool) share one copy of it in memory.
+
+    The file consists of a header with the number of words, followed by an array of 64-bit
+    offsets to the start of each word (and the end of the last word), followed by the UTF-8
+    encoded words sorted by their bytes.
+    Words are looked up with a binary search over the file.
+
+    A lexicon is pickled as the path to its file, so sending it to another process opens the
+    same file there.
+    '''
+
+    FILE_MAGIC = b'MALTILX1'
+    '''The bytes that start a lexicon file.'''
+
+    _HEADER = struct.Struct('=8sq')
+    '''The header of a lexicon file: the magic bytes and the number of words.'''
+
+    def __init__(
+        self,
+        path: str,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param path: The path to a lexicon file made with ``build``.
+        '''
+        header = self._HEADER
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < header.size:
+            self._mmap.close()
+            raise ValueError('The file is too short to be a lexicon.')
+        (magic, self._num_words) = header.unpack_from(self._mmap)
+        if magic != self.FILE_MAGIC:
+            self._mmap.close()
+            raise ValueError('The file is not a lexicon.')
+
+        offsets_end = header.size + (self._num_words + 1)*8
+        if len(self._mmap) < offsets_end:
+            self._mmap.close()
+            raise ValueError('The lexicon file is corrupted.')
+        self._offsets = memoryview(self._mmap)[header.size:offsets_end].cast('q')
+        self._words_start = offsets_end
+        if self._words_start + self._offsets[-1] != len(self._mmap):
+            self._offsets.release()
+            self._mmap.close()
+            raise ValueError('The lexicon file is corrupted.')
+
+    @staticmethod
+    def build(
+        words: Iterable[str],
+        path: str,
+    ) -> None:
+        '''
+        Make a lexicon file from a list of words.
+        Empty words and duplicates are ignored and the case of the words is kept as is.
+        The file is written to a temporary file that then replaces ``path``, so that processes
+        that already have the old file open are not affected.
+
+        :param words: The words, such as the lines of a word list with white space stripped.
+        :param path: The path to the file to make.
+        '''
+        encoded_words = sorted({word.encode('utf-8') for word in words if word != ''})
+        offsets = array('q', [0])
+        for word in encoded_words:
+            offsets.append(offsets[-1] + len(word))
+
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(Lexicon._HEADER.pack(Lexicon.FILE_MAGIC, len(encoded_words)))
+            f.write(offsets.tobytes())
+            f.write(b''.join(encoded_words))
+        os.replace(temp_path, path)
+
+    def close(
+        self,
+    ) -> None:
+        '''
+        Unmap the file.
+        The lexicon cannot be used afterwards.
+        '''
+        self._offsets.release()
+        self._mmap.close()
+
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of words in the lexicon.
+
+        :return: The number of words.
+        '''
+        return self._num_words
+
+    def __contains__(
+        self,
+        word: object,
+    ) -> bool:
+        '''
+        Check if a word is in the lexicon.
+
+        :param word: The word.
+        :return: Whether the word is in the lexicon.
+        '''
+        if not isinstance(word, str):
+            return False
+        key = word.encode('utf-8')
+        data = self._mmap
+        offsets = self._offsets
+        words_start = self._words_start
+
+        low = 0
+        high = self._num_words
+        while low < high:
+            middle = (low + high)//2
+            candidate = data[words_start + offsets[middle]:words_start + offsets[middle + 1]]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return True
+        return False
+
+    def __iter__(
+        self,
+    ) -> Iterator[str]:
+        '''
+        Iterate over the words in the lexicon in the order of their UTF-8 bytes.
+
+        :return: An iterator of the words.
+        '''
+        data = self._mmap
+        offsets = self._offsets
+        words_start = self._words_start
+        for i in range(self._num_words):
+            yield data[words_start + offsets[i]:words_start + offsets[i + 1]].decode('utf-8')
+
+    def __reduce__(
+        self,
+    ) -> tuple[Any, ...]:
+        '''
+        Pickle the lexicon as the path to its file.
+
+        :return: The information needed to open the lexicon again.
+        '''
+        return (Lexicon, (self.path,))
@@ -0,0 +1,245 @@
+'''
+An index of the words that do not end a sentence when followed by a full stop.
+'''
+
+import struct
+from typing import Iterable
+
+
+__all__ = [
+    'NonBreakingPrefixIndex',
+]
+
+
+class NonBreakingPrefixIndex:
+    '''
+    An index of non-breaking prefixes, that is, words (such as abbreviations and titles) that do
+    not end a sentence when followed by a full stop, as used by sentence splitters.
+
+    There are two kinds of non-breaking prefixes:
+
+    * ``non_breaking_prefixes``: Prefixes that never end a sentence.
+    * ``numeric_only_prefixes``: Prefixes that only do not end a sentence when followed by a
+      number (such as 'Nru.' in 'Nru. 5').
+
+    A prefix is in at most one of the two sets.
+    The sets are modified in place when prefixes are added, so that anything holding a reference
+    to them sees the new prefixes, and ``version`` is increased by one so that anything that
+    derives its own data from the index can tell when it needs to be updated.
+
+    An index can be read from a text file in the format used by the ``sentence_splitter``
+    package or saved to and loaded from a binary file, which is faster to load as it needs no
+    parsing line by line.
+    '''
+
+    FILE_MAGIC = b'MALTINB1'
+    '''The bytes that start a saved non-breaking prefix index.'''
+
+    _HEADER = struct.Struct('=8s2q')
+    '''The header of a saved non-breaking prefix index: the magic bytes and the number of
+    prefixes of each kind, which are followed by all the prefixes, sorted within each kind and
+    separated by new lines, in UTF-8.'''
+
+    def __init__(
+        self,
+        non_breaking_prefixes: Iterable[str] = (),
+        numeric_only_prefixes: Iterable[str] = (),
+    ) -> None:
+        '''
+        Constructor.
+
+        :param non_breaking_prefixes: The prefixes that never end a sentence.
+        :param numeric_only_prefixes: The prefixes that only do not end a sentence when followed
+            by a number (which take precedence over the same prefixes in
+            ``non_breaking_prefixes``).
+        '''
+        self.non_breaking_prefixes: set[str] = set(non_breaking_prefixes)
+        self.numeric_only_prefixes: set[str] = set(numeric_only_prefixes)
+        self.non_breaking_prefixes.difference_update(self.numeric_only_prefixes)
+        self.version = 0
+
+    @staticmethod
+    def from_text(
+        text: str,
+    ) -> 'NonBreakingPrefixIndex':
+        '''
+        Read an index from a text with one prefix per line, in the format used by the
+        ``sentence_splitter`` package.
+        Lines containing ``#NUMERIC_ONLY#`` are prefixes that only do not end a sentence when
+        followed by a number and anything after a ``#`` is a comment.
+        If a prefix occurs more than once then its last line is used.
+
+        :param text: The text.
+        :return: The index.
+        '''
+        index = NonBreakingPrefixIndex()
+        for line in text.split('\n'):
+            prefix = line.split('#', 1)[0].strip()
+            if prefix == '':
+                continue
+            index.add(prefix, '#NUMERIC_ONLY#' in line)
+        index.version = 0
+        return index
+
+    @staticmethod
+    def from_file(
+        path: str,
+    ) -> 'NonBreakingPrefixIndex':
+        '''
+        Read an index from a text file in the format described in ``from_text``.
+
+        :param path: The path to the file.
+        :return: The index.
+        '''
+        with open(path, 'r', encoding='utf-8') as f:
+            return NonBreakingPrefixIndex.from_text(f.read())
+
+    def add(
+        self,
+        prefix: str,
+        numeric_only: bool = False,
+    ) -> None:
+        '''
+        Add a prefix to the index, replacing its kind if it is already in the index.
+
+        :param prefix: The prefix without the full stop.
+        :param numeric_only: Whether the prefix only does not end a sentence when followed by a
+            number.
+        '''
+        if numeric_only:
+            self.non_breaking_prefixes.discard(prefix)
+            self.numeric_only_prefixes.add(prefix)
+        else:
+            self.numeric_only_prefixes.discard(prefix)
+            self.non_breaking_prefixes.add(prefix)
+        self.version += 1
+
+    def add_all(
+        self,
+        prefixes: Iterable[str],
+        numeric_only: bool = False,
+    ) -> None:
+        '''
+        Add several prefixes of the same kind to the index, replacing their kind if they are
+        already in the index.
+
+        :param prefixes: The prefixes without the full stop.
+        :param numeric_only: Whether the prefixes only do not end a sentence when followed by a
+            number.
+        '''
+        prefixes = set(prefixes)
+        if numeric_only:
+            self.non_breaking_prefixes.difference_update(prefixes)
+            self.numeric_only_prefixes.update(prefixes)
+        else:
+            self.numeric_only_prefixes.difference_update(prefixes)
+            self.non_breaking_prefixes.update(prefixes)
+        self.version += 1
+
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of prefixes in the index.
+
+        :return: The number of prefixes.
+        '''
+        return len(self.non_breaking_prefixes) + len(self.numeric_only_prefixes)
+
+    def __contains__(
+        self,
+        prefix: object,
+    ) -> bool:
+        '''
+        Check if a prefix (of either kind) is in the index.
+
+        :param prefix: The prefix without the full stop.
+        :return: Whether the prefix is in the index.
+        '''
+        return prefix in self.non_breaking_prefixes or prefix in self.numeric_only_prefixes
+
+    def to_text(
+        self,
+    ) -> str:
+        '''
+        Write the index as a text in the format read by ``from_text``, with the prefixes sorted.
+
+        :return: The text.
+        '''
+        for prefix in self.non_breaking_prefixes | self.numeric_only_prefixes:
+            if '#' in prefix or prefix != ''.join(prefix.split()):
+                raise ValueError(
+                    f'The prefix \'{prefix}\' cannot be written because it contains a \'#\' or'
+                    ' white space.'
+                )
+        return ''.join(
+            [f'{prefix}\n' for prefix in sorted(self.non_breaking_prefixes)]
+            + [f'{prefix} #NUMERIC_ONLY#\n' for prefix in sorted(self.numeric_only_prefixes)]
+        )
+
+    def to_bytes(
+        self,
+    ) -> bytes:
+        '''
+        Write the index in the binary form read by ``from_bytes``.
+
+        :return: The bytes.
+        '''
+        non_breaking_prefixes = sorted(self.non_breaking_prefixes)
+        numeric_only_prefixes = sorted(self.numeric_only_prefixes)
+        return self._HEADER.pack(
+            self.FILE_MAGIC, len(non_breaking_prefixes), len(numeric_only_prefixes),
+        ) + '\n'.join(non_breaking_prefixes + numeric_only_prefixes).encode('utf-8')
+
+    @staticmethod
+    def from_bytes(
+        data: bytes,
+    ) -> 'NonBreakingPrefixIndex':
+        '''
+        Read an index from the binary form written by ``to_bytes``.
+
+        :param data: The bytes.
+        :return: The index.
+        '''
+        header = NonBreakingPrefixIndex._HEADER
+        if len(data) < header.size:
+            raise ValueError('The data is too short to be a non-breaking prefix index.')
+        (magic, num_non_breaking, num_numeric_only) = header.unpack_from(data)
+        if magic != NonBreakingPrefixIndex.FILE_MAGIC:
+            raise ValueError('The data is not a non-breaking prefix index.')
+
+        prefixes = data[header.size:].decode('utf-8').split('\n')
+        if num_non_breaking + num_numeric_only == 0:
+            prefixes = []
+        if len(prefixes) != num_non_breaking + num_numeric_only:
+            raise ValueError('The non-breaking prefix index data is corrupted.')
+        # The prefixes are already separated by kind, so the sets are filled directly.
+        index = NonBreakingPrefixIndex()
+        index.non_breaking_prefixes.update(prefixes[:num_non_breaking])
+        index.numeric_only_prefixes.update(prefixes[num_non_breaking:])
+        return index
+
+    def save(
+        self,
+        path: str,
+    ) -> None:
+        '''
+        Save the index to a binary file.
+
+        :param path: The path to the file.
+        '''
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @staticmethod
+    def load(
+        path: str,
+    ) -> 'NonBreakingPrefixIndex':
+        '''
+        Load an index that was saved with ``save``.
+
+        :param path: The path to the file.
+        :return: The index.
+        '''
+        with open(path, 'rb') as f:
+            return NonBreakingPrefixIndex.from_bytes(f.read())
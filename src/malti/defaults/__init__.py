@@ -0,0 +1,5 @@
+'''
+Default components used by the convenience functions.
+'''
+
+from malti.defaults.defaults import Defaults
@@ -0,0 +1,160 @@
+'''
+Default components used by the convenience functions.
+'''
+
+import importlib
+import threading
+from typing import Any, Callable, Optional
+from malti.data import Data
+
+
+__all__ = [
+    'Defaults',
+]
+
+
+class Defaults:
+    '''
+    Singleton class for lazily creating and caching the default components (tokeniser, sentence
+    splitter, etc.) used by convenience functions such as ``malti.tokeniser.tokenise``, so that
+    they are only created once per process rather than once per call.
+
+    Each package registers a factory for its default component under a name when it is imported
+    and the component is created on first use in a thread-safe way.
+    Call ``warm_up`` to create all the components in advance, such as before forking worker
+    processes or serving requests.
+    Components that hold resources (such as a pool of threads) are registered with a function
+    that releases them, which is called whenever the component is discarded.
+    '''
+
+    PACKAGES = [
+        'malti.line_joiner',
+        'malti.sent_splitter',
+        'malti.tokeniser',
+    ]
+    '''The packages whose default components are used by the convenience functions, which are
+    imported by ``warm_up`` so that they register their components.'''
+
+    @staticmethod
+    def register(
+        name: str,
+        factory: Callable[[], Any],
+        close: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        '''
+        Register the factory that creates a default component.
+        Any previously created component with the same name is discarded.
+
+        :param name: The name of the component, such as ``'tokeniser'``.
+        :param factory: A function (or class) without arguments that creates the component.
+        :param close: A function that releases the resources held by a component when it is
+            discarded (such as by ``clear``) or ``None`` if there is nothing to release.
+        '''
+        with Defaults.__lock:
+            discarded = Defaults.__discard([name])
+            Defaults.__factories[name] = (factory, close)
+        Defaults.__close(discarded)
+
+    @staticmethod
+    def unregister(
+        name: str,
+    ) -> None:
+        '''
+        Remove the factory of a default component together with the component, if it was
+        created.
+
+        :param name: The name of the component, such as ``'tokeniser'``.
+        '''
+        with Defaults.__lock:
+            if name not in Defaults.__factories:
+                raise KeyError(f'No default component registered with name \'{name}\'.')
+            discarded = Defaults.__discard([name])
+            del Defaults.__factories[name]
+        Defaults.__close(discarded)
+
+    @staticmethod
+    def get(
+        name: str,
+    ) -> Any:
+        '''
+        Get a default component, creating it if this is the first time it is requested.
+
+        :param name: The name of the component, such as ``'tokeniser'``.
+        :return: The component.
+        '''
+        instance = Defaults.__instances.get(name)
+        if instance is None:
+            with Defaults.__lock:
+                instance = Defaults.__instances.get(name)
+                if instance is None:
+                    if name not in Defaults.__factories:
+                        raise KeyError(f'No default component registered with name \'{name}\'.')
+                    instance = Defaults.__factories[name][0]()
+                    Defaults.__instances[name] = instance
+        return instance
+
+    @staticmethod
+    def warm_up(
+    ) -> None:
+        '''
+        Create all the default components in advance, together with all the data resources (see
+        ``malti.data.Data.preload``), so that the first call to a convenience function is not
+        slower than the rest.
+        The packages in ``PACKAGES`` are imported first, so their components are always created,
+        as is every component registered by any other module that was imported (such as
+        ``malti.asynchronous``).
+        '''
+        for package in Defaults.PACKAGES:
+            importlib.import_module(package)
+        with Defaults.__lock:
+            names = list(Defaults.__factories)
+        for name in names:
+            Defaults.get(name)
+        Data.preload()
+
+    @staticmethod
+    def clear(
+    ) -> None:
+        '''
+        Discard all the created default components so that they are created again when next
+        requested, releasing the resources held by those registered with a ``close`` function.
+        '''
+        with Defaults.__lock:
+            discarded = Defaults.__discard(list(Defaults.__instances))
+        Defaults.__close(discarded)
+
+    @staticmethod
+    def __discard(
+        names: list[str],
+    ) -> list[tuple[Any, Callable[[Any], None]]]:
+        '''
+        Discard created default components, which must be done while holding the lock.
+
+        :param names: The names of the components.
+        :return: The discarded components that need to be closed together with the functions
+            that close them.
+        '''
+        discarded = []
+        for name in names:
+            instance = Defaults.__instances.pop(name, None)
+            close = Defaults.__factories[name][1] if name in Defaults.__factories else None
+            if instance is not None and close is not None:
+                discarded.append((instance, close))
+        return discarded
+
+    @staticmethod
+    def __close(
+        discarded: list[tuple[Any, Callable[[Any], None]]],
+    ) -> None:
+        '''
+        Close discarded default components, which is done without holding the lock as closing
+        can wait for work that uses other components.
+
+        :param discarded: The components together with the functions that close them.
+        '''
+        for (instance, close) in discarded:
+            close(instance)
+
+    __lock = threading.RLock()
+    __factories: dict[str, tuple[Callable[[], Any], Optional[Callable[[Any], None]]]] = {}
+    __instances: dict[str, Any] = {}
@@ -2,8 +2,13 @@
 Line joiners for Maltese text.
 '''
 
+from malti.line_joiner.line_mapping import LineMapping
 from malti.line_joiner.line_joiner import LineJoiner
 from malti.line_joiner.rb_line_joiner.rb_line_joiner import RBLineJoiner
+from malti.defaults import Defaults
+
+
+Defaults.register('line_joiner', RBLineJoiner)
 
 
 def join_lines(
@@ -13,13 +18,15 @@ def join_lines(
     '''
     Default line joiner.
     In this version, ``RBLineJoiner`` is used.
+    The line joiner is created once and reused on every call (see ``malti.defaults.Defaults``).
 
     :param lines: A list of Maltese text lines.
     :param fix_hyphenated_words: Whether to try to join hyphenated word segments back
         together as well.
     :return: The joined lines.
     '''
-    return RBLineJoiner().join_lines(
+    line_joiner: LineJoiner = Defaults.get('line_joiner')
+    return line_joiner.join_lines(
         lines,
         fix_hyphenated_words,
     )
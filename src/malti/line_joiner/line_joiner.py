@@ -4,6 +4,11 @@ rejoining hyphenated words.
 '''
 
 from abc import ABC
+from typing import Iterable, Iterator, Optional
+
+
+PAGE_BREAK = '\f'
+'''The character that separates pages in text extracted from PDFs (a form feed).'''
 
 
 class LineJoiner(ABC):
@@ -26,3 +31,61 @@ class LineJoiner(ABC):
         :return: The joined lines.
         '''
         raise NotImplementedError()
+
+    def _iter_paragraph_lines(
+        self,
+        lines: Iterable[str],
+        paragraph_separator: Optional[str] = None,
+    ) -> Iterator[Optional[str]]:
+        '''
+        Iterate over the lines of a text, giving ``None`` wherever a paragraph ends.
+        A paragraph ends at a blank line, at a page break, and at a line that is equal to
+        ``paragraph_separator`` (ignoring white space at its edges).
+        The paragraph separating lines are not included.
+
+        :param lines: An iterable of Maltese text lines.
+        :param paragraph_separator: A line that separates paragraphs, if any.
+        :return: An iterator of the lines and paragraph ends (``None``).
+        '''
+        for line in lines:
+            parts = line.split(PAGE_BREAK) if PAGE_BREAK in line else [line]
+            last_part_index = len(parts) - 1
+            for (i, part) in enumerate(parts):
+                stripped = part.strip()
+                if stripped in ('', paragraph_separator):
+                    yield None
+                else:
+                    yield part
+                if i < last_part_index:
+                    yield None
+
+    def iter_join_lines(
+        self,
+        lines: Iterable[str],
+        fix_hyphenated_words: bool = False,
+        paragraph_separator: Optional[str] = None,
+    ) -> Iterator[str]:
+        '''
+        Join an iterable of Maltese text lines, such as a text file object, into paragraphs,
+        giving each paragraph as soon as it ends.
+        A paragraph ends at a blank line, at a page break (a form feed character), and at a line
+        that is equal to ``paragraph_separator`` (ignoring white space at its edges).
+        Each paragraph is the same as the one given by ``join_lines`` on its lines and empty
+        paragraphs are skipped.
+        Only the lines of the current paragraph are kept in memory.
+
+        :param lines: An iterable of Maltese text lines.
+        :param fix_hyphenated_words: Whether to try to join hyphenated word segments back
+            together as well.
+        :param paragraph_separator: A line that separates paragraphs, if any.
+        :return: An iterator of the joined paragraphs.
+        '''
+        paragraph: list[str] = []
+        for line in self._iter_paragraph_lines(lines, paragraph_separator):
+            if line is not None:
+                paragraph.append(line)
+            elif paragraph:
+                yield self.join_lines(paragraph, fix_hyphenated_words)
+                paragraph = []
+        if paragraph:
+            yield self.join_lines(paragraph, fix_hyphenated_words)
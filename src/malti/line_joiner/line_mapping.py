@@ -0,0 +1,232 @@
+'''
+A compact mapping from the characters of joined lines back to the lines they came from.
+'''
+
+import bisect
+from array import array
+from typing import Iterator, Optional, Sequence, Union, overload
+
+
+__all__ = [
+    'LineMapping',
+]
+
+
+class LineMapping(Sequence[tuple[int, int]]):
+    '''
+    A memory efficient mapping from every character of a text made by joining lines to the
+    ``(line_index, column)`` pair of its location in the original list of lines, such that
+    ``lines[line_index][column]`` is the character.
+
+    Rather than keeping a pair for every character, the text is divided into segments, one for
+    each non-empty line, and three flat arrays of 64-bit integers keep the following for each
+    segment:
+
+    * ``output_starts``: The index in the joined text where the segment starts.
+    * ``line_indices``: The index of the line in the original list of lines.
+    * ``columns``: The column in the line of the first character of the segment (after any
+      white space at the start of the line).
+
+    The ``i``-th character of segment ``k`` is at column ``columns[k] + i`` of its line.
+    A space that was added between two lines is at the end of the segment of the line before it,
+    so it is mapped to the column just after the last non-white space character of that line.
+    A hyphen that was removed from a hyphenated word is not in the joined text, so the segment of
+    the line after it starts right after the first half of the word.
+    '''
+
+    TYPECODE = 'q'
+    '''The ``array`` type code of the flat arrays (signed 64-bit integer).'''
+
+    def __init__(
+        self,
+        length: int = 0,
+        output_starts: Optional[array] = None,
+        line_indices: Optional[array] = None,
+        columns: Optional[array] = None,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param length: The number of characters in the joined text.
+        :param output_starts: A flat array of integers with type code ``'q'`` with the index in
+            the joined text where each segment starts.
+            If ``None`` then there are no segments.
+        :param line_indices: A flat array of integers with type code ``'q'`` with the index of
+            the line of each segment.
+            If ``None`` then there are no segments.
+        :param columns: A flat array of integers with type code ``'q'`` with the column of the
+            first character of each segment.
+            If ``None`` then there are no segments.
+        '''
+        if output_starts is None:
+            output_starts = array(self.TYPECODE)
+        if line_indices is None:
+            line_indices = array(self.TYPECODE)
+        if columns is None:
+            columns = array(self.TYPECODE)
+        for data in [output_starts, line_indices, columns]:
+            if data.typecode != self.TYPECODE:
+                raise ValueError(
+                    f'The segment arrays must have a type code of \'{self.TYPECODE}\'.'
+                )
+        if not len(output_starts) == len(line_indices) == len(columns):
+            raise ValueError('The segment arrays must have the same length.')
+        if length > 0 and (len(output_starts) == 0 or output_starts[0] != 0):
+            raise ValueError('The first segment must start at the start of the joined text.')
+        self.length = length
+        self.output_starts = output_starts
+        self.line_indices = line_indices
+        self.columns = columns
+
+    @property
+    def nbytes(
+        self,
+    ) -> int:
+        '''
+        The number of bytes taken by the segments in the flat arrays.
+
+        :return: The number of bytes.
+        '''
+        return 3*len(self.output_starts)*self.output_starts.itemsize
+
+    def segments(
+        self,
+    ) -> Iterator[tuple[int, int, int]]:
+        '''
+        Iterate over the segments.
+
+        :return: An iterator of ``(output_start, line_index, column)`` triples.
+        '''
+        return zip(self.output_starts, self.line_indices, self.columns)
+
+    def source_spans(
+        self,
+        start: int,
+        end: int,
+    ) -> list[tuple[int, int, int]]:
+        '''
+        Find the parts of the original lines that a span of the joined text (such as a token or
+        a sentence) came from.
+
+        :param start: The index in the joined text where the span starts.
+        :param end: The index in the joined text where the span ends.
+        :return: A list of ``(line_index, start_column, end_column)`` triples, one for each line
+            that the span came from, in order, such that
+            ``lines[line_index][start_column:end_column]`` is the part of the span from that line
+            (without any removed hyphen).
+        '''
+        if not 0 <= start <= end <= self.length:
+            raise ValueError('The span must be within the joined text.')
+        if start == end:
+            return []
+
+        output_starts = self.output_starts
+        num_segments = len(output_starts)
+        spans = []
+        segment = bisect.bisect_right(output_starts, start) - 1
+        while segment < num_segments and output_starts[segment] < end:
+            segment_start = output_starts[segment]
+            segment_end = output_starts[segment + 1] if segment + 1 < num_segments else self.length
+            column = self.columns[segment] - segment_start
+            spans.append((
+                self.line_indices[segment],
+                column + max(start, segment_start),
+                column + min(end, segment_end),
+            ))
+            segment += 1
+        return spans
+
+    def tolist(
+        self,
+    ) -> list[tuple[int, int]]:
+        '''
+        Convert the mapping into a list with the ``(line_index, column)`` pair of every
+        character in the joined text.
+
+        :return: The list of tuple pairs.
+        '''
+        return list(self)
+
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of characters in the joined text.
+
+        :return: The number of characters.
+        '''
+        return self.length
+
+    @overload
+    def __getitem__(
+        self,
+        index: int,
+    ) -> tuple[int, int]:
+        '''
+        Get the location of a character of the joined text in the original lines.
+
+        :param index: The index of the character in the joined text.
+        :return: The ``(line_index, column)`` pair.
+        '''
+
+    @overload
+    def __getitem__(
+        self,
+        index: slice,
+    ) -> Sequence[tuple[int, int]]:
+        '''
+        Get a list with the locations of a slice of the characters of the joined text.
+
+        :param index: The slice of indices.
+        :return: The list of ``(line_index, column)`` pairs.
+        '''
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[tuple[int, int], Sequence[tuple[int, int]]]:
+        '''
+        Get the location of a character of the joined text in the original lines or a list with
+        the locations of a slice of the characters.
+
+        :param index: The index of the character or a slice of indices.
+        :return: The ``(line_index, column)`` pair or a list of pairs.
+        '''
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('LineMapping index out of range')
+        segment = bisect.bisect_right(self.output_starts, index) - 1
+        return (
+            self.line_indices[segment],
+            self.columns[segment] + index - self.output_starts[segment],
+        )
+
+    def __iter__(
+        self,
+    ) -> Iterator[tuple[int, int]]:
+        '''
+        Iterate over the location of every character of the joined text in the original lines.
+
+        :return: An iterator of ``(line_index, column)`` pairs.
+        '''
+        ends = list(self.output_starts[1:])
+        ends.append(self.length)
+        for (start, end, line_index, column) in zip(
+            self.output_starts, ends, self.line_indices, self.columns
+        ):
+            for i in range(end - start):
+                yield (line_index, column + i)
+
+    def __repr__(
+        self,
+    ) -> str:
+        '''
+        Get a string representation of the mapping.
+
+        :return: The string representation.
+        '''
+        return f'LineMapping({self.length}, {list(self.segments())!r})'
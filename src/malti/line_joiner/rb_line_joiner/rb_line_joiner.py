@@ -4,22 +4,36 @@ lines only where necessary and rejoining hyphenated words.
 '''
 
 import re
+from array import array
+from typing import Iterable, Iterator, Optional
+from malti.line_joiner.line_mapping import LineMapping
 from malti.line_joiner.line_joiner import LineJoiner
-from malti.data import Data
+from malti.data import Data, Lexicon
 
 
 class RBLineJoiner(LineJoiner):
     '''
     Rule-based line joiner that joins a list of text lines into a single line, adding spaces between
     lines only where necessary and rejoining hyphenated words.
+
+    Optionally, a ``Lexicon`` of known words can be used to tell compound words that are written
+    with a dash (such as 'ekonomiku-soċjali') apart from hyphenated words, by checking whether the
+    word formed with the start of the next line is only known with the dash.
     '''
 
     def __init__(
         self,
+        lexicon: Optional[Lexicon] = None,
     ) -> None:
         '''
         Initialiser.
+
+        :param lexicon: A lexicon of known words in lower case to use when deciding if a word is
+            hyphenated, if any.
+            A word that the rules consider to be hyphenated is not rejoined if the lexicon knows
+            its dashed form but not its joined form.
         '''
+        self.lexicon = lexicon
         self.no_space_end_chars = set('-—/')
         self.last_word_re = re.compile('^.*?(?P<last_word>[a-zċġħż]*-)$', re.IGNORECASE)
         self.url_re = re.compile(
@@ -31,45 +45,178 @@ class RBLineJoiner(LineJoiner):
             '[^ ]*-$', # Followed by non-spaces and a dash at the end of the line (e.g. .com/a-b-).
         )
         self.num_re = re.compile('^.*[0-9]+-$')
+        self.first_word_re = re.compile('[a-zċġħż]*', re.IGNORECASE)
+        # The new lines after a line that ends in a dash, em dash, or slash that is not after a
+        # space (the new line comes first to make searching faster).
+        self.no_space_end_re = re.compile('\\n(?<=(?<! )[-—/]\\n)')
+        self.dash_end_re = re.compile('\\n(?<=(?<! )-\\n)')
 
-    def is_hyphenated_word_at_end(
+    def _get_hyphenated_word(
         self,
-        line: str,
-    ) -> bool:
+        text: str,
+        dash: int,
+    ) -> Optional[str]:
         '''
-        Check if the line ends with a hyphenated (partial) word.
+        Check if the dash at the end of a line ends a hyphenated (partial) word according to the
+        rules (without a lexicon).
+        Only the last chunk of non-space characters of the line is looked at, since none of the
+        rules can match across a space, so the time taken does not depend on the length of the
+        line.
 
-        :param line: The line to check.
-        :return: Whether the line ends with a hyphenated word.
+        :param text: The text with the line, which can also contain other lines before it
+            separated by new lines.
+        :param dash: The index of the dash at the end of the line.
+        :return: The lower case hyphenated word including the dash or ``None`` if the dash does
+            not end a hyphenated word.
         '''
-        if line[-1] != '-':
-            return False
+        space = text.rfind(' ', 0, dash)
+        new_line = text.rfind('\n', space + 1, dash)
+        chunk = text[(new_line if new_line != -1 else space) + 1:dash + 1]
 
         # Get the last word
-        match = self.last_word_re.match(line)
+        match = self.last_word_re.match(chunk)
         assert match is not None
         last_word = match.group('last_word').lower() # Guaranteed that at least '-' will be matched.
 
         # If the dash is not attached to a word, nothing is hyphenated.
         if last_word == '-':
-            return False
+            return None
 
         # If last word is an expected dashed word, assume that hyphenation would
         # have been avoided as it would lead to confusion when reading (e.g. il-lum).
         if last_word in Data.get_tokens_with_dash_end():
-            return False
+            return None
 
         # Other checks
 
         # If dash is part of a URL, then it is not a hyphenated word.
-        if self.url_re.match(line):
-            return False
+        if self.url_re.match(chunk):
+            return None
 
         # If dash is attached to a number, then it is not a hyphenated word.
-        if self.num_re.match(line):
+        if self.num_re.match(chunk):
+            return None
+
+        return last_word
+
+    def is_hyphenated_word_at_end(
+        self,
+        line: str,
+        next_line: Optional[str] = None,
+    ) -> bool:
+        '''
+        Check if the line ends with a hyphenated (partial) word.
+
+        :param line: The line to check.
+        :param next_line: The line after it without spaces at its start, which is only used with
+            a lexicon.
+        :return: Whether the line ends with a hyphenated word.
+        '''
+        if line[-1] != '-':
+            return False
+
+        last_word = self._get_hyphenated_word(line, len(line) - 1)
+        if last_word is None:
             return False
 
-        return True
+        # If only the dashed form of the word is known (such as a compound word), then it is not a
+        # hyphenated word.
+        return next_line is None or not self._is_only_dashed_word_known(last_word, next_line, 0)
+
+    def _is_only_dashed_word_known(
+        self,
+        last_word: str,
+        text: str,
+        next_line_start: int,
+    ) -> bool:
+        '''
+        Check if the lexicon knows the word at the end of a line with its dash followed by the
+        word at the start of the next line, but not without the dash.
+
+        :param last_word: The lower case word at the end of the line, including the dash.
+        :param text: The text with the line after it.
+        :param next_line_start: The index in the text where the line after it starts (without
+            spaces).
+        :return: Whether only the dashed form of the word is known (always false without a
+            lexicon).
+        '''
+        if self.lexicon is None:
+            return False
+
+        match = self.first_word_re.match(text, next_line_start)
+        assert match is not None
+        first_word = match.group().lower() # Guaranteed to match, even if only the empty string.
+        if first_word == '':
+            return False
+
+        return (
+            last_word + first_word in self.lexicon
+            and last_word[:-1] + first_word not in self.lexicon
+        )
+
+    def _end_line(
+        self,
+        line: str,
+        next_line: str,
+        fix_hyphenated_words: bool,
+    ) -> str:
+        '''
+        Prepare a line to be joined to the line after it by adding a space after it where
+        necessary or removing the hyphen of a hyphenated word at its end.
+
+        :param line: A non-empty line without spaces at its edges.
+        :param next_line: The line after it without spaces at its edges.
+        :param fix_hyphenated_words: Whether to try to join hyphenated word segments back
+            together as well.
+        :return: The line as it should appear before the next line.
+        '''
+        if line[-1] in self.no_space_end_chars:
+            if len(line) > 1 and line[-2] == ' ':
+                return line + ' '
+            # Hyphen detection and correction
+            if fix_hyphenated_words and self.is_hyphenated_word_at_end(line, next_line):
+                return line[:-1] # Remove the hyphen from the line.
+            return line
+        return line + ' '
+
+    def _join_document(
+        self,
+        document: str,
+        fix_hyphenated_words: bool,
+    ) -> str:
+        '''
+        Join the lines of a document, replacing each new line with a space where necessary and
+        removing the hyphens of hyphenated words together with their new line.
+        All the line ends are found with regular expressions over the whole document and only the
+        lines that end with a dash that is not after a space are checked for hyphenated words,
+        looking only at the end of the line.
+
+        :param document: The non-empty lines without white space at their edges, joined with new
+            lines.
+        :param fix_hyphenated_words: Whether to try to join hyphenated word segments back
+            together as well.
+        :return: The joined lines.
+        '''
+        if fix_hyphenated_words:
+            get_hyphenated_word = self._get_hyphenated_word
+            is_only_dashed_word_known = self._is_only_dashed_word_known
+            parts = []
+            start = 0
+            for match in self.dash_end_re.finditer(document):
+                dash = match.start() - 1
+                last_word = get_hyphenated_word(document, dash)
+                if last_word is not None and not is_only_dashed_word_known(
+                    last_word, document, dash + 2
+                ):
+                    parts.append(document[start:dash])
+                    start = dash + 2 # Remove the hyphen and the new line.
+            if parts:
+                parts.append(document[start:])
+                document = ''.join(parts)
+
+        # Line ends with a dash, em dash, or slash that is not after a space are joined without a
+        # space and the rest are joined with a space.
+        return self.no_space_end_re.sub('', document).replace('\n', ' ')
 
     def join_lines(
         self,
@@ -101,21 +248,108 @@ class RBLineJoiner(LineJoiner):
         if lines == []:
             return ''
 
-        # Add a space between lines where appropriate.
-        new_lines = []
-        last_line_index = len(lines) - 1
+        # Join the lines into a document with a new line between them to find all the line ends
+        # in one go, unless some lines contain new lines.
+        document = '\n'.join(lines)
+        if document.count('\n') != len(lines) - 1:
+            end_line = self._end_line
+            new_lines = [
+                end_line(line, next_line, fix_hyphenated_words)
+                for (line, next_line) in zip(lines, lines[1:])
+            ]
+            new_lines.append(lines[-1])
+            return ''.join(new_lines)
+
+        return self._join_document(document, fix_hyphenated_words)
+
+    def join_lines_with_mapping(
+        self,
+        lines: list[str],
+        fix_hyphenated_words: bool = False,
+    ) -> tuple[str, LineMapping]:
+        '''
+        Join a list of Maltese text lines into one string like ``join_lines`` and map every
+        character of the string back to its line and column in ``lines``.
+        This is useful for finding where a token or sentence of the joined text is in the
+        original lines, such as for highlighting it on the page of an OCR application.
+
+        :param lines: A list of Maltese text lines.
+        :param fix_hyphenated_words: Whether to try to join hyphenated word segments back
+            together as well.
+        :return: A pair consisting of the joined lines (the same as given by ``join_lines``) and
+            the ``LineMapping`` of its characters, where a space added between two lines is
+            mapped to the column just after the end of the line before it.
+        '''
+        end_line = self._end_line
+        new_lines: list[str] = []
+        output_starts = array(LineMapping.TYPECODE)
+        line_indices = array(LineMapping.TYPECODE)
+        columns = array(LineMapping.TYPECODE)
+        position = 0
+        previous_line: Optional[str] = None
         for (i, line) in enumerate(lines):
-            new_lines.append(line)
-            if i == last_line_index:
-                pass
-            elif line[-1] in self.no_space_end_chars:
-                if len(line) > 1 and line[-2] == ' ':
-                    new_lines.append(' ')
-                # Hyphen detection and correction
-                elif fix_hyphenated_words and self.is_hyphenated_word_at_end(line):
-                    new_lines.pop()
-                    new_lines.append(line[:-1]) # Remove the hyphen from the line.
-            else:
-                new_lines.append(' ')
-
-        return ''.join(new_lines)
+            stripped_line = line.strip()
+            if stripped_line == '':
+                continue
+
+            if previous_line is not None:
+                new_line = end_line(previous_line, stripped_line, fix_hyphenated_words)
+                new_lines.append(new_line)
+                position += len(new_line)
+            output_starts.append(position)
+            line_indices.append(i)
+            columns.append(len(line) - len(line.lstrip()))
+            previous_line = stripped_line
+
+        if previous_line is not None:
+            new_lines.append(previous_line)
+            position += len(previous_line)
+
+        return (
+            ''.join(new_lines),
+            LineMapping(position, output_starts, line_indices, columns),
+        )
+
+    def iter_join_lines(
+        self,
+        lines: Iterable[str],
+        fix_hyphenated_words: bool = False,
+        paragraph_separator: Optional[str] = None,
+    ) -> Iterator[str]:
+        '''
+        Join an iterable of Maltese text lines, such as a text file object, into paragraphs,
+        giving each paragraph as soon as it ends.
+        A paragraph ends at a blank line, at a page break (a form feed character), and at a line
+        that is equal to ``paragraph_separator`` (ignoring white space at its edges).
+        Each paragraph is the same as the one given by ``join_lines`` on its lines and empty
+        paragraphs are skipped.
+
+        Each line is joined as soon as the next line of its paragraph (or the end of the
+        paragraph) is known, so only the joined part of the current paragraph is kept in memory.
+
+        :param lines: An iterable of Maltese text lines.
+        :param fix_hyphenated_words: Whether to try to join hyphenated word segments back
+            together as well.
+        :param paragraph_separator: A line that separates paragraphs, if any.
+        :return: An iterator of the joined paragraphs.
+        '''
+        end_line = self._end_line
+        new_lines: list[str] = []
+        previous_line: Optional[str] = None
+        for line in self._iter_paragraph_lines(lines, paragraph_separator):
+            if line is None:
+                if previous_line is not None:
+                    new_lines.append(previous_line)
+                    yield ''.join(new_lines)
+                    new_lines = []
+                    previous_line = None
+                continue
+
+            line = line.strip()
+            if previous_line is not None:
+                new_lines.append(end_line(previous_line, line, fix_hyphenated_words))
+            previous_line = line
+
+        if previous_line is not None:
+            new_lines.append(previous_line)
+            yield ''.join(new_lines)
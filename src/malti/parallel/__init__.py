@@ -0,0 +1,5 @@
+'''
+Parallel processing of documents over multiple processes.
+'''
+
+from malti.parallel.parallel import process_documents
@@ -0,0 +1,140 @@
+'''
+Parallel processing of documents over multiple processes.
+'''
+
+import collections
+import multiprocessing
+import os
+from multiprocessing.pool import AsyncResult
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+from malti.data import Data
+from malti.defaults import Defaults
+from malti.sent_splitter import SentSplitter
+from malti.tokeniser import Tokeniser
+from malti.utils import iter_batches
+
+
+__all__ = [
+    'process_documents',
+]
+
+
+_worker_components: dict[str, Any] = {}
+'''The components created by the initialiser of the current worker process.'''
+
+
+def _init_worker(
+    split: bool,
+    tokenise: bool,
+    sent_splitter_factory: Optional[Callable[[], SentSplitter]],
+    tokeniser_factory: Optional[Callable[[], Tokeniser]],
+) -> None:
+    '''
+    Create the components used by a worker process, once when the process starts.
+
+    :param split: Whether to split the documents into sentences.
+    :param tokenise: Whether to tokenise the documents (or sentences).
+    :param sent_splitter_factory: The function that creates the sentence splitter or ``None``
+        to use the default sentence splitter.
+    :param tokeniser_factory: The function that creates the tokeniser or ``None`` to use the
+        default tokeniser.
+    '''
+    _worker_components.clear()
+    if split:
+        _worker_components['sent_splitter'] = (
+            sent_splitter_factory()
+            if sent_splitter_factory is not None
+            else Defaults.get('sent_splitter')
+        )
+    if tokenise:
+        _worker_components['tokeniser'] = (
+            tokeniser_factory()
+            if tokeniser_factory is not None
+            else Defaults.get('tokeniser')
+        )
+
+
+def _process_batch(
+    documents: list[str],
+) -> list[Union[list[str], list[list[str]]]]:
+    '''
+    Process a batch of documents in a worker process using the components created by
+    ``_init_worker``.
+
+    :param documents: The documents.
+    :return: The result for each document.
+    '''
+    splitter: Optional[SentSplitter] = _worker_components.get('sent_splitter')
+    tokeniser: Optional[Tokeniser] = _worker_components.get('tokeniser')
+    if splitter is None:
+        assert tokeniser is not None
+        return list(tokeniser.tokenise_batch(documents))
+    if tokeniser is None:
+        return [splitter.split(document) for document in documents]
+    return [tokeniser.tokenise_batch(splitter.split(document)) for document in documents]
+
+
+def process_documents(
+    documents: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    split: bool = True,
+    tokenise: bool = True,
+    sent_splitter_factory: Optional[Callable[[], SentSplitter]] = None,
+    tokeniser_factory: Optional[Callable[[], Tokeniser]] = None,
+) -> Iterator[Union[list[str], list[list[str]]]]:
+    '''
+    Sentence split and/or tokenise documents in parallel over a pool of worker processes,
+    yielding the result of each document in the same order as the documents.
+
+    Each worker process creates its components once when it starts and then processes batches
+    of ``chunksize`` documents.
+    The data resources are loaded before the worker processes are started (see
+    ``malti.data.Data.preload``), so that forked worker processes share them.
+    The documents are read from the iterable as they are needed, with at most two batches for
+    each worker read ahead of the results being consumed, so the documents can be an iterator
+    over a corpus that does not fit in memory.
+
+    The result of each document depends on the stages used:
+
+    * Splitting and tokenising: A list of sentences, each of which is a list of tokens.
+    * Splitting only: A list of sentences.
+    * Tokenising only: A list of tokens.
+
+    :param documents: The documents to process.
+    :param workers: The number of worker processes or ``None`` to use the number of CPUs.
+    :param chunksize: The number of documents to send to a worker process at a time.
+    :param split: Whether to split the documents into sentences.
+    :param tokenise: Whether to tokenise the documents (or sentences if ``split`` is ``True``).
+    :param sent_splitter_factory: A function without arguments (or class) that creates the
+        sentence splitter in each worker process or ``None`` to use the default sentence
+        splitter (see ``malti.defaults.Defaults``).
+        This must be picklable, such as a function or class defined at the top level of a module.
+    :param tokeniser_factory: A function without arguments (or class) that creates the tokeniser
+        in each worker process or ``None`` to use the default tokeniser (see
+        ``malti.defaults.Defaults``).
+        This must be picklable, such as a function or class defined at the top level of a module.
+    :return: An iterator of the results of each document.
+    '''
+    if not split and not tokenise:
+        raise ValueError('At least one of split and tokenise must be True.')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError('workers must be a positive integer.')
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer.')
+
+    Data.preload()
+    with multiprocessing.Pool(
+        workers,
+        _init_worker,
+        (split, tokenise, sent_splitter_factory, tokeniser_factory),
+    ) as pool:
+        pending: collections.deque[AsyncResult] = collections.deque()
+        for batch in iter_batches(documents, chunksize):
+            pending.append(pool.apply_async(_process_batch, (batch,)))
+            if len(pending) >= 2*workers:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
@@ -0,0 +1,5 @@
+'''
+Streaming pipelines that chain the text processors.
+'''
+
+from malti.pipeline.pipeline import Pipeline
@@ -0,0 +1,219 @@
+'''
+A streaming pipeline that chains a line joiner, a sentence splitter, and a tokeniser.
+'''
+
+from typing import Any, Iterable, Iterator, Optional
+from malti.defaults import Defaults
+from malti.line_joiner import LineJoiner
+from malti.sent_splitter import SentSplitter
+from malti.tokeniser import Tokeniser
+from malti.utils import iter_batches
+
+
+__all__ = [
+    'Pipeline',
+]
+
+
+class Pipeline:
+    '''
+    A pipeline that processes a stream of text lines or documents with any of the following
+    stages, in this order:
+
+    * ``'join_lines'``: Join the lines into paragraphs with a line joiner (see
+      ``malti.line_joiner.LineJoiner.iter_join_lines``).
+      The output of each paragraph is its text.
+    * ``'split'``: Split each paragraph (or document) into sentences with a sentence splitter.
+      The output of each paragraph is its list of sentences.
+    * ``'tokenise'``: Tokenise each sentence (or each paragraph if not splitting) with a
+      tokeniser.
+      The output of each paragraph is its list of token lists (or its list of tokens if not
+      splitting).
+
+    Each stage is a generator that lazily passes on chunks of paragraphs to the next stage, so
+    that only one chunk of ``chunk_size`` paragraphs (together with all their sentences and
+    tokens) is in memory at a time, regardless of the size of the input.
+    Sentences are tokenised with ``tokenise_batch`` in batches of up to ``batch_size`` sentences,
+    which avoids the overhead of tokenising each short sentence separately.
+    Since all the sentences of a chunk are tokenised before any of its paragraphs are given,
+    ``batch_size`` only sets the size of each call to ``tokenise_batch``: the memory used and the
+    delay before the first output depend on ``chunk_size`` instead.
+    '''
+
+    STAGES = ['join_lines', 'split', 'tokenise']
+    '''The names of the stages in the order that they are run.'''
+
+    def __init__(
+        self,
+        stages: Optional[Iterable[str]] = None,
+        outputs: Optional[Iterable[str]] = None,
+        line_joiner: Optional[LineJoiner] = None,
+        sent_splitter: Optional[SentSplitter] = None,
+        tokeniser: Optional[Tokeniser] = None,
+        fix_hyphenated_words: bool = False,
+        paragraph_separator: Optional[str] = None,
+        chunk_size: int = 64,
+        batch_size: int = 1024,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param stages: The names of the stages to run (in any order) or ``None`` to run all of
+            them.
+        :param outputs: The names of the stages whose outputs to give or ``None`` to only give
+            the output of the last stage.
+            These must be among the stages that are run.
+        :param line_joiner: The line joiner to use or ``None`` to use the default one (see
+            ``malti.defaults.Defaults``).
+        :param sent_splitter: The sentence splitter to use or ``None`` to use the default one.
+        :param tokeniser: The tokeniser to use or ``None`` to use the default one.
+        :param fix_hyphenated_words: Whether the line joiner should try to join hyphenated word
+            segments back together as well.
+        :param paragraph_separator: A line that separates paragraphs, if any, in addition to
+            blank lines and page breaks.
+        :param chunk_size: The number of paragraphs (or documents) to process at a time.
+        :param batch_size: The maximum number of sentences (or documents) to pass to each call
+            of ``tokenise_batch``.
+            This does not limit how many sentences are kept in memory, which are all those of a
+            chunk.
+        '''
+        stage_set = set(self.STAGES if stages is None else stages)
+        for stage in stage_set:
+            if stage not in self.STAGES:
+                raise ValueError(f'Unknown stage \'{stage}\'.')
+        if not stage_set:
+            raise ValueError('At least one stage must be run.')
+        self.stages = [stage for stage in self.STAGES if stage in stage_set]
+
+        output_set = set(self.stages[-1:] if outputs is None else outputs)
+        for output in output_set:
+            if output not in stage_set:
+                raise ValueError(f'The output \'{output}\' is not of a stage that is run.')
+        if not output_set:
+            raise ValueError('At least one output must be given.')
+        self.outputs = [stage for stage in self.STAGES if stage in output_set]
+
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer.')
+        if batch_size < 1:
+            raise ValueError('batch_size must be a positive integer.')
+
+        self.line_joiner: Optional[LineJoiner] = None
+        if 'join_lines' in stage_set:
+            self.line_joiner = (
+                line_joiner if line_joiner is not None else Defaults.get('line_joiner')
+            )
+        self.sent_splitter: Optional[SentSplitter] = None
+        if 'split' in stage_set:
+            self.sent_splitter = (
+                sent_splitter if sent_splitter is not None else Defaults.get('sent_splitter')
+            )
+        self.tokeniser: Optional[Tokeniser] = None
+        if 'tokenise' in stage_set:
+            self.tokeniser = tokeniser if tokeniser is not None else Defaults.get('tokeniser')
+        self.fix_hyphenated_words = fix_hyphenated_words
+        self.paragraph_separator = paragraph_separator
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+
+    def run(
+        self,
+        source: Iterable[str],
+    ) -> Iterator[dict[str, Any]]:
+        '''
+        Process a stream of text, giving the outputs of each paragraph (or document) as soon as
+        its chunk is processed.
+
+        :param source: An iterable of text lines (such as a text file object) if the
+            ``'join_lines'`` stage is run, otherwise an iterable of documents, each of which is
+            processed on its own.
+        :return: An iterator of dictionaries, one for each paragraph (or document), mapping the
+            name of each selected output stage to its output.
+        '''
+        chunks = self._join_lines_stage(source)
+        if self.sent_splitter is not None:
+            chunks = self._split_stage(chunks)
+        if self.tokeniser is not None:
+            chunks = self._tokenise_stage(chunks)
+
+        outputs = self.outputs
+        for chunk in chunks:
+            for record in chunk:
+                yield {output: record[output] for output in outputs}
+
+    def _join_lines_stage(
+        self,
+        source: Iterable[str],
+    ) -> Iterator[list[dict[str, Any]]]:
+        '''
+        The first stage, which joins the lines into paragraphs (if the stage is run) and groups
+        the paragraphs into chunks.
+        Each paragraph is represented by a dictionary with its text under ``'text'`` and its
+        text under ``'join_lines'`` if the stage is run.
+
+        :param source: The lines or documents.
+        :return: An iterator of chunks of paragraphs.
+        '''
+        if self.line_joiner is None:
+            for chunk in iter_batches(source, self.chunk_size):
+                yield [{'text': text} for text in chunk]
+        else:
+            paragraphs = self.line_joiner.iter_join_lines(
+                source, self.fix_hyphenated_words, self.paragraph_separator,
+            )
+            for chunk in iter_batches(paragraphs, self.chunk_size):
+                yield [{'text': text, 'join_lines': text} for text in chunk]
+
+    def _split_stage(
+        self,
+        chunks: Iterable[list[dict[str, Any]]],
+    ) -> Iterator[list[dict[str, Any]]]:
+        '''
+        The stage that splits each paragraph into sentences, added under ``'split'``.
+
+        :param chunks: The chunks of paragraphs.
+        :return: An iterator of the chunks of paragraphs.
+        '''
+        assert self.sent_splitter is not None
+        split = self.sent_splitter.split
+        for chunk in chunks:
+            for record in chunk:
+                record['split'] = split(record['text'])
+            yield chunk
+
+    def _tokenise_stage(
+        self,
+        chunks: Iterable[list[dict[str, Any]]],
+    ) -> Iterator[list[dict[str, Any]]]:
+        '''
+        The stage that tokenises the sentences of each paragraph (or each paragraph if the
+        sentences were not split), added under ``'tokenise'``.
+        The sentences of a chunk are tokenised together in batches of up to ``batch_size``, and
+        the chunk is only given once all of them are tokenised.
+
+        :param chunks: The chunks of paragraphs.
+        :return: An iterator of the chunks of paragraphs.
+        '''
+        assert self.tokeniser is not None
+        tokenise_batch = self.tokeniser.tokenise_batch
+        batch_size = self.batch_size
+        for chunk in chunks:
+            if self.sent_splitter is None:
+                texts = [record['text'] for record in chunk]
+            else:
+                texts = [sentence for record in chunk for sentence in record['split']]
+
+            token_lists: list[list[str]] = []
+            for i in range(0, len(texts), batch_size):
+                token_lists.extend(tokenise_batch(texts[i:i + batch_size]))
+
+            if self.sent_splitter is None:
+                for (record, tokens) in zip(chunk, token_lists):
+                    record['tokenise'] = tokens
+            else:
+                position = 0
+                for record in chunk:
+                    num_sentences = len(record['split'])
+                    record['tokenise'] = token_lists[position:position + num_sentences]
+                    position += num_sentences
+            yield chunk
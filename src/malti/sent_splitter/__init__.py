@@ -4,6 +4,12 @@ Sentence splitters for Maltese text.
 
 from malti.sent_splitter.sent_splitter import SentSplitter
 from malti.sent_splitter.km_sent_splitter.km_sent_splitter import KMSentSplitter
+from malti.sent_splitter.rb_sent_splitter.rb_sent_splitter import RBSentSplitter
+from malti.sent_splitter.cached_sent_splitter import CachedSentSplitter
+from malti.defaults import Defaults
+
+
+Defaults.register('sent_splitter', KMSentSplitter)
 
 
 def split(
@@ -12,8 +18,11 @@ def split(
     '''
     Default sentence splitter.
     In this version, ``KMSentenceSplitter`` is used.
+    The sentence splitter is created once and reused on every call (see
+    ``malti.defaults.Defaults``).
 
     :param text: The text to split.
     :return: The list of sentences.
     '''
-    return KMSentSplitter().split(text)
+    splitter: SentSplitter = Defaults.get('sent_splitter')
+    return splitter.split(text)
@@ -0,0 +1,113 @@
+'''
+A sentence splitter that caches the results of another sentence splitter.
+'''
+
+from typing import Iterable, Iterator, Optional, TextIO, Union
+from malti.sent_splitter.sent_splitter import SentSplitter
+from malti.utils import DEFAULT_CHUNK_SIZE, LRUCache
+
+
+__all__ = [
+    'CachedSentSplitter',
+]
+
+
+class CachedSentSplitter(SentSplitter):
+    '''
+    A wrapper around another sentence splitter that remembers the results of ``split`` and
+    ``split_indices`` for recently seen texts in a bounded least recently used cache.
+    This is useful when the same texts (such as boilerplate paragraphs) occur many times.
+
+    Results are kept in the cache as tuples and a new list is returned on every call, so
+    modifying a returned list does not affect the cache.
+    '''
+
+    def __init__(
+        self,
+        splitter: SentSplitter,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = 64*1024**2,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param splitter: The sentence splitter whose results to cache.
+        :param max_entries: The maximum number of results in the cache or ``None`` for no limit.
+        :param max_bytes: The maximum approximate number of bytes taken by the texts and results
+            in the cache or ``None`` for no limit.
+        '''
+        super().__init__()
+        self.splitter = splitter
+        self._cache: LRUCache[tuple[str, str], tuple] = LRUCache(max_entries, max_bytes)
+
+    def split(
+        self,
+        text: str,
+    ) -> list[str]:
+        '''
+        Split a text into a list of sentences.
+
+        :param text: The text to split.
+        :return: The list of sentences.
+        '''
+        key = ('split', text)
+        sentences = self._cache.get(key)
+        if sentences is None:
+            sentences = tuple(self.splitter.split(text))
+            self._cache.put(key, sentences)
+        return list(sentences)
+
+    def split_indices(
+        self,
+        text: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Split a text into sentences and return the indices of the sentences.
+        A list of integer pair tuples ``[(i, j)]`` is returned such that ``text[i:j]`` is a
+        sentence as it appears in the text.
+
+        :param text: The text to split.
+        :return: The list of tuple pairs containing integers specifying the locations of the
+            sentences in the text.
+        '''
+        key = ('split_indices', text)
+        indices = self._cache.get(key)
+        if indices is None:
+            indices = tuple(self.splitter.split_indices(text))
+            self._cache.put(key, indices)
+        return list(indices)
+
+    def iter_split(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        '''
+        Split a text that is read from a stream, yielding the sentences one by one.
+        The sentences are the same as those returned by ``split`` on the whole text.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of sentences.
+        '''
+        return self.splitter.iter_split(stream, chunk_size)
+
+    def get_cache_stats(
+        self,
+    ) -> dict[str, int]:
+        '''
+        Get statistics about the use of the result cache.
+
+        :return: A dictionary with the number of ``hits``, ``misses``, and ``evictions`` so far,
+            together with the current number of results (``size``) and approximate number of
+            bytes (``bytes``) in the cache.
+        '''
+        return self._cache.get_stats()
+
+    def clear_cache(
+        self,
+    ) -> None:
+        '''
+        Remove all the results from the cache and reset its statistics.
+        '''
+        self._cache.clear()
@@ -3,8 +3,14 @@ Korpus Malti sentence splitter.
 '''
 
 import os
+import tempfile
+import threading
+import weakref
+from typing import Iterable, Iterator, Optional, TextIO, Union
 import sentence_splitter
+from malti.data import Data, NonBreakingPrefixIndex
 from malti.sent_splitter.sent_splitter import SentSplitter
+from malti.utils import DEFAULT_CHUNK_SIZE
 
 
 __all__ = [
@@ -12,25 +18,80 @@ __all__ = [
 ]
 
 
+_library_splitters: weakref.WeakKeyDictionary[
+    NonBreakingPrefixIndex, tuple[int, sentence_splitter.SentenceSplitter]
+] = weakref.WeakKeyDictionary()
+'''The ``sentence_splitter`` package's sentence splitter made from each non-breaking prefix index
+together with the version of the index it was made from.'''
+
+_library_splitters_lock = threading.Lock()
+'''The lock for ``_library_splitters``.'''
+
+
+def _get_library_splitter(
+    prefix_index: NonBreakingPrefixIndex,
+) -> sentence_splitter.SentenceSplitter:
+    '''
+    Get a ``sentence_splitter`` package sentence splitter that uses the prefixes in an index.
+    The splitter only reads its prefixes from a file, so the index is written to a temporary file
+    in the ``sentence_splitter`` text format and the splitter is shared by everything that uses
+    the same version of the index.
+    Each change to the index makes the next call rebuild the splitter from the whole index.
+
+    :param prefix_index: The index.
+    :return: The sentence splitter.
+    '''
+    with _library_splitters_lock:
+        (version, splitter) = _library_splitters.get(prefix_index, (-1, None))
+        if splitter is None or version != prefix_index.version:
+            version = prefix_index.version
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                prefix_file = os.path.join(tmp_dir, 'non_breaking_prefixes.txt')
+                with open(prefix_file, 'w', encoding='utf-8') as f:
+                    f.write(prefix_index.to_text())
+                splitter = sentence_splitter.SentenceSplitter(
+                    language='it',
+                    non_breaking_prefix_file=prefix_file,
+                )
+            _library_splitters[prefix_index] = (version, splitter)
+        return splitter
+
+
 class KMSentSplitter(SentSplitter):
     '''
     The sentence splitter used by the MLRS Korpus Malti corpus.
+
+    The splitter of the ``sentence_splitter`` package that does the work only takes its prefixes
+    from a file, so it is rebuilt from the whole index (writing and reading back all the
+    prefixes, which takes a few milliseconds) on the first call to ``split`` after each change
+    to the index, such as ``malti.data.Data.add_non_breaking_prefixes``.
+    It is shared by all the splitters that use the same index, so this happens once per change.
+    To add abbreviations often at runtime, use ``RBSentSplitter`` instead, which looks the
+    prefixes up in the index directly and so sees additions at no cost.
     '''
 
     def __init__(
         self,
+        non_breaking_prefixes: Optional[NonBreakingPrefixIndex] = None,
     ) -> None:
         '''
         Constructor.
+
+        :param non_breaking_prefixes: The index of words that do not end a sentence when
+            followed by a full stop.
+            If ``None`` then the Maltese prefixes shared by all sentence splitters (see
+            ``malti.data.Data.get_non_breaking_prefixes``) are used.
+            Prefixes added to the index later are also used, at the cost of rebuilding the
+            splitter as described above.
         '''
         super().__init__()
-        self._spltter = sentence_splitter.SentenceSplitter(
-            language='it',
-            non_breaking_prefix_file=os.path.join(
-                os.path.dirname(__file__),
-                'mt_non_breaking_prefixes.txt',
-            ),
+        self.prefix_index = (
+            non_breaking_prefixes
+            if non_breaking_prefixes is not None
+            else Data.get_non_breaking_prefixes()
         )
+        self._prefix_index_version = self.prefix_index.version
+        self._spltter = _get_library_splitter(self.prefix_index)
 
     def split(
         self,
@@ -42,4 +103,24 @@ class KMSentSplitter(SentSplitter):
         :param text: The text to split.
         :return: The list of sentences.
         '''
+        if self._prefix_index_version != self.prefix_index.version:
+            self._prefix_index_version = self.prefix_index.version
+            self._spltter = _get_library_splitter(self.prefix_index)
         return self._spltter.split(text)
+
+    def iter_split(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        '''
+        Split a text that is read from a stream, yielding the sentences one by one.
+        The sentences are the same as those returned by ``split`` on the whole text.
+        Memory use is bounded by the chunk size (or the longest stretch of text without a new
+        line that is followed by a word, possibly indented with spaces).
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of sentences.
+        '''
+        return self._iter_split_at_line_breaks(stream, chunk_size)
@@ -0,0 +1,3 @@
+'''
+Rule-based sentence splitter.
+'''
@@ -0,0 +1,430 @@
+'''
+Rule-based sentence splitter that gives the same sentences as the Korpus Malti sentence splitter
+in a single scan over the text.
+'''
+
+import re
+import unicodedata
+from typing import Iterable, Iterator, Optional, TextIO, Union
+from malti.data import Data, NonBreakingPrefixIndex
+from malti.sent_splitter.sent_splitter import SentSplitter
+from malti.utils import DEFAULT_CHUNK_SIZE
+
+
+__all__ = [
+    'RBSentSplitter',
+]
+
+
+class RBSentSplitter(SentSplitter):
+    '''
+    A drop-in replacement for ``KMSentSplitter`` that gives exactly the same sentences without
+    using the ``sentence_splitter`` package.
+
+    ``KMSentSplitter`` (the Moses sentence splitter heuristics by Philipp Koehn and Josh
+    Schroeder) turns runs of spaces into sentence breaks in four regular expression substitution
+    passes over the text followed by a pass over every word ending in a full stop to check for
+    non-breaking prefixes.
+    Since every one of these rules only looks at the characters around a run of spaces, this
+    splitter finds the runs of spaces that come after a character that could end a sentence in a
+    single scan and applies all the rules to each of them in turn.
+
+    Characters are classified with Python's ``unicodedata``, which may differ from the
+    ``regex`` package used by ``KMSentSplitter`` for characters that were only added in later
+    versions of Unicode.
+    '''
+
+    INITIAL_PUNCTUATION = frozenset(
+        '«‘‛“‟‹⸂⸄⸉⸌⸜⸠'
+    )
+    '''The Unicode initial punctuation characters (general category Pi), such as ``«``.'''
+
+    FINAL_PUNCTUATION = frozenset(
+        '»’”›⸃⸅⸊⸍⸝⸡'
+    )
+    '''The Unicode final punctuation characters (general category Pf), such as ``»``.'''
+
+    OPENING_CHARS = frozenset('\'"([¿¡') | INITIAL_PUNCTUATION
+    '''The characters that can come before the first letter of a sentence.'''
+
+    QUOTE_OPENING_CHARS = OPENING_CHARS - {'('}
+    '''The characters that can come before the first letter of a sentence after a sentence ending
+    punctuation mark without a closing character.'''
+
+    CLOSING_CHARS = frozenset('\'")]') | FINAL_PUNCTUATION
+    '''The characters that can come after the punctuation mark at the end of a sentence.'''
+
+    PREFIX_CLOSING_CHARS = CLOSING_CHARS | {'%'}
+    '''The characters that can come between a word and a full stop without the word being treated
+    as a non-breaking prefix.'''
+
+    ENDING_CHARS = frozenset('?!.\n') | CLOSING_CHARS
+    '''The characters that a run of spaces must come after in order to be a possible sentence
+    break.'''
+
+    def __init__(
+        self,
+        non_breaking_prefix_file: Optional[str] = None,
+        non_breaking_prefixes: Optional[NonBreakingPrefixIndex] = None,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param non_breaking_prefix_file: The path to a file with the words that do not end a
+            sentence when followed by a full stop, one per line, in the format used by the
+            ``sentence_splitter`` package.
+            Lines containing ``#NUMERIC_ONLY#`` are prefixes that only do not end a sentence when
+            followed by a number and anything after a ``#`` is a comment.
+        :param non_breaking_prefixes: The index of words that do not end a sentence when
+            followed by a full stop, which is used instead of ``non_breaking_prefix_file``.
+            If both are ``None`` then the Maltese prefixes shared by all sentence splitters (see
+            ``malti.data.Data.get_non_breaking_prefixes``) are used.
+            Prefixes added to the index later are also used.
+        '''
+        super().__init__()
+        if non_breaking_prefixes is not None:
+            self.prefix_index = non_breaking_prefixes
+        elif non_breaking_prefix_file is not None:
+            self.prefix_index = NonBreakingPrefixIndex.from_file(non_breaking_prefix_file)
+        else:
+            self.prefix_index = Data.get_non_breaking_prefixes()
+        # The index's sets are modified in place when prefixes are added.
+        self.non_breaking_prefixes = self.prefix_index.non_breaking_prefixes
+        self.numeric_only_prefixes = self.prefix_index.numeric_only_prefixes
+
+        self._candidate_finditer = re.compile(
+            f'(?<=[{re.escape("".join(sorted(self.ENDING_CHARS)))}]) +'
+        ).finditer
+        self._spaces_sub = re.compile(' {2,}').sub
+
+    @staticmethod
+    def _is_letter(
+        char: str,
+    ) -> bool:
+        '''
+        Check if a character is an upper case letter or other letter (general category Lu or Lo,
+        which includes letters without case).
+
+        :param char: The character.
+        :return: Whether the character is an upper case or other letter.
+        '''
+        if char < '\x80':
+            return 'A' <= char <= 'Z'
+        return unicodedata.category(char) in ('Lu', 'Lo')
+
+    @staticmethod
+    def _is_prefix_char(
+        char: str,
+    ) -> bool:
+        '''
+        Check if a character can be part of a non-breaking prefix, which consists of word
+        characters, full stops, and dashes.
+        Word characters are alphabetic characters, decimal digits, marks, connector punctuation,
+        and joining controls, as in the ``regex`` package.
+
+        :param char: The character.
+        :return: Whether the character can be part of a prefix.
+        '''
+        if char < '\x80':
+            return char.isalnum() or char in '_.-'
+        category = unicodedata.category(char)
+        if char.isalnum():
+            return category != 'No'
+        return (
+            category in ('Mn', 'Mc', 'Me', 'Pc')
+            or char in '‌‍'
+            # Circled and squared letters, which are symbols that are alphabetic.
+            or 'Ⓐ' <= char <= 'ⓩ'
+            or '\U0001f130' <= char <= '\U0001f149'
+            or '\U0001f150' <= char <= '\U0001f169'
+            or '\U0001f170' <= char <= '\U0001f189'
+        )
+
+    def _starts_sentence(
+        self,
+        text: str,
+        start: int,
+        opening_chars: frozenset[str],
+        allow_spaces: bool,
+    ) -> int:
+        '''
+        Check if a text has the start of a sentence at a given index, that is, any number of
+        opening characters (optionally followed by spaces) followed by an upper case or other
+        letter.
+
+        :param text: The text.
+        :param start: The index in the text.
+        :param opening_chars: The characters that can come before the letter.
+        :param allow_spaces: Whether spaces can come between the opening characters and the
+            letter.
+        :return: The index of the letter or -1 if there is no start of a sentence.
+        '''
+        size = len(text)
+        i = start
+        while i < size and text[i] in opening_chars:
+            i += 1
+        if allow_spaces:
+            while i < size and text[i] == ' ':
+                i += 1
+        if i < size and self._is_letter(text[i]):
+            return i
+        return -1
+
+    def _breaks_after_punctuation(
+        self,
+        text: str,
+        start: int,
+        end: int,
+    ) -> bool:
+        '''
+        Check if a run of spaces is a sentence break according to the first three rules, in
+        which a question mark, exclamation mark, or multiple full stops, or any sentence ending
+        punctuation mark followed by closing characters, are followed by the start of a sentence.
+
+        :param text: The text.
+        :param start: The index of the start of the run of spaces.
+        :param end: The index of the end of the run of spaces.
+        :return: Whether the run of spaces is a sentence break.
+        '''
+        last_char = text[start - 1]
+
+        # A question or exclamation mark followed by the start of a sentence.
+        if last_char in '?!':
+            return self._starts_sentence(text, end, self.OPENING_CHARS, False) != -1
+
+        # Multiple full stops followed by the start of a sentence.
+        if last_char == '.':
+            return (
+                start >= 2 and text[start - 2] == '.'
+                and self._starts_sentence(text, end, self.OPENING_CHARS, False) != -1
+            )
+
+        # A sentence ending punctuation mark and closing characters (such as a closing quote)
+        # followed by the start of a sentence.
+        if last_char in self.CLOSING_CHARS:
+            i = start - 2
+            while i >= 0 and text[i] in self.CLOSING_CHARS:
+                i -= 1
+            while i >= 0 and text[i] == ' ':
+                i -= 1
+            return (
+                i >= 0 and text[i] in '?!.'
+                and self._starts_sentence(text, end, self.OPENING_CHARS, True) != -1
+            )
+
+        return False
+
+    def _breaks_before_quote(
+        self,
+        text: str,
+        start: int,
+        end: int,
+    ) -> bool:
+        '''
+        Check if a run of spaces is a sentence break according to the fourth rule, in which a
+        sentence ending punctuation mark is followed by opening quotes and the start of a
+        sentence.
+
+        :param text: The text.
+        :param start: The index of the start of the run of spaces.
+        :param end: The index of the end of the run of spaces.
+        :return: Whether the run of spaces is a sentence break.
+        '''
+        if text[start - 1] not in '?!.' or end == len(text):
+            return False
+        if text[end] not in self.QUOTE_OPENING_CHARS:
+            return False
+        letter = self._starts_sentence(text, end, self.QUOTE_OPENING_CHARS, True)
+        if letter == -1:
+            return False
+
+        # Any spaces between the quotes and the letter must not have been turned into a sentence
+        # break by the previous rules.
+        spaces_start = letter
+        while text[spaces_start - 1] == ' ':
+            spaces_start -= 1
+        return (
+            spaces_start == letter
+            or not self._breaks_after_punctuation(text, spaces_start, letter)
+        )
+
+    def _breaks_after_full_stop(
+        self,
+        text: str,
+        start: int,
+        end: int,
+    ) -> bool:
+        '''
+        Check if a run of spaces after a word ending in a full stop is a sentence break, that is,
+        if the word is not a non-breaking prefix or an upper case acronym and the next word is
+        the start of a sentence or a number.
+
+        :param text: The text.
+        :param start: The index of the start of the run of spaces.
+        :param end: The index of the end of the run of spaces.
+        :return: Whether the run of spaces is a sentence break.
+        '''
+        # The word may end in a new line after the full stops.
+        word_end = start - 1 if text[start - 1] == '\n' else start
+        if word_end == 0 or text[word_end - 1] != '.':
+            return False
+
+        # Find the prefix (word characters, full stops, and dashes) and closing characters before
+        # the last full stops.
+        i = word_end - 1
+        while i >= 0 and text[i] == '.':
+            i -= 1
+        if i >= 0 and text[i] in self.PREFIX_CLOSING_CHARS:
+            while i >= 0 and text[i] in self.PREFIX_CLOSING_CHARS:
+                i -= 1
+            has_closing_chars = True
+            prefix_end = i + 1
+        else:
+            has_closing_chars = False
+            prefix_end = word_end - 1 # Only the last full stop is not part of the prefix.
+        while i >= 0 and self._is_prefix_char(text[i]):
+            i -= 1
+        prefix = text[i + 1:prefix_end]
+
+        if not has_closing_chars and prefix in self.non_breaking_prefixes:
+            return False
+
+        # An upper case acronym such as 'U.S.A.'.
+        i = word_end - 1
+        while i >= 0 and text[i] == '.':
+            i -= 1
+        letters_end = i
+        while i >= 0 and (text[i] == '-' or self._is_letter(text[i])):
+            i -= 1
+        if 0 <= i < letters_end and text[i] == '.':
+            return False
+
+        # The next word must be the start of a sentence or a number.
+        letter = end
+        size = len(text)
+        while letter < size and text[letter] in self.OPENING_CHARS:
+            letter += 1
+        if letter == size:
+            return False
+        next_char = text[letter]
+        if '0' <= next_char <= '9':
+            return (
+                has_closing_chars
+                or prefix not in self.numeric_only_prefixes
+                or letter != end
+            )
+        return self._is_letter(next_char)
+
+    def _find_breaks(
+        self,
+        text: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Find the runs of spaces in a text that are sentence breaks.
+
+        :param text: The text.
+        :return: The list of index pairs of the start and end of each sentence break.
+        '''
+        breaks: list[tuple[int, int]] = []
+        for match in self._candidate_finditer(text):
+            (start, end) = match.span()
+            if (
+                self._breaks_after_punctuation(text, start, end)
+                or self._breaks_before_quote(text, start, end)
+                or self._breaks_after_full_stop(text, start, end)
+            ):
+                breaks.append((start, end))
+        return breaks
+
+    def split(
+        self,
+        text: str,
+    ) -> list[str]:
+        '''
+        Split a text into a list of sentences.
+
+        :param text: The text to split.
+        :return: The list of sentences.
+        '''
+        if not text:
+            return []
+
+        parts: list[str] = []
+        last_end = 0
+        for (start, end) in self._find_breaks(text):
+            parts.append(text[last_end:start])
+            parts.append('\n')
+            last_end = end
+        parts.append(text[last_end:])
+        text = self._spaces_sub(' ', ''.join(parts))
+
+        text = text.replace('\n ', '\n').replace(' \n', '\n').strip()
+        return text.split('\n')
+
+    def iter_split(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        '''
+        Split a text that is read from a stream, yielding the sentences one by one.
+        The sentences are the same as those returned by ``split`` on the whole text.
+        Memory use is bounded by the chunk size (or the longest stretch of text without a new
+        line that is followed by a word, possibly indented with spaces).
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of sentences.
+        '''
+        return self._iter_split_at_line_breaks(stream, chunk_size)
+
+    def split_indices(
+        self,
+        text: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Split a text into sentences and return the indices of the sentences.
+        A list of integer pair tuples ``[(i, j)]`` is returned, one for each sentence returned by
+        ``split``, such that ``text[i:j]`` is the sentence as it appears in the text, that is,
+        before any runs of spaces in it were replaced by a single space.
+        Empty sentences (such as those from blank lines) start and end after the new line that
+        comes before them.
+
+        The indices are found from the sentence breaks directly, without building the sentences.
+
+        :param text: The text to split.
+        :return: The list of tuple pairs containing integers specifying the locations of the
+            sentences in the text.
+        '''
+        if not text:
+            return []
+        text_start = len(text) - len(text.lstrip())
+        text_end = len(text.rstrip())
+        if text_start >= text_end:
+            position = text.find('\n') + 1
+            return [(position, position)]
+
+        # The sentences are separated by the sentence breaks and the new lines in the text.
+        separators = self._find_breaks(text)
+        new_line = text.find('\n', text_start, text_end)
+        if new_line != -1:
+            while new_line != -1:
+                separators.append((new_line, new_line + 1))
+                new_line = text.find('\n', new_line + 1, text_end)
+            separators.sort()
+        separators.append((text_end, text_end))
+
+        indices: list[tuple[int, int]] = []
+        start = text_start
+        for (separator_start, separator_end) in separators:
+            (sentence_start, end) = (start, separator_start)
+            while sentence_start < end and text[sentence_start] == ' ':
+                sentence_start += 1
+            if sentence_start == end:
+                indices.append((start, start))
+            else:
+                while text[end - 1] == ' ':
+                    end -= 1
+                indices.append((sentence_start, end))
+            start = separator_end
+        return indices
@@ -2,7 +2,10 @@
 A sentence splitter.
 '''
 
+import re
 from abc import ABC
+from typing import Callable, Iterable, Iterator, Optional, TextIO, Union
+from malti.utils import DEFAULT_CHUNK_SIZE, iter_chunks
 
 
 __all__ = [
@@ -10,6 +13,118 @@ __all__ = [
 ]
 
 
+_LINE_START_REGEX = re.compile(r'\n( *\S+)(?=\s)')
+'''Matches a new line together with the first word of the next line, which may be indented with
+spaces, provided that the word is followed by white space.'''
+
+_PARTIAL_LINE_START_REGEX = re.compile(r'\n *\S*')
+'''Matches a new line together with the start of the next line, which can still become a match of
+``_LINE_START_REGEX`` when more text is read.'''
+
+_LAST_LINE_START_REGEX = re.compile(f'.*{_LINE_START_REGEX.pattern}', re.DOTALL)
+'''Matches up to the first word of the last line matched by ``_LINE_START_REGEX``.'''
+
+
+def _split_cut_piece(
+    split: Callable[[str], list[str]],
+    piece: str,
+    next_word: str,
+) -> list[str]:
+    '''
+    Split a piece of text that was cut off the front of a longer text right after a new line
+    matched by ``_LINE_START_REGEX``, giving the same sentences as splitting the whole text would
+    give for that part.
+    Whether the last line of the piece ends with an empty sentence and what white space it keeps
+    depend on the first word of the next line, so the piece is split together with that word
+    and the last sentence, which is the word on its own, is dropped.
+
+    :param split: The ``split`` method of the sentence splitter.
+    :param piece: The piece of text, ending with the new line.
+    :param next_word: The first word of the next line, including any spaces before it.
+    :return: The list of sentences.
+    '''
+    return split(piece + next_word)[:-1]
+
+
+class _LineStartCutter:
+    '''
+    Cut text that is read in chunks right after new lines matched by ``_LINE_START_REGEX`` (see
+    ``_split_cut_piece``), looking at each character only a bounded number of times (apart from
+    the first word of a line that is read over several chunks).
+    '''
+
+    def __init__(
+        self,
+        piece_size: int = 0,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param piece_size: The number of characters that must be exceeded by the text that was
+            read and not cut yet before it is cut.
+        '''
+        self.piece_size = piece_size
+        self._parts: list[str] = []
+        self._length = 0
+        self._window = '' # The end of the text where a new line can still be matched.
+        self._cut = 0 # Where the text can be cut (or 0 if it cannot).
+        self._next_word = ''
+
+    def add(
+        self,
+        chunk: str,
+    ) -> Optional[tuple[str, str]]:
+        '''
+        Add a chunk to the end of the text and cut the text right after its last matching new
+        line if it is longer than the piece size.
+
+        :param chunk: The chunk.
+        :return: A pair with the piece that was cut off the front of the text and the first word
+            of the line after it (as expected by ``_split_cut_piece``) or ``None`` if the text was
+            not cut.
+        '''
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        window = self._window + chunk
+        match = _LAST_LINE_START_REGEX.match(window)
+        if match is not None:
+            self._cut = self._length - len(window) + match.start(1)
+            self._next_word = match.group(1)
+            window = window[match.start(1):]
+
+        # Keep the last line if its first word may not have been read completely.
+        line_start = window.rfind('\n')
+        if line_start != -1 and _PARTIAL_LINE_START_REGEX.fullmatch(window, line_start):
+            self._window = window[line_start:]
+        else:
+            self._window = ''
+
+        if self._cut == 0 or self._length <= self.piece_size:
+            return None
+        text = ''.join(self._parts)
+        rest = text[self._cut:]
+        piece = text[:self._cut]
+        self._parts = [rest]
+        self._length = len(rest)
+        self._cut = 0
+        return (piece, self._next_word)
+
+    def finish(
+        self,
+    ) -> str:
+        '''
+        Get the text that was not cut off, once all the chunks were added.
+
+        :return: The text.
+        '''
+        text = ''.join(self._parts)
+        self._parts = []
+        self._length = 0
+        self._window = ''
+        self._cut = 0
+        return text
+
+
 class SentSplitter(ABC):
     '''
     Top-level abstract class representing all sentence splitters.
@@ -26,3 +141,88 @@ class SentSplitter(ABC):
         :return: The list of sentences.
         '''
         raise NotImplementedError()
+
+    def split_indices(
+        self,
+        text: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Split a text into sentences and return the indices of the sentences.
+        A list of integer pair tuples ``[(i, j)]`` is returned, one for each sentence returned by
+        ``split``, such that ``text[i:j]`` is the sentence as it appears in the text, that is,
+        before any runs of spaces in it were replaced by a single space.
+        Only spaces are left out at the edges of a sentence, so any other white space that
+        ``split`` keeps at the edges (such as a tab or no-break space) is included, which makes
+        the indices agree with what is found by tokenising the sentences returned by ``split``.
+        Empty sentences (such as those from blank lines) start and end after the new line that
+        comes before them.
+
+        The default behaviour is to align the sentences returned by ``split`` with the text, which
+        works for sentence splitters that only remove spaces from the text.
+
+        :param text: The text to split.
+        :return: The list of tuple pairs containing integers specifying the locations of the
+            sentences in the text.
+        '''
+        indices: list[tuple[int, int]] = []
+        position = 0
+        for sentence in self.split(text):
+            if sentence == '':
+                position = text.find('\n', position) + 1
+                indices.append((position, position))
+                continue
+
+            start = -1
+            for piece in sentence.split(' '):
+                if piece == '':
+                    continue
+                piece_start = text.find(piece, position)
+                if piece_start == -1:
+                    raise ValueError(f'The sentence {sentence!r} could not be found in the text.')
+                if start == -1:
+                    start = piece_start
+                position = piece_start + len(piece)
+            indices.append((start, position))
+        return indices
+
+    def iter_split(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        '''
+        Split a text that is read from a stream, yielding the sentences one by one.
+        The sentences are the same as those returned by ``split`` on the whole text.
+        The default behaviour is to read the whole stream into memory and split it in one go.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of sentences.
+        '''
+        yield from self.split(''.join(iter_chunks(stream, chunk_size)))
+
+    def _iter_split_at_line_breaks(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int,
+    ) -> Iterator[str]:
+        '''
+        Split a text that is read from a stream, for sentence splitters that behave like
+        ``KMSentSplitter``, whose sentences never continue past a new line and whose decisions
+        at a new line only depend on the first word of the next line (see ``_split_cut_piece``).
+        The text before a new line that is followed by a line starting with a word (indented
+        with spaces or not) can then be split on its own and get the same sentences.
+
+        Text is buffered until a chunk containing such a new line arrives, at which point all
+        the text up to the last such new line is split and discarded.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of sentences.
+        '''
+        cutter = _LineStartCutter()
+        for chunk in iter_chunks(stream, chunk_size):
+            cut = cutter.add(chunk)
+            if cut is not None:
+                yield from _split_cut_piece(self.split, *cut)
+        yield from self.split(cutter.finish())
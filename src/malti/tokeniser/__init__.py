@@ -2,9 +2,17 @@
 Tokenisers for Maltese text.
 '''
 
+from malti.tokeniser.token_indices import TokenIndices
+from malti.tokeniser.sentence_token_indices import SentenceTokenIndices
 from malti.tokeniser.tokeniser import Tokeniser
 from malti.tokeniser.regex_tokeniser import RegexTokeniser
-from malti.tokeniser.km_tokeniser.km_tokeniser import KMTokeniser
+from malti.tokeniser.km_tokeniser.km_tokeniser import KMTokeniser, KMTokenType
+from malti.tokeniser.km_scanner_tokeniser.km_scanner_tokeniser import KMScannerTokeniser
+from malti.tokeniser.cached_tokeniser import CachedTokeniser
+from malti.defaults import Defaults
+
+
+Defaults.register('tokeniser', KMTokeniser)
 
 
 def tokenise(
@@ -13,8 +21,10 @@ def tokenise(
     '''
     Default tokeniser.
     In this version, ``KMTokeniser`` is used.
+    The tokeniser is created once and reused on every call (see ``malti.defaults.Defaults``).
 
     :param text: The text to tokenise.
     :return: The list of tokens.
     '''
-    return KMTokeniser().tokenise(text)
+    tokeniser: Tokeniser = Defaults.get('tokeniser')
+    return tokeniser.tokenise(text)
@@ -0,0 +1,202 @@
+'''
+A tokeniser that caches the results of another tokeniser.
+'''
+
+from typing import Iterable, Iterator, Optional, TextIO, Union
+from malti.tokeniser.tokeniser import Tokeniser
+from malti.tokeniser.sentence_token_indices import SentenceTokenIndices
+from malti.utils import DEFAULT_CHUNK_SIZE, LRUCache
+
+
+__all__ = [
+    'CachedTokeniser',
+]
+
+
+class CachedTokeniser(Tokeniser):
+    '''
+    A wrapper around another tokeniser that remembers the results of ``tokenise`` and
+    ``tokenise_indices`` for recently seen texts in a bounded least recently used cache.
+    This is useful when the same texts (such as boilerplate sentences) occur many times.
+
+    Results are kept in the cache as tuples and a new list is returned on every call, so
+    modifying a returned list does not affect the cache.
+    The streaming methods, ``retokenise_indices``, and ``detokenise`` are passed on to the
+    wrapped tokeniser uncached, so that they keep any optimisations of the wrapped tokeniser
+    (such as incremental re-tokenisation).
+    Methods that are specific to a tokeniser class, such as the typed methods of
+    ``KMTokeniser``, are not provided and should be called on the wrapped ``tokeniser``
+    directly.
+    '''
+
+    def __init__(
+        self,
+        tokeniser: Tokeniser,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = 64*1024**2,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param tokeniser: The tokeniser whose results to cache.
+        :param max_entries: The maximum number of results in the cache or ``None`` for no limit.
+        :param max_bytes: The maximum approximate number of bytes taken by the texts and results
+            in the cache or ``None`` for no limit.
+        '''
+        super().__init__()
+        self.tokeniser = tokeniser
+        self._cache: LRUCache[tuple[str, str], tuple] = LRUCache(max_entries, max_bytes)
+
+    def tokenise(
+        self,
+        text: str,
+    ) -> list[str]:
+        '''
+        Tokenise a text into a list of tokens.
+
+        :param text: The text to tokenise.
+        :return: The list of tokens.
+        '''
+        key = ('tokenise', text)
+        tokens = self._cache.get(key)
+        if tokens is None:
+            tokens = tuple(self.tokeniser.tokenise(text))
+            self._cache.put(key, tokens)
+        return list(tokens)
+
+    def tokenise_indices(
+        self,
+        text: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Tokenise a text and return the indices of the tokens.
+        A list of integer pair tuples ``[(i, j)]`` is returned such that
+        ``text[i:j]`` is a token.
+
+        :param text: The text to tokenise.
+        :return: The list of tuple pairs containing integers specifying the
+            locations of the tokens in the text.
+        '''
+        key = ('tokenise_indices', text)
+        indices = self._cache.get(key)
+        if indices is None:
+            indices = tuple(self.tokeniser.tokenise_indices(text))
+            self._cache.put(key, indices)
+        return list(indices)
+
+    def retokenise_indices(
+        self,
+        text: str,
+        indices: list[tuple[int, int]],
+        start: int,
+        end: int,
+        replacement: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Update the indices of the tokens in a text after part of the text is replaced.
+        The result is the same as calling ``tokenise_indices`` on the edited text, that is,
+        ``text[:start] + replacement + text[end:]``.
+
+        :param text: The text before the edit.
+        :param indices: The indices of the tokens in the text before the edit, as returned by
+            ``tokenise_indices``.
+        :param start: The index of the start of the replaced part of the text.
+        :param end: The index of the end of the replaced part of the text.
+        :param replacement: The text to put in place of the replaced part (which is an
+            insertion if ``start == end`` and a deletion if ``replacement`` is empty).
+        :return: The list of tuple pairs containing integers specifying the locations of the
+            tokens in the edited text.
+        '''
+        return self.tokeniser.retokenise_indices(text, indices, start, end, replacement)
+
+    def iter_tokenise(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        '''
+        Tokenise a text that is read from a stream, yielding the tokens one by one.
+        The tokens are the same as those returned by ``tokenise`` on the whole text.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of tokens.
+        '''
+        return self.tokeniser.iter_tokenise(stream, chunk_size)
+
+    def iter_tokenise_indices(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[tuple[int, int]]:
+        '''
+        Tokenise a text that is read from a stream, yielding the indices of the tokens one by one.
+        The indices are relative to the start of the whole stream and are the same as those
+        returned by ``tokenise_indices`` on the whole text.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of tuple pairs containing integers specifying the locations of the
+            tokens in the text.
+        '''
+        return self.tokeniser.iter_tokenise_indices(stream, chunk_size)
+
+    def tokenise_sentences_indices(
+        self,
+        text: str,
+        sentence_indices: Iterable[tuple[int, int]],
+    ) -> SentenceTokenIndices:
+        '''
+        Tokenise the sentences in a text, given by their indices, and return the indices of the
+        tokens in the text grouped by sentence.
+
+        :param text: The text to tokenise.
+        :param sentence_indices: The start and end index of each sentence in the text, in order.
+        :return: The ``SentenceTokenIndices`` sequence of the token indices of each sentence.
+        '''
+        return self.tokeniser.tokenise_sentences_indices(text, sentence_indices)
+
+    def detokenise(
+        self,
+        tokens: list[str],
+    ) -> str:
+        '''
+        Detokenise the list of tokens back into a whole text.
+
+        :param tokens: The tokenised text.
+        :return: The text.
+        '''
+        return self.tokeniser.detokenise(tokens)
+
+    def detokenise_batch(
+        self,
+        token_lists: Iterable[list[str]],
+    ) -> list[str]:
+        '''
+        Detokenise a batch of token lists back into whole texts, one for each token list.
+        The result is identical to calling ``detokenise`` on each token list separately.
+
+        :param token_lists: The tokenised texts.
+        :return: The list of texts.
+        '''
+        return self.tokeniser.detokenise_batch(token_lists)
+
+    def get_cache_stats(
+        self,
+    ) -> dict[str, int]:
+        '''
+        Get statistics about the use of the result cache.
+
+        :return: A dictionary with the number of ``hits``, ``misses``, and ``evictions`` so far,
+            together with the current number of results (``size``) and approximate number of
+            bytes (``bytes``) in the cache.
+        '''
+        return self._cache.get_stats()
+
+    def clear_cache(
+        self,
+    ) -> None:
+        '''
+        Remove all the results from the cache and reset its statistics.
+        '''
+        self._cache.clear()
@@ -0,0 +1,3 @@
+'''
+A scanner based version of the MLRS Korpus Malti's tokeniser.
+'''
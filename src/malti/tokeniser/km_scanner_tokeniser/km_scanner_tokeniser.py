@@ -0,0 +1,389 @@
+'''
+Korpus Malti tokeniser implemented as a hand-written scanner.
+'''
+
+import re
+from array import array
+from typing import Callable, Iterable, Optional, cast
+from malti.tokeniser.token_indices import TokenIndices
+from malti.tokeniser.km_tokeniser.km_tokeniser import KMTokeniser
+
+
+__all__ = [
+    'KMScannerTokeniser',
+]
+
+
+class KMScannerTokeniser(KMTokeniser):
+    '''
+    A drop-in replacement for ``KMTokeniser`` that gives exactly the same tokens but finds them
+    with a hand-written scanner instead of the regular expression alternation.
+
+    Since none of the ``KMTokeniser`` patterns can match white space, the text is first split
+    into chunks of non-white space characters.
+    Most chunks are plain words, possibly followed by a punctuation mark, and are tokenised
+    directly.
+    The rest are scanned character by character, dispatching on the character class to check
+    for the token kinds in the same order as the regular expression alternation.
+
+    The streaming methods and ``detokenise`` are inherited from ``KMTokeniser``.
+    '''
+
+    ARTICLE_LETTERS = frozenset('dtlrnsxzcżċDTLRNSXZCŻĊſ')
+    '''The letters that end a definite article before the dash, equivalent to ``[dtlrnsxzcżċ]``
+    with ``re.IGNORECASE`` (which also matches the long s).'''
+
+    NUMERAL_LETTERS = frozenset('iIİı')
+    '''The letters that start a definite numeral after the dash, equivalent to ``i`` with
+    ``re.IGNORECASE`` (which also matches the dotted and dotless i).'''
+
+    DATE_SEPARATORS = frozenset('-/')
+    '''The characters that separate the parts of a numeric date.'''
+
+    DECIMAL_SEPARATORS = frozenset('.,/')
+    '''The characters that separate the parts of a decimal number.'''
+
+    WORD_SUFFIXES = frozenset('`\'')
+    '''The characters that can end a word.'''
+
+    PROCLITIC_SUFFIXES = frozenset('\'’')
+    '''The characters that end a proclitic preposition.'''
+
+    def __init__(
+        self,
+        detokenise_cache_size: Optional[int] = 10000,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param detokenise_cache_size: The maximum number of distinct tokens whose spacing
+            classification is remembered by ``detokenise``.
+            Once the cache is full, new tokens are classified without being added to it.
+            If ``None`` then the cache is unbounded and if 0 then nothing is cached.
+        '''
+        super().__init__(detokenise_cache_size)
+        # Matching zero or more digits always succeeds.
+        self._digits_match = cast(
+            Callable[[str, int], 're.Match[str]'],
+            re.compile(r'\d*').match,
+        )
+        self._word_match = re.compile(r'\w+').match
+        self._chunk_finditer = re.compile(r'\S+').finditer
+        self._line_proclitic_search = re.compile(
+            r'^\w’$', re.UNICODE | re.MULTILINE | re.IGNORECASE
+        ).search
+
+    def _scan_number(
+        self,
+        chunk: str,
+        start: int,
+    ) -> int:
+        '''
+        Find the end of a numeric date, decimal number, or whole number (in that order of
+        preference) starting at a digit.
+
+        :param chunk: The chunk of text being scanned.
+        :param start: The index of the first digit.
+        :return: The index of the end of the number.
+        '''
+        digits_match = self._digits_match
+        size = len(chunk)
+
+        end1 = digits_match(chunk, start).end()
+        if end1 < size and chunk[end1] in self.DATE_SEPARATORS:
+            start2 = end1 + 1
+            end2 = digits_match(chunk, start2).end()
+            if 1 <= end2 - start2 <= 2 and end2 < size and chunk[end2] in self.DATE_SEPARATORS:
+                start3 = end2 + 1
+                len1 = end1 - start
+                len3 = digits_match(chunk, start3).end() - start3
+                if len1 <= 2 <= len3:
+                    return start3 + min(len3, 4)
+                if 2 <= len1 <= 4 and len3 >= 1:
+                    return start3 + min(len3, 2)
+
+        if end1 < size and chunk[end1] in self.DECIMAL_SEPARATORS:
+            end2 = digits_match(chunk, end1 + 1).end()
+            if end2 > end1 + 1:
+                return end2
+
+        return end1
+
+    def _scan_article(
+        self,
+        chunk: str,
+        start: int,
+    ) -> Optional[int]:
+        '''
+        Find the end of a definite article (up to five word characters followed by an article
+        letter and a dash), preferring the shortest one, starting at a word character.
+
+        :param chunk: The chunk of text being scanned.
+        :param start: The index of the first word character.
+        :return: The index of the end of the article or ``None`` if there isn't one.
+        '''
+        if chunk.find('-', start + 1, start + 7) == -1:
+            return None
+
+        size = len(chunk)
+        for i in range(start, start + 6):
+            if i + 1 >= size:
+                return None
+            char = chunk[i]
+            if char in self.ARTICLE_LETTERS and chunk[i + 1] == '-':
+                return i + 2
+            if not (char.isalnum() or char == '_'):
+                return None
+        return None
+
+    def _scan_chunk(
+        self,
+        chunk: str,
+        start: int,
+        at_line_start: bool,
+        at_line_end: bool,
+        ends: list[int],
+    ) -> None:
+        '''
+        Tokenise the rest of a chunk of non-white space characters character by character.
+
+        :param chunk: The chunk of text.
+        :param start: The index in the chunk where to start scanning.
+        :param at_line_start: Whether the chunk is at the start of a line.
+        :param at_line_end: Whether the chunk is at the end of a line.
+        :param ends: The list of indices of the ends of the tokens in the chunk to extend.
+        '''
+        size = len(chunk)
+        i = start
+        while i < size:
+            char = chunk[i]
+            if char.isdecimal():
+                i = self._scan_number(chunk, i)
+            elif char == '-':
+                if (
+                    i + 2 < size
+                    and chunk[i + 1] in self.NUMERAL_LETTERS
+                    and chunk[i + 2] in self.ARTICLE_LETTERS
+                ):
+                    i += 3
+                else:
+                    i += 1
+            elif char.isalnum() or char == '_':
+                end = self._scan_article(chunk, i)
+                if end is not None:
+                    i = end
+                elif (
+                    i == 0 and size == 2 and at_line_start and at_line_end
+                    and chunk[1] in self.PROCLITIC_SUFFIXES
+                ):
+                    i = 2
+                else:
+                    match = self._word_match(chunk, i)
+                    assert match is not None
+                    i = match.end()
+                    if i < size and chunk[i] in self.WORD_SUFFIXES:
+                        i += 1
+            else:
+                i += 1
+            ends.append(i)
+
+    def _split_chunk(
+        self,
+        chunk: str,
+        at_line_start: bool,
+        at_line_end: bool,
+    ) -> list[int]:
+        '''
+        Tokenise a chunk of non-white space characters that is not a single word.
+
+        Common cases (a definite article attached to the next word and a word followed by a
+        punctuation mark) are handled directly, falling back to scanning the chunk character by
+        character.
+
+        :param chunk: The chunk of text.
+        :param at_line_start: Whether the chunk is at the start of a line.
+        :param at_line_end: Whether the chunk is at the end of a line.
+        :return: The list of indices of the ends of the tokens in the chunk.
+        '''
+        ends: list[int] = []
+        size = len(chunk)
+        start = 0
+
+        # A definite article at the start of the chunk, such as 'il-' in 'il-kelb'.
+        dash = chunk.find('-', 1, 7)
+        if (
+            dash != -1
+            and chunk[dash - 1] in self.ARTICLE_LETTERS
+            and not chunk[0].isdecimal()
+            and chunk[:dash].isalnum()
+        ):
+            start = dash + 1
+            ends.append(start)
+            if start == size:
+                return ends
+
+        # A word, possibly followed by a punctuation mark.
+        rest = chunk[start:] if start > 0 else chunk
+        if rest.isalnum():
+            if not rest[0].isdecimal() or rest.isdecimal():
+                ends.append(size)
+                return ends
+        elif rest[:-1].isalnum():
+            last = rest[-1]
+            if rest[0].isdecimal():
+                if rest[:-1].isdecimal():
+                    ends.append(size - 1)
+                    ends.append(size)
+                    return ends
+            elif last in '\'`_':
+                ends.append(size)
+                return ends
+            elif last != '-' and (last != '’' or start > 0 or size > 2):
+                ends.append(size - 1)
+                ends.append(size)
+                return ends
+
+        self._scan_chunk(chunk, start, at_line_start, at_line_end, ends)
+        return ends
+
+    def _scan(
+        self,
+        text: str,
+    ) -> list[int]:
+        '''
+        Tokenise a text into a flat list of token indices.
+
+        :param text: The text to tokenise.
+        :return: The flat list of the start and end index of each token, one after the other.
+        '''
+        flat: list[int] = []
+        append = flat.append
+        text_size = len(text)
+        for match in self._chunk_finditer(text):
+            chunk = match.group()
+            (start, end) = match.span()
+            if chunk.isalnum() and (not chunk[0].isdecimal() or chunk.isdecimal()):
+                append(start)
+                append(end)
+                continue
+
+            token_start = start
+            for token_end in self._split_chunk(
+                chunk,
+                start == 0 or text[start - 1] == '\n',
+                end == text_size or text[end] == '\n',
+            ):
+                append(token_start)
+                token_start = start + token_end
+                append(token_start)
+        return flat
+
+    def tokenise(
+        self,
+        text: str,
+    ) -> list[str]:
+        '''
+        Tokenise a text into a list of tokens.
+
+        :param text: The text to tokenise.
+        :return: The list of tokens.
+        '''
+        if self._line_proclitic_search(text) is not None:
+            # Proclitic prepositions on a line of their own need line boundaries, which are lost
+            # by str.split (the ones with a straight apostrophe are tokenised like words anyway).
+            return [text[i:j] for (i, j) in self.tokenise_indices(text)]
+
+        article_letters = self.ARTICLE_LETTERS
+        tokens: list[str] = []
+        append = tokens.append
+        for chunk in text.split():
+            # The most common cases are inlined here, with the rest left to _split_chunk.
+            if chunk.isalnum():
+                if not chunk[0].isdecimal() or chunk.isdecimal():
+                    append(chunk)
+                    continue
+            elif not chunk[0].isdecimal():
+                head = chunk[:-1]
+                if head.isalnum():
+                    last = chunk[-1]
+                    if last in '\'`_':
+                        append(chunk)
+                        continue
+                    if last != '-':
+                        append(head)
+                        append(last)
+                        continue
+                dash = chunk.find('-', 1, 7)
+                if dash != -1 and chunk[dash - 1] in article_letters:
+                    rest = chunk[dash + 1:]
+                    if (
+                        rest.isalnum() and not rest[0].isdecimal()
+                        and chunk[:dash].isalnum()
+                    ):
+                        append(chunk[:dash + 1])
+                        append(rest)
+                        continue
+
+            start = 0
+            for end in self._split_chunk(chunk, False, False):
+                append(chunk[start:end])
+                start = end
+        return tokens
+
+    def tokenise_indices(
+        self,
+        text: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Tokenise a text and return the indices of the tokens.
+        A list of integer pair tuples ``[(i, j)]`` is returned such that
+        ``text[i:j]`` is a token.
+
+        :param text: The text to tokenise.
+        :return: The list of tuple pairs containing integers specifying the
+            locations of the tokens in the text.
+        '''
+        flat_iter = iter(self._scan(text))
+        return list(zip(flat_iter, flat_iter))
+
+    def tokenise_indices_compact(
+        self,
+        text: str,
+    ) -> TokenIndices:
+        '''
+        Tokenise a text and return the indices of the tokens in a compact array-backed sequence.
+        This gives the same indices as ``tokenise_indices`` but uses a fraction of the memory.
+
+        :param text: The text to tokenise.
+        :return: The ``TokenIndices`` sequence of index pairs.
+        '''
+        return TokenIndices(array(TokenIndices.TYPECODE, self._scan(text)))
+
+    def tokenise_batch(
+        self,
+        texts: Iterable[str],
+    ) -> list[list[str]]:
+        '''
+        Tokenise a batch of texts into a list of token lists, one for each text.
+        The result is identical to calling ``tokenise`` on each text separately.
+
+        :param texts: The texts to tokenise.
+        :return: The list of token lists.
+        '''
+        tokenise = self.tokenise
+        return [tokenise(text) for text in texts]
+
+    def tokenise_indices_batch(
+        self,
+        texts: Iterable[str],
+    ) -> list[list[tuple[int, int]]]:
+        '''
+        Tokenise a batch of texts and return the indices of the tokens in each text.
+        The result is identical to calling ``tokenise_indices`` on each text separately.
+
+        :param texts: The texts to tokenise.
+        :return: The list of index lists, where each index list refers to the text at the same
+            position in ``texts``.
+        '''
+        tokenise_indices = self.tokenise_indices
+        return [tokenise_indices(text) for text in texts]
@@ -3,14 +3,50 @@ Korpus Malti tokeniser.
 '''
 
 import re
+import enum
+from array import array
+from typing import Iterable, Optional
+from malti.tokeniser.token_indices import TokenIndices
 from malti.tokeniser.regex_tokeniser import RegexTokeniser
 
 
 __all__ = [
+    'KMTokenType',
     'KMTokeniser',
 ]
 
 
+class KMTokenType(enum.IntEnum):
+    '''
+    The kinds of tokens found by the ``KMTokeniser``, according to which of its patterns matched
+    the token.
+    '''
+
+    NUMERIC_DATE = 1
+    '''A date expressed numerically e.g. 10/10/2010'''
+
+    DECIMAL = 2
+    '''A decimal number e.g. 10.1'''
+
+    NUMBER = 3
+    '''A whole number e.g. 10'''
+
+    DEF_ARTICLE = 4
+    '''A definite article e.g. għall- or l-'''
+
+    DEF_NUMERAL = 5
+    '''A definite numeral e.g. -il (as in ħdax-il)'''
+
+    PROCLITIC_PREP = 6
+    '''A proclitic preposition on a line of its own e.g. l' '''
+
+    WORD = 7
+    '''A word e.g. kelb'''
+
+    PUNCTUATION = 8
+    '''Any other single non-white space character e.g. . or ('''
+
+
 class KMTokeniser(RegexTokeniser):
     '''
     The tokeniser used by the MLRS Korpus Malti corpus.
@@ -46,11 +82,21 @@ class KMTokeniser(RegexTokeniser):
     ABBREV_PREFIX = r'sant[\'’]|(a\.?m|p\.?m|onor|sra|nru|dott|kap|mons|dr|prof)\.?'
     '''Captures abbreviations e.g. Sant' (as in Sant'Anna)'''
 
+    _DETOK_SPACE_AROUND = 0
+    _DETOK_NO_SPACE_AFTER = 1
+    _DETOK_NO_SPACE_BEFORE = 2
+
     def __init__(
         self,
+        detokenise_cache_size: Optional[int] = 10000,
     ) -> None:
         '''
         Constructor.
+
+        :param detokenise_cache_size: The maximum number of distinct tokens whose spacing
+            classification is remembered by ``detokenise``.
+            Once the cache is full, new tokens are classified without being added to it.
+            If ``None`` then the cache is unbounded and if 0 then nothing is cached.
         '''
         super().__init__(
             '|'.join([
@@ -63,9 +109,14 @@ class KMTokeniser(RegexTokeniser):
                 self.WORD,
                 self.END_PUNCTUATION,
             ]),
-            re.UNICODE | re.MULTILINE | re.DOTALL | re.IGNORECASE
+            re.UNICODE | re.MULTILINE | re.DOTALL | re.IGNORECASE,
+            boundary_pattern=r'\s', # None of the token patterns can match white space.
         )
 
+        # The same regex with a group for each token type, compiled on first use by the typed
+        # methods (see _get_typed_regex).
+        self._typed_regex: Optional[re.Pattern[str]] = None
+
         # Tokens that match this regex should not have a space AFTER them.
         self._detok_no_space_after_re = re.compile(
             f'{self.DEF_ARTICLE}|{self.PROCLITIC_PREP}|{self.ABBREV_PREFIX}',
@@ -78,6 +129,151 @@ class KMTokeniser(RegexTokeniser):
             re.IGNORECASE
         )
 
+        # Cache of token spacing classifications for detokenisation (most text consists of a
+        # small vocabulary of frequent tokens).
+        self._detok_cache: dict[str, int] = {}
+        self._detok_cache_size = detokenise_cache_size
+        self._detok_cache_lookups = 0
+        self._detok_cache_misses = 0
+
+    def _get_typed_regex(
+        self,
+    ) -> re.Pattern[str]:
+        '''
+        Get the token regex with a group for each token type (in the order of the
+        ``KMTokenType`` values) so that the type of a match is given by its ``lastindex``,
+        compiling it the first time it is needed.
+
+        :return: The compiled regex.
+        '''
+        if self._typed_regex is None:
+            self._typed_regex = re.compile(
+                '|'.join(f'({pattern})' for pattern in [
+                    self.NUMERIC_DATE,
+                    self.DECIMAL,
+                    self.NUMBER,
+                    self.DEF_ARTICLE,
+                    self.DEF_NUMERAL,
+                    self.PROCLITIC_PREP,
+                    self.WORD,
+                    self.END_PUNCTUATION,
+                ]),
+                re.UNICODE | re.MULTILINE | re.DOTALL | re.IGNORECASE
+            )
+        return self._typed_regex
+
+    def tokenise_typed(
+        self,
+        text: str,
+    ) -> tuple[list[str], array]:
+        '''
+        Tokenise a text into a list of tokens together with the type of each token.
+        The tokens are the same as those returned by ``tokenise``.
+
+        :param text: The text to tokenise.
+        :return: A pair consisting of the list of tokens and a parallel array of bytes (type code
+            ``'B'``) with the ``KMTokenType`` value of each token.
+        '''
+        tokens: list[str] = []
+        token_types = array('B')
+        append_token = tokens.append
+        append_type = token_types.append
+        word = int(KMTokenType.WORD)
+        punctuation = int(KMTokenType.PUNCTUATION)
+
+        for match in self._get_typed_regex().finditer(text):
+            token = match.group()
+            append_token(token)
+            token_type = match.lastindex
+            assert token_type is not None # Every alternative is a group.
+            if token_type == word and not (token[0].isalnum() or token[0] == '_'):
+                token_type = punctuation # Matched by the single non-white space part of WORD.
+            append_type(token_type)
+
+        return (tokens, token_types)
+
+    def tokenise_indices_typed(
+        self,
+        text: str,
+    ) -> tuple[TokenIndices, array]:
+        '''
+        Tokenise a text and return the indices of the tokens together with the type of each
+        token.
+        The indices are the same as those returned by ``tokenise_indices``.
+
+        :param text: The text to tokenise.
+        :return: A pair consisting of a ``TokenIndices`` sequence of index pairs and a parallel
+            array of bytes (type code ``'B'``) with the ``KMTokenType`` value of each token.
+        '''
+        indices = array(TokenIndices.TYPECODE)
+        token_types = array('B')
+        extend_indices = indices.extend
+        append_type = token_types.append
+        word = int(KMTokenType.WORD)
+        punctuation = int(KMTokenType.PUNCTUATION)
+
+        for match in self._get_typed_regex().finditer(text):
+            span = match.span()
+            extend_indices(span)
+            token_type = match.lastindex
+            assert token_type is not None # Every alternative is a group.
+            if token_type == word:
+                first_char = text[span[0]]
+                if not (first_char.isalnum() or first_char == '_'):
+                    token_type = punctuation # Matched by the single non-white space part of WORD.
+            append_type(token_type)
+
+        return (TokenIndices(indices), token_types)
+
+    def _classify_token(
+        self,
+        token: str,
+    ) -> int:
+        '''
+        Classify a token according to how it should be spaced by ``detokenise`` and cache the
+        classification if there is room in the cache.
+
+        :param token: The token.
+        :return: One of the ``_DETOK_*`` constants.
+        '''
+        self._detok_cache_misses += 1
+        if self._detok_no_space_after_re.match(token):
+            token_class = self._DETOK_NO_SPACE_AFTER
+        elif self._detok_no_space_before_re.match(token):
+            token_class = self._DETOK_NO_SPACE_BEFORE
+        else:
+            token_class = self._DETOK_SPACE_AROUND
+        if self._detok_cache_size is None or len(self._detok_cache) < self._detok_cache_size:
+            self._detok_cache[token] = token_class
+        return token_class
+
+    def get_detokenise_cache_stats(
+        self,
+    ) -> dict[str, int]:
+        '''
+        Get statistics about the use of the token classification cache by ``detokenise``.
+
+        :return: A dictionary with the number of ``hits`` and ``misses`` (tokens that had to be
+            classified) so far, the current ``size`` of the cache, and its ``max_size`` (-1 if
+            unbounded).
+        '''
+        return {
+            'hits': self._detok_cache_lookups - self._detok_cache_misses,
+            'misses': self._detok_cache_misses,
+            'size': len(self._detok_cache),
+            'max_size': -1 if self._detok_cache_size is None else self._detok_cache_size,
+        }
+
+    def clear_detokenise_cache(
+        self,
+    ) -> None:
+        '''
+        Empty the token classification cache used by ``detokenise`` and reset its statistics.
+        '''
+        self._detok_cache.clear()
+        self._detok_cache_lookups = 0
+        self._detok_cache_misses = 0
+
     def detokenise(
         self,
         tokens: list[str],
@@ -89,19 +285,44 @@ class KMTokeniser(RegexTokeniser):
         :return: The text.
         '''
         tokens_with_spaces: list[str] = []
+        append = tokens_with_spaces.append
+        cache_get = self._detok_cache.get
+        classify_token = self._classify_token
+        no_space_after = self._DETOK_NO_SPACE_AFTER
+        no_space_before = self._DETOK_NO_SPACE_BEFORE
 
         for token in tokens:
-            if self._detok_no_space_after_re.match(token):
-                tokens_with_spaces.append(token)
-            elif self._detok_no_space_before_re.match(token):
+            token_class = cache_get(token)
+            if token_class is None:
+                token_class = classify_token(token)
+
+            if token_class == no_space_after:
+                append(token)
+            elif token_class == no_space_before:
                 if tokens_with_spaces and tokens_with_spaces[-1] == ' ':
                     tokens_with_spaces.pop() # Remove the previously added space (if there is one).
-                    tokens_with_spaces.append(token)
-                    tokens_with_spaces.append(' ')
+                    append(token)
+                    append(' ')
                 # Code that this was taken from did not have an `else` for the previous `if`.
             else:
-                tokens_with_spaces.append(token)
-                tokens_with_spaces.append(' ')
+                append(token)
+                append(' ')
+        self._detok_cache_lookups += len(tokens)
 
         text = ''.join(tokens_with_spaces)
         return text.strip()
+
+    def detokenise_batch(
+        self,
+        token_lists: Iterable[list[str]],
+    ) -> list[str]:
+        '''
+        Detokenise a batch of token lists back into whole texts, one for each token list.
+        The result is identical to calling ``detokenise`` on each token list separately, with the
+        token classification cache being shared by all of them.
+
+        :param token_lists: The tokenised texts.
+        :return: The list of texts.
+        '''
+        detokenise = self.detokenise
+        return [detokenise(tokens) for tokens in token_lists]
@@ -2,8 +2,15 @@
 Tokeniser class for representing tokenisers that work with regular expressions.
 '''
 
+import bisect
 import re
+from array import array
+from itertools import chain
+from typing import Iterable, Iterator, Optional, TextIO, Union
 from malti.tokeniser.tokeniser import Tokeniser
+from malti.tokeniser.token_indices import TokenIndices
+from malti.tokeniser.sentence_token_indices import SentenceTokenIndices
+from malti.utils import DEFAULT_CHUNK_SIZE, iter_chunks
 
 
 __all__ = [
@@ -22,6 +29,7 @@ class RegexTokeniser(Tokeniser):
         flags: re.RegexFlag = (
             re.UNICODE | re.MULTILINE | re.DOTALL | re.IGNORECASE
         ),
+        boundary_pattern: Optional[str] = None,
     ) -> None:
         '''
         Create a regular expression tokeniser from a regular expression.
@@ -29,8 +37,26 @@ class RegexTokeniser(Tokeniser):
         :param pattern: A string regular expression which will be compiled into
             a regular expression ``re`` object.
         :param flags: Regular expression flags to use from the ``re`` module.
+        :param boundary_pattern: A string regular expression matching single characters that can
+            never be part of a token or affect how the text around them is tokenised, such as
+            ``r'\\s'`` for tokens that never include white space.
+            This is used by ``iter_tokenise`` and ``iter_tokenise_indices`` to find safe places
+            where to cut a stream of text and by ``retokenise_indices`` to limit the part of an
+            edited text that is tokenised again.
+            If ``None`` then the streamed text is read completely before being tokenised and
+            edited texts are tokenised again in full.
         '''
         self._regex = re.compile(pattern, flags)
+        self._boundary_regex = (
+            re.compile(boundary_pattern, flags)
+            if boundary_pattern is not None
+            else None
+        )
+        self._last_boundary_regex = (
+            re.compile(f'.*(?:{boundary_pattern})', flags | re.DOTALL)
+            if boundary_pattern is not None
+            else None
+        )
 
     def tokenise(
         self,
@@ -61,3 +87,271 @@ class RegexTokeniser(Tokeniser):
             m.span()
             for m in self._regex.finditer(text)
         ]
+
+    def tokenise_indices_compact(
+        self,
+        text: str,
+    ) -> TokenIndices:
+        '''
+        Tokenise a text and return the indices of the tokens in a compact array-backed sequence.
+        This gives the same indices as ``tokenise_indices`` but uses a fraction of the memory.
+
+        :param text: The text to tokenise.
+        :return: The ``TokenIndices`` sequence of index pairs.
+        '''
+        return TokenIndices(array(
+            TokenIndices.TYPECODE,
+            chain.from_iterable(map(re.Match.span, self._regex.finditer(text))),
+        ))
+
+    def tokenise_batch(
+        self,
+        texts: Iterable[str],
+    ) -> list[list[str]]:
+        '''
+        Tokenise a batch of texts into a list of token lists, one for each text.
+        The result is identical to calling ``tokenise`` on each text separately but without the
+        overhead of a method call for every text, which matters when the texts are short.
+
+        :param texts: The texts to tokenise.
+        :return: The list of token lists.
+        '''
+        findall = self._regex.findall
+        return [findall(text) for text in texts]
+
+    def tokenise_indices_batch(
+        self,
+        texts: Iterable[str],
+    ) -> list[list[tuple[int, int]]]:
+        '''
+        Tokenise a batch of texts and return the indices of the tokens in each text.
+        The result is identical to calling ``tokenise_indices`` on each text separately but
+        without the overhead of a method call for every text, which matters when the texts are
+        short.
+
+        :param texts: The texts to tokenise.
+        :return: The list of index lists, where each index list refers to the text at the same
+            position in ``texts``.
+        '''
+        finditer = self._regex.finditer
+        return [
+            [m.span() for m in finditer(text)]
+            for text in texts
+        ]
+
+    def tokenise_sentences_indices(
+        self,
+        text: str,
+        sentence_indices: Iterable[tuple[int, int]],
+    ) -> SentenceTokenIndices:
+        '''
+        Tokenise the sentences in a text, given by their indices (such as those returned by a
+        sentence splitter's ``split_indices``), and return the indices of the tokens in the text
+        grouped by sentence.
+        The tokens of each sentence are the same as those returned by ``tokenise_indices`` on the
+        sentence but with indices that refer to the whole text.
+        Any text outside the sentences is not tokenised.
+
+        If the tokeniser has a boundary pattern then all the sentences are tokenised in a single
+        pass over a copy of the text in which everything between the sentences is replaced by
+        new lines, so that each sentence is on a line of its own (for ``^`` and ``$``) and the
+        indices are unchanged.
+        This assumes that the boundary pattern matches new lines.
+        Otherwise, each sentence is tokenised separately.
+
+        :param text: The text to tokenise.
+        :param sentence_indices: The start and end index of each sentence in the text, in order.
+        :return: The ``SentenceTokenIndices`` sequence of the token indices of each sentence.
+        '''
+        if self._boundary_regex is None:
+            return super().tokenise_sentences_indices(text, sentence_indices)
+
+        sentence_data = array(TokenIndices.TYPECODE)
+        parts: list[str] = []
+        last_end = 0
+        for (start, end) in sentence_indices:
+            if not last_end <= start <= end <= len(text):
+                raise ValueError('The sentences must be within the text, in order.')
+            parts.append('\n'*(start - last_end))
+            parts.append(text[start:end])
+            sentence_data.append(start)
+            sentence_data.append(end)
+            last_end = end
+
+        token_indices = self.tokenise_indices_compact(''.join(parts))
+        token_starts = token_indices.data[0::2]
+        sentence_token_starts = array(
+            TokenIndices.TYPECODE,
+            [bisect.bisect_left(token_starts, start) for start in sentence_data[0::2]],
+        )
+        sentence_token_starts.append(len(token_indices))
+        return SentenceTokenIndices(
+            TokenIndices(sentence_data), token_indices, sentence_token_starts,
+        )
+
+    def retokenise_indices(
+        self,
+        text: str,
+        indices: list[tuple[int, int]],
+        start: int,
+        end: int,
+        replacement: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Update the indices of the tokens in a text after part of the text is replaced.
+        The result is the same as calling ``tokenise_indices`` on the edited text, that is,
+        ``text[:start] + replacement + text[end:]``.
+
+        If the tokeniser has a boundary pattern then only the edited part of the text is
+        tokenised again, extended back to the last boundary character before it and forward to
+        the first boundary character after it.
+        The tokens before this window are kept as is and the ones after it are shifted by the
+        change in length of the text.
+        Otherwise the whole edited text is tokenised again.
+
+        :param text: The text before the edit.
+        :param indices: The indices of the tokens in the text before the edit, as returned by
+            ``tokenise_indices``.
+        :param start: The index of the start of the replaced part of the text.
+        :param end: The index of the end of the replaced part of the text.
+        :param replacement: The text to put in place of the replaced part (which is an
+            insertion if ``start == end`` and a deletion if ``replacement`` is empty).
+        :return: The list of tuple pairs containing integers specifying the locations of the
+            tokens in the edited text.
+        '''
+        if self._boundary_regex is None or self._last_boundary_regex is None:
+            return super().retokenise_indices(text, indices, start, end, replacement)
+        if not 0 <= start <= end <= len(text):
+            raise ValueError('The edit must be within the text.')
+
+        # Find the start of the window after the last boundary character before the edit,
+        # looking back in exponentially growing steps to avoid scanning the whole text.
+        last_boundary_match = self._last_boundary_regex.match
+        window_start = 0
+        look_back = 64
+        while True:
+            look_from = max(0, start - look_back)
+            match = last_boundary_match(text, look_from, start)
+            if match is not None:
+                window_start = match.end()
+                break
+            if look_from == 0:
+                break
+            look_back *= 4
+
+        # Find the end of the window (in the text before the edit) after the first boundary
+        # character after the edit.
+        match = self._boundary_regex.search(text, end)
+        window_end = match.end() if match is not None else len(text)
+
+        # Tokenise the window together with the character before it (for ``^``).
+        context_start = max(0, window_start - 1)
+        window = text[context_start:start] + replacement + text[end:window_end]
+        window_indices = [
+            (context_start + m.start(), context_start + m.end())
+            for m in self._regex.finditer(window, window_start - context_start)
+        ]
+
+        first = bisect.bisect_left(indices, (window_start,))
+        last = bisect.bisect_left(indices, (window_end,), first)
+        shift = len(replacement) - (end - start)
+        if shift == 0:
+            return indices[:first] + window_indices + indices[last:]
+        return indices[:first] + window_indices + [
+            (token_start + shift, token_end + shift)
+            for (token_start, token_end) in indices[last:]
+        ]
+
+    def _iter_matches(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int,
+    ) -> Iterator[tuple[int, re.Match[str]]]:
+        '''
+        Find the token matches in a text that is read from a stream.
+
+        Text is buffered until a chunk containing a boundary character arrives, at which point
+        all the text up to the last boundary character is tokenised and discarded.
+        The boundary character itself is kept at the start of the buffer so that the regular
+        expression still sees the character preceding the rest of the text (for ``^``).
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of pairs consisting of the offset of the buffer in the whole
+            text and a match object of a token in that buffer.
+        '''
+        assert self._last_boundary_regex is not None
+        finditer = self._regex.finditer
+        last_boundary_match = self._last_boundary_regex.match
+        buffer_parts: list[str] = []
+        buffer_len = 0
+        offset = 0
+        for chunk in iter_chunks(stream, chunk_size):
+            buffer_parts.append(chunk)
+            buffer_len += len(chunk)
+            match = last_boundary_match(chunk)
+            if match is None:
+                continue
+
+            buffer = ''.join(buffer_parts)
+            cut = buffer_len - len(chunk) + match.end()
+            for token_match in finditer(buffer, 0, cut):
+                yield (offset, token_match)
+
+            buffer = buffer[cut - 1:]
+            buffer_parts = [buffer]
+            buffer_len = len(buffer)
+            offset += cut - 1
+
+        buffer = ''.join(buffer_parts)
+        for token_match in finditer(buffer):
+            yield (offset, token_match)
+
+    def iter_tokenise(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        '''
+        Tokenise a text that is read from a stream, yielding the tokens one by one.
+        The tokens are the same as those returned by ``tokenise`` on the whole text.
+        If the tokeniser has a boundary pattern then memory use is bounded by the chunk size
+        (or the longest stretch of text without a boundary character), otherwise the whole stream
+        is read first.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of tokens.
+        '''
+        if self._last_boundary_regex is None:
+            yield from super().iter_tokenise(stream, chunk_size)
+            return
+
+        for (_, match) in self._iter_matches(stream, chunk_size):
+            yield match.group()
+
+    def iter_tokenise_indices(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[tuple[int, int]]:
+        '''
+        Tokenise a text that is read from a stream, yielding the indices of the tokens one by one.
+        The indices are relative to the start of the whole stream and are the same as those
+        returned by ``tokenise_indices`` on the whole text.
+        If the tokeniser has a boundary pattern then memory use is bounded by the chunk size
+        (or the longest stretch of text without a boundary character), otherwise the whole stream
+        is read first.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of tuple pairs containing integers specifying the locations of the
+            tokens in the text.
+        '''
+        if self._last_boundary_regex is None:
+            yield from super().iter_tokenise_indices(stream, chunk_size)
+            return
+
+        for (offset, match) in self._iter_matches(stream, chunk_size):
+            (start, end) = match.span()
+            yield (offset + start, offset + end)
@@ -0,0 +1,171 @@
+'''
+A compact sequence of token indices grouped by sentence.
+'''
+
+from array import array
+from typing import Iterator, Optional, Sequence, Union, overload
+from malti.tokeniser.token_indices import TokenIndices
+
+
+__all__ = [
+    'SentenceTokenIndices',
+]
+
+
+class SentenceTokenIndices(Sequence[TokenIndices]):
+    '''
+    A memory efficient sequence of the token indices of each sentence in a text, where the
+    indices refer to the whole text rather than to the sentence.
+
+    Everything is kept in three flat arrays of 64-bit integers:
+
+    * ``sentence_indices``: A ``TokenIndices`` with the start and end index of each sentence in
+      the text.
+    * ``token_indices``: A ``TokenIndices`` with the start and end index of every token in the
+      text, in order.
+    * ``sentence_token_starts``: The position in ``token_indices`` of the first token of each
+      sentence, followed by the total number of tokens, so that the tokens of sentence ``i`` are
+      ``token_indices[sentence_token_starts[i]:sentence_token_starts[i + 1]]``.
+
+    Indexing gives the ``TokenIndices`` of a sentence's tokens.
+    '''
+
+    def __init__(
+        self,
+        sentence_indices: Optional[TokenIndices] = None,
+        token_indices: Optional[TokenIndices] = None,
+        sentence_token_starts: Optional[array] = None,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param sentence_indices: The start and end index of each sentence.
+            If ``None`` then there are no sentences.
+        :param token_indices: The start and end index of every token.
+            If ``None`` then there are no tokens.
+        :param sentence_token_starts: A flat array of integers with type code ``'q'`` with the
+            position of the first token of each sentence followed by the number of tokens.
+            If ``None`` then there are no sentences.
+        '''
+        if sentence_indices is None:
+            sentence_indices = TokenIndices()
+        if token_indices is None:
+            token_indices = TokenIndices()
+        if sentence_token_starts is None:
+            sentence_token_starts = array(TokenIndices.TYPECODE, [0])
+        if sentence_token_starts.typecode != TokenIndices.TYPECODE:
+            raise ValueError(
+                f'The sentence token starts array must have a type code of '
+                f'\'{TokenIndices.TYPECODE}\'.'
+            )
+        if len(sentence_token_starts) != len(sentence_indices) + 1:
+            raise ValueError('There must be one more sentence token start than sentences.')
+        if sentence_token_starts[-1] != len(token_indices):
+            raise ValueError('The last sentence token start must be the number of tokens.')
+        self.sentence_indices = sentence_indices
+        self.token_indices = token_indices
+        self.sentence_token_starts = sentence_token_starts
+
+    @property
+    def nbytes(
+        self,
+    ) -> int:
+        '''
+        The number of bytes taken by the indices in the flat arrays.
+
+        :return: The number of bytes.
+        '''
+        return (
+            self.sentence_indices.nbytes
+            + self.token_indices.nbytes
+            + len(self.sentence_token_starts)*self.sentence_token_starts.itemsize
+        )
+
+    def tolist(
+        self,
+    ) -> list[list[tuple[int, int]]]:
+        '''
+        Convert the sequence into a list of lists of token index pairs, one list for each
+        sentence.
+
+        :return: The list of lists of tuple pairs.
+        '''
+        return [sentence.tolist() for sentence in self]
+
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of sentences.
+
+        :return: The number of sentences.
+        '''
+        return len(self.sentence_indices)
+
+    @overload
+    def __getitem__(
+        self,
+        index: int,
+    ) -> TokenIndices:
+        '''
+        Get the token indices of a sentence.
+
+        :param index: The position of the sentence.
+        :return: The token indices.
+        '''
+
+    @overload
+    def __getitem__(
+        self,
+        index: slice,
+    ) -> Sequence[TokenIndices]:
+        '''
+        Get a list with the token indices of a slice of the sentences.
+
+        :param index: The slice of positions.
+        :return: The list of token indices.
+        '''
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[TokenIndices, Sequence[TokenIndices]]:
+        '''
+        Get the token indices of a sentence or a list with the token indices of a slice of the
+        sentences.
+
+        :param index: The position of the sentence or a slice of positions.
+        :return: The token indices or a list of token indices.
+        '''
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('SentenceTokenIndices index out of range')
+        return self.token_indices[
+            self.sentence_token_starts[index]:self.sentence_token_starts[index + 1]
+        ]
+
+    def __iter__(
+        self,
+    ) -> Iterator[TokenIndices]:
+        '''
+        Iterate over the token indices of each sentence.
+
+        :return: An iterator of token indices.
+        '''
+        token_indices = self.token_indices
+        starts = self.sentence_token_starts
+        return (token_indices[starts[i]:starts[i + 1]] for i in range(len(self)))
+
+    def __repr__(
+        self,
+    ) -> str:
+        '''
+        Get a string representation of the sequence.
+
+        :return: The string representation.
+        '''
+        return f'SentenceTokenIndices({self.tolist()!r})'
@@ -0,0 +1,218 @@
+'''
+A compact sequence of token indices.
+'''
+
+from array import array
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union, overload
+
+
+__all__ = [
+    'TokenIndices',
+]
+
+
+class TokenIndices(Sequence[tuple[int, int]]):
+    '''
+    A memory efficient sequence of token index pairs ``(i, j)`` such that ``text[i:j]`` is a token.
+
+    Instead of a list of tuples (which takes over 100 bytes per token), the indices are kept in a
+    single flat array of 64-bit integers with the start and end index of each token next to each
+    other (``[i0, j0, i1, j1, ...]``), taking 16 bytes per token.
+    Pairs are only created when they are accessed through indexing or iteration.
+
+    The flat array is available as ``data`` and supports the buffer protocol, so it can be
+    converted to other array types without copying, for example into a NumPy array with a row for
+    each token using ``numpy.frombuffer(indices.data, dtype=numpy.int64).reshape(-1, 2)``.
+    '''
+
+    TYPECODE = 'q'
+    '''The ``array`` type code of the flat array (signed 64-bit integer).'''
+
+    def __init__(
+        self,
+        data: Optional[array] = None,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param data: A flat array of integers with type code ``'q'`` consisting of the start and
+            end index of each token, one after the other.
+            If ``None`` then an empty sequence is created.
+        '''
+        if data is None:
+            data = array(self.TYPECODE)
+        if data.typecode != self.TYPECODE:
+            raise ValueError(f'The data array must have a type code of \'{self.TYPECODE}\'.')
+        if len(data) % 2 != 0:
+            raise ValueError('The data array must have an even length.')
+        self.data = data
+
+    @staticmethod
+    def from_pairs(
+        pairs: Iterable[tuple[int, int]],
+    ) -> 'TokenIndices':
+        '''
+        Create a token indices sequence from an iterable of index pairs.
+
+        :param pairs: The index pairs.
+        :return: The token indices sequence.
+        '''
+        data = array(TokenIndices.TYPECODE)
+        for (start, end) in pairs:
+            data.append(start)
+            data.append(end)
+        return TokenIndices(data)
+
+    @property
+    def starts(
+        self,
+    ) -> memoryview:
+        '''
+        A read-only view of the start index of every token (without copying).
+
+        :return: The memory view.
+        '''
+        return memoryview(self.data).toreadonly()[0::2]
+
+    @property
+    def ends(
+        self,
+    ) -> memoryview:
+        '''
+        A read-only view of the end index of every token (without copying).
+
+        :return: The memory view.
+        '''
+        return memoryview(self.data).toreadonly()[1::2]
+
+    @property
+    def nbytes(
+        self,
+    ) -> int:
+        '''
+        The number of bytes taken by the indices in the flat array.
+
+        :return: The number of bytes.
+        '''
+        return len(self.data)*self.data.itemsize
+
+    def append(
+        self,
+        start: int,
+        end: int,
+    ) -> None:
+        '''
+        Add the indices of a token to the end of the sequence.
+
+        :param start: The start index of the token.
+        :param end: The end index of the token.
+        '''
+        self.data.append(start)
+        self.data.append(end)
+
+    def tolist(
+        self,
+    ) -> list[tuple[int, int]]:
+        '''
+        Convert the sequence into a list of index pairs, like the one returned by
+        ``Tokeniser.tokenise_indices``.
+
+        :return: The list of tuple pairs.
+        '''
+        return list(self)
+
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of tokens.
+
+        :return: The number of tokens.
+        '''
+        return len(self.data)//2
+
+    @overload
+    def __getitem__(
+        self,
+        index: int,
+    ) -> tuple[int, int]:
+        '''
+        Get the index pair of a token.
+
+        :param index: The position of the token.
+        :return: The index pair.
+        '''
+
+    @overload
+    def __getitem__(
+        self,
+        index: slice,
+    ) -> 'TokenIndices':
+        '''
+        Get a new sequence with a slice of the tokens.
+
+        :param index: The slice of positions.
+        :return: The new token indices sequence.
+        '''
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[tuple[int, int], 'TokenIndices']:
+        '''
+        Get the index pair of a token or a new sequence with a slice of the tokens.
+
+        :param index: The position of the token or a slice of positions.
+        :return: The index pair or a new token indices sequence.
+        '''
+        if isinstance(index, slice):
+            (start, stop, step) = index.indices(len(self))
+            if step == 1:
+                return TokenIndices(self.data[2*start:2*max(start, stop)])
+            return TokenIndices.from_pairs(self[i] for i in range(start, stop, step))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('TokenIndices index out of range')
+        return (self.data[2*index], self.data[2*index + 1])
+
+    def __iter__(
+        self,
+    ) -> Iterator[tuple[int, int]]:
+        '''
+        Iterate over the index pairs.
+
+        :return: An iterator of tuple pairs.
+        '''
+        data_iter = iter(self.data)
+        return zip(data_iter, data_iter)
+
+    def __eq__(
+        self,
+        other: Any,
+    ) -> bool:
+        '''
+        Check if this sequence has the same indices as another ``TokenIndices`` or a list of index
+        pairs.
+
+        :param other: The object to compare to.
+        :return: Whether the indices are equal.
+        '''
+        if isinstance(other, TokenIndices):
+            return self.data == other.data
+        if isinstance(other, list):
+            return len(other) == len(self) and all(
+                tuple(x) == y for (x, y) in zip(other, self)
+            )
+        return NotImplemented
+
+    def __repr__(
+        self,
+    ) -> str:
+        '''
+        Get a string representation of the sequence.
+
+        :return: The string representation.
+        '''
+        return f'TokenIndices({self.tolist()!r})'
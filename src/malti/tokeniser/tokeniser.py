@@ -3,6 +3,11 @@ A tokeniser.
 '''
 
 from abc import ABC
+from array import array
+from typing import Iterable, Iterator, TextIO, Union
+from malti.tokeniser.token_indices import TokenIndices
+from malti.tokeniser.sentence_token_indices import SentenceTokenIndices
+from malti.utils import DEFAULT_CHUNK_SIZE, iter_chunks
 
 
 __all__ = [
@@ -42,6 +47,141 @@ class Tokeniser(ABC):
         '''
         raise NotImplementedError()
 
+    def tokenise_indices_compact(
+        self,
+        text: str,
+    ) -> TokenIndices:
+        '''
+        Tokenise a text and return the indices of the tokens in a compact array-backed sequence.
+        This gives the same indices as ``tokenise_indices`` but uses a fraction of the memory.
+
+        :param text: The text to tokenise.
+        :return: The ``TokenIndices`` sequence of index pairs.
+        '''
+        return TokenIndices.from_pairs(self.tokenise_indices(text))
+
+    def tokenise_batch(
+        self,
+        texts: Iterable[str],
+    ) -> list[list[str]]:
+        '''
+        Tokenise a batch of texts into a list of token lists, one for each text.
+        The result is identical to calling ``tokenise`` on each text separately.
+
+        :param texts: The texts to tokenise.
+        :return: The list of token lists.
+        '''
+        return [self.tokenise(text) for text in texts]
+
+    def tokenise_indices_batch(
+        self,
+        texts: Iterable[str],
+    ) -> list[list[tuple[int, int]]]:
+        '''
+        Tokenise a batch of texts and return the indices of the tokens in each text.
+        The result is identical to calling ``tokenise_indices`` on each text separately.
+
+        :param texts: The texts to tokenise.
+        :return: The list of index lists, where each index list refers to the text at the same
+            position in ``texts``.
+        '''
+        return [self.tokenise_indices(text) for text in texts]
+
+    def tokenise_sentences_indices(
+        self,
+        text: str,
+        sentence_indices: Iterable[tuple[int, int]],
+    ) -> SentenceTokenIndices:
+        '''
+        Tokenise the sentences in a text, given by their indices (such as those returned by a
+        sentence splitter's ``split_indices``), and return the indices of the tokens in the text
+        grouped by sentence.
+        The tokens of each sentence are the same as those returned by ``tokenise_indices`` on the
+        sentence but with indices that refer to the whole text.
+        Any text outside the sentences is not tokenised.
+        The default behaviour is to tokenise each sentence separately.
+
+        :param text: The text to tokenise.
+        :param sentence_indices: The start and end index of each sentence in the text, in order.
+        :return: The ``SentenceTokenIndices`` sequence of the token indices of each sentence.
+        '''
+        sentence_data = array(TokenIndices.TYPECODE)
+        token_data = array(TokenIndices.TYPECODE)
+        sentence_token_starts = array(TokenIndices.TYPECODE, [0])
+        for (start, end) in sentence_indices:
+            sentence_data.append(start)
+            sentence_data.append(end)
+            for (token_start, token_end) in self.tokenise_indices(text[start:end]):
+                token_data.append(start + token_start)
+                token_data.append(start + token_end)
+            sentence_token_starts.append(len(token_data)//2)
+        return SentenceTokenIndices(
+            TokenIndices(sentence_data), TokenIndices(token_data), sentence_token_starts,
+        )
+
+    def retokenise_indices(
+        self,
+        text: str,
+        indices: list[tuple[int, int]],
+        start: int,
+        end: int,
+        replacement: str,
+    ) -> list[tuple[int, int]]:
+        '''
+        Update the indices of the tokens in a text after part of the text is replaced.
+        The result is the same as calling ``tokenise_indices`` on the edited text, that is,
+        ``text[:start] + replacement + text[end:]``.
+        The default behaviour is to tokenise the whole edited text again.
+
+        :param text: The text before the edit.
+        :param indices: The indices of the tokens in the text before the edit, as returned by
+            ``tokenise_indices``.
+        :param start: The index of the start of the replaced part of the text.
+        :param end: The index of the end of the replaced part of the text.
+        :param replacement: The text to put in place of the replaced part (which is an
+            insertion if ``start == end`` and a deletion if ``replacement`` is empty).
+        :return: The list of tuple pairs containing integers specifying the locations of the
+            tokens in the edited text.
+        '''
+        # pylint: disable=unused-argument
+        if not 0 <= start <= end <= len(text):
+            raise ValueError('The edit must be within the text.')
+        return self.tokenise_indices(text[:start] + replacement + text[end:])
+
+    def iter_tokenise(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        '''
+        Tokenise a text that is read from a stream, yielding the tokens one by one.
+        The tokens are the same as those returned by ``tokenise`` on the whole text.
+        The default behaviour is to read the whole stream into memory and tokenise it in one go.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of tokens.
+        '''
+        yield from self.tokenise(''.join(iter_chunks(stream, chunk_size)))
+
+    def iter_tokenise_indices(
+        self,
+        stream: Union[TextIO, Iterable[str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[tuple[int, int]]:
+        '''
+        Tokenise a text that is read from a stream, yielding the indices of the tokens one by one.
+        The indices are relative to the start of the whole stream and are the same as those
+        returned by ``tokenise_indices`` on the whole text.
+        The default behaviour is to read the whole stream into memory and tokenise it in one go.
+
+        :param stream: A text file object or an iterable of text chunks.
+        :param chunk_size: The number of characters to read at a time from file objects.
+        :return: An iterator of tuple pairs containing integers specifying the locations of the
+            tokens in the text.
+        '''
+        yield from self.tokenise_indices(''.join(iter_chunks(stream, chunk_size)))
+
     def detokenise(
         self,
         tokens: list[str],
@@ -54,3 +194,16 @@ class Tokeniser(ABC):
         :return: The text.
         '''
         return ' '.join(tokens)
+
+    def detokenise_batch(
+        self,
+        token_lists: Iterable[list[str]],
+    ) -> list[str]:
+        '''
+        Detokenise a batch of token lists back into whole texts, one for each token list.
+        The result is identical to calling ``detokenise`` on each token list separately.
+
+        :param token_lists: The tokenised texts.
+        :return: The list of texts.
+        '''
+        return [self.detokenise(tokens) for tokens in token_lists]
@@ -0,0 +1,227 @@
+'''
+Utilities shared by the different text processors.
+'''
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Iterable, Iterator, Optional, TextIO, TypeVar, Union
+
+
+__all__ = [
+    'DEFAULT_CHUNK_SIZE',
+    'iter_chunks',
+    'iter_batches',
+    'estimate_size',
+    'LRUCache',
+]
+
+
+T = TypeVar('T')
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+_EMPTY_STR_SIZE = sys.getsizeof('')
+
+
+DEFAULT_CHUNK_SIZE = 65536
+'''The default number of characters to read at a time from a stream.'''
+
+
+def iter_chunks(
+    stream: Union[TextIO, Iterable[str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    '''
+    Iterate over the chunks of text in a stream.
+    If the stream is a file object (has a ``read`` method) then it is read ``chunk_size``
+    characters at a time, otherwise it is iterated over as is.
+
+    :param stream: A text file object or an iterable of strings.
+    :param chunk_size: The number of characters to read at a time from file objects.
+    :return: An iterator of the non-empty chunks.
+    '''
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+
+    read = getattr(stream, 'read', None)
+    if read is not None:
+        while True:
+            chunk = read(chunk_size)
+            if chunk == '':
+                break
+            yield chunk
+    else:
+        for chunk in stream:
+            if chunk != '':
+                yield chunk
+
+
+def iter_batches(
+    items: Iterable[T],
+    batch_size: int,
+) -> Iterator[list[T]]:
+    '''
+    Group items into batches (lists) of a fixed size.
+
+    :param items: The items.
+    :param batch_size: The number of items in each batch (except possibly the last).
+    :return: An iterator of the non-empty batches.
+    '''
+    if batch_size < 1:
+        raise ValueError('batch_size must be a positive integer.')
+
+    batch: list[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def estimate_size(
+    obj: Any,
+) -> int:
+    '''
+    Estimate the number of bytes of memory taken by an object, including the items in any
+    (nested) tuples and lists.
+    For speed, the items of a tuple or list are assumed to all be of the same type as the first
+    and the size of a sequence of strings is estimated from the size of their concatenation.
+
+    :param obj: The object.
+    :return: The approximate number of bytes.
+    '''
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list)) and obj:
+        first = obj[0]
+        if isinstance(first, str):
+            size += sys.getsizeof(''.join(obj)) + (len(obj) - 1)*_EMPTY_STR_SIZE
+        elif isinstance(first, (tuple, list)):
+            size += sum(map(estimate_size, obj))
+        else:
+            size += sys.getsizeof(first)*len(obj)
+    return size
+
+
+class LRUCache(Generic[K, V]):
+    '''
+    A thread-safe least recently used cache that is bounded by the number of entries and by the
+    approximate number of bytes taken by its keys and values (as given by ``estimate_size``).
+    When adding an entry would exceed a bound, the least recently used entries are evicted.
+    '''
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = 64*1024**2,
+    ) -> None:
+        '''
+        Constructor.
+
+        :param max_entries: The maximum number of entries in the cache or ``None`` for no limit.
+        :param max_bytes: The maximum approximate number of bytes taken by the entries in the
+            cache or ``None`` for no limit.
+        '''
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._num_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        key: K,
+    ) -> Optional[V]:
+        '''
+        Get the value of an entry and mark it as the most recently used.
+
+        :param key: The key of the entry.
+        :return: The value or ``None`` if the key is not in the cache.
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(
+        self,
+        key: K,
+        value: V,
+    ) -> None:
+        '''
+        Add an entry to the cache, evicting the least recently used entries if needed.
+        Entries that are too big to fit in the cache on their own are not added.
+
+        :param key: The key of the entry.
+        :param value: The value of the entry.
+        '''
+        num_bytes = estimate_size(key) + estimate_size(value)
+        if self.max_bytes is not None and num_bytes > self.max_bytes:
+            return
+        if self.max_entries is not None and self.max_entries < 1:
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._num_bytes -= old_entry[1]
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) >= self.max_entries)
+                or (self.max_bytes is not None and self._num_bytes + num_bytes > self.max_bytes)
+            ):
+                (_, (_, evicted_bytes)) = self._entries.popitem(last=False)
+                self._num_bytes -= evicted_bytes
+                self._evictions += 1
+            self._entries[key] = (value, num_bytes)
+            self._num_bytes += num_bytes
+
+    def clear(
+        self,
+    ) -> None:
+        '''
+        Remove all the entries from the cache and reset its statistics.
+        '''
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_stats(
+        self,
+    ) -> dict[str, int]:
+        '''
+        Get statistics about the use of the cache.
+
+        :return: A dictionary with the number of ``hits``, ``misses``, and ``evictions`` so far,
+            together with the current number of entries (``size``) and approximate number of
+            bytes (``bytes``) in the cache.
+        '''
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'size': len(self._entries),
+                'bytes': self._num_bytes,
+            }
+
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of entries in the cache.
+
+        :return: The number of entries.
+        '''
+        return len(self._entries)
@@ -0,0 +1,239 @@
+'''
+Test the asynchronous processor.
+'''
+
+import asyncio
+import threading
+import unittest
+from typing import AsyncIterator, Iterator
+from malti.tokeniser import KMTokeniser
+from malti.sent_splitter import KMSentSplitter, RBSentSplitter
+from malti.asynchronous import AsyncProcessor, asplit, atokenise
+from malti.defaults import Defaults
+
+
+TEXT = '\n'.join(
+    f'Linja numru {i}. Fiha sentenza, eż. din, u oħra.\nSur Borg qal: "Iva!" {i % 7}-il darba.'
+    for i in range(200)
+) + '\n\nL-aħħar paragrafu   \n   fl-aħħar.'
+'''A long text with many lines.'''
+
+
+class SlowTokeniser(KMTokeniser):
+    '''
+    A tokeniser that counts the texts that it tokenises and can be made to wait before each one.
+    '''
+
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Constructor.
+        '''
+        super().__init__()
+        self.num_tokenised = 0
+        self.go = threading.Event()
+        self.go.set()
+
+    def tokenise(
+        self,
+        text: str,
+    ) -> list[str]:
+        '''
+        Tokenise a text after waiting for the ``go`` event.
+
+        :param text: The text to tokenise.
+        :return: The list of tokens.
+        '''
+        self.go.wait()
+        self.num_tokenised += 1
+        return super().tokenise(text)
+
+
+class AsyncProcessorTest(unittest.TestCase):
+    '''
+    Test the asynchronous processor.
+    '''
+
+    def test_same_results(
+        self,
+    ) -> None:
+        '''
+        Test that the results are the same as those of the components on the whole text,
+        regardless of the piece size and pool.
+        '''
+        tokeniser = KMTokeniser()
+        splitter = KMSentSplitter()
+
+        async def iter_chunks(
+            text: str,
+            chunk_size: int,
+        ) -> AsyncIterator[str]:
+            '''
+            Give a text in chunks.
+
+            :param text: The text.
+            :param chunk_size: The number of characters in a chunk.
+            :return: An asynchronous iterator of the chunks.
+            '''
+            for i in range(0, len(text), chunk_size):
+                yield text[i:i + chunk_size]
+
+        async def check(
+            processor: AsyncProcessor,
+        ) -> None:
+            '''
+            Check the results of a processor, including on texts with Windows new lines and
+            indented lines.
+
+            :param processor: The processor.
+            '''
+            async with processor:
+                for text in [TEXT, TEXT.replace('\n', '\r\n'), TEXT.replace('\n', '\n  ')]:
+                    self.assertEqual(await processor.atokenise(text), tokeniser.tokenise(text))
+                    self.assertEqual(await processor.asplit(text), splitter.split(text))
+                    self.assertEqual(
+                        [token async for token in processor.aiter_tokenise(text)],
+                        tokeniser.tokenise(text),
+                    )
+                    self.assertEqual(
+                        [
+                            sentence
+                            async for sentence in processor.aiter_split(iter_chunks(text, 97))
+                        ],
+                        splitter.split(text),
+                    )
+                    self.assertEqual(
+                        [
+                            sentence
+                            async for sentence in processor.aiter_split(text.splitlines(True))
+                        ],
+                        splitter.split(text),
+                    )
+                self.assertEqual(await processor.atokenise(''), [])
+                self.assertEqual([token async for token in processor.aiter_tokenise([])], [])
+
+        for piece_size in [1, 100, 1000, 100000]:
+            asyncio.run(check(AsyncProcessor(2, piece_size=piece_size)))
+        asyncio.run(check(AsyncProcessor(2, use_processes=True, piece_size=1000)))
+
+        async def check_defaults(
+        ) -> None:
+            '''
+            Check the default asynchronous functions, concurrently.
+            '''
+            results = await asyncio.gather(atokenise(TEXT), asplit(TEXT))
+            self.assertEqual(results, [tokeniser.tokenise(TEXT), splitter.split(TEXT)])
+
+        asyncio.run(check_defaults())
+
+        processor = Defaults.get('async_processor')
+        Defaults.clear()
+        with self.assertRaises(RuntimeError):
+            asyncio.run(processor.asplit(TEXT))
+
+        async def check_factory(
+        ) -> None:
+            '''
+            Check a processor with a sentence splitter factory.
+            '''
+            async with AsyncProcessor(1, sent_splitter_factory=RBSentSplitter) as processor:
+                self.assertEqual(await processor.asplit(TEXT), RBSentSplitter().split(TEXT))
+
+        asyncio.run(check_factory())
+
+    def test_cancellation(
+        self,
+    ) -> None:
+        '''
+        Test that cancelling a call stops it from processing the rest of the pieces.
+        '''
+        tokeniser = SlowTokeniser()
+
+        async def cancel(
+        ) -> None:
+            '''
+            Start tokenising a long text, cancel it while the first piece is being tokenised,
+            and then let the first piece finish.
+            '''
+            async with AsyncProcessor(1, tokeniser_factory=lambda: tokeniser, piece_size=100) \
+                    as processor:
+                tokeniser.go.clear()
+                task = asyncio.create_task(processor.atokenise(TEXT))
+                await asyncio.sleep(0.1)
+                task.cancel()
+                tokeniser.go.set()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(cancel())
+        self.assertEqual(tokeniser.num_tokenised, 1)
+
+    def test_blocking_stream(
+        self,
+    ) -> None:
+        '''
+        Test that the chunks of an iterable that is not asynchronous are read without blocking
+        the event loop.
+        '''
+        splitter = KMSentSplitter()
+        chunk_ready = threading.Event()
+        reader_threads: set[int] = set()
+
+        def iter_chunks(
+        ) -> Iterator[str]:
+            '''
+            Give the lines of the text, waiting for the ``chunk_ready`` event before the first one.
+
+            :return: An iterator of the chunks.
+            '''
+            reader_threads.add(threading.get_ident())
+            chunk_ready.wait()
+            yield from TEXT.splitlines(True)
+
+        async def collect(
+            processor: AsyncProcessor,
+        ) -> list[str]:
+            '''
+            Split the text read from the chunks.
+
+            :param processor: The processor.
+            :return: The sentences.
+            '''
+            return [sentence async for sentence in processor.aiter_split(iter_chunks())]
+
+        async def check(
+        ) -> None:
+            '''
+            Start splitting the text read from the chunks, check that the event loop keeps
+            running while the first chunk is being waited for, and then let it be read.
+            '''
+            async with AsyncProcessor(1) as processor:
+                task = asyncio.create_task(collect(processor))
+                await asyncio.sleep(0.1)
+                self.assertFalse(chunk_ready.is_set())
+                chunk_ready.set()
+                self.assertEqual(await task, splitter.split(TEXT))
+                self.assertNotIn(threading.get_ident(), reader_threads)
+
+        timer = threading.Timer(5, chunk_ready.set) # Do not wait forever if the loop is blocked.
+        timer.start()
+        try:
+            asyncio.run(check())
+        finally:
+            timer.cancel()
+
+    def test_invalid(
+        self,
+    ) -> None:
+        '''
+        Test that invalid settings are rejected.
+        '''
+        with self.assertRaises(ValueError):
+            AsyncProcessor(0)
+        with self.assertRaises(ValueError):
+            AsyncProcessor(piece_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
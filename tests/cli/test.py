@@ -0,0 +1,284 @@
+'''
+Test the command-line program.
+'''
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from malti.line_joiner import RBLineJoiner
+from malti.sent_splitter import KMSentSplitter
+from malti.tokeniser import KMTokeniser
+from malti.cli import main
+
+
+TEXT = (
+    'Il-kelb tiegħi qiegħed id-dar. Sur Borg qal: "Iva!"\n'
+    'Dan huwa eżem-\n'
+    'pju ta\' sentenza.\n'
+    '\n'
+    'Paragrafu ieħor, eż. dan.\n'
+)
+'''A text with two paragraphs, the first of which has a hyphenated word.'''
+
+
+class CLITest(unittest.TestCase):
+    '''
+    Test the command-line program.
+    '''
+
+    def setUp(
+        self,
+    ) -> None:
+        '''
+        Create a temporary directory with an input file in it and in a subdirectory.
+        '''
+        self.tmp_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.input_dir = os.path.join(self.tmp_dir.name, 'input')
+        os.makedirs(os.path.join(self.input_dir, 'sub'))
+        for path in ['a.txt', os.path.join('sub', 'b.txt')]:
+            with open(os.path.join(self.input_dir, path), 'w', encoding='utf-8') as f:
+                f.write(TEXT)
+        self.output_path = os.path.join(self.tmp_dir.name, 'output.txt')
+
+    def tearDown(
+        self,
+    ) -> None:
+        '''
+        Delete the temporary directory.
+        '''
+        self.tmp_dir.cleanup()
+
+    def run_main(
+        self,
+        args: list[str],
+    ) -> str:
+        '''
+        Run the program on the input directory and get its output.
+
+        :param args: The command-line arguments, without the inputs and output.
+        :return: The output.
+        '''
+        self.assertEqual(main(args + [self.input_dir, '--output', self.output_path]), 0)
+        with open(self.output_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def test_join(
+        self,
+    ) -> None:
+        '''
+        Test the ``join`` command.
+        '''
+        paragraphs = list(RBLineJoiner().iter_join_lines(TEXT.split('\n'), True))
+        self.assertEqual(
+            self.run_main(['join', '--fix-hyphenated-words']),
+            ''.join(paragraph + '\n' for paragraph in paragraphs*2),
+        )
+        self.assertEqual(
+            [
+                json.loads(line)
+                for line in self.run_main(['join', '--format', 'jsonl']).split('\n')[:-1]
+            ],
+            [
+                {'text': paragraph}
+                for paragraph in list(RBLineJoiner().iter_join_lines(TEXT.split('\n')))*2
+            ],
+        )
+
+    def test_split_tokenise(
+        self,
+    ) -> None:
+        '''
+        Test the ``split`` and ``tokenise`` commands, with and without worker processes.
+        '''
+        splitter = KMSentSplitter()
+        tokeniser = KMTokeniser()
+        lines = [line for line in TEXT.split('\n') if line != '']*2
+        paragraphs = list(RBLineJoiner().iter_join_lines(TEXT.split('\n'), True))*2
+
+        for workers in ['1', '2']:
+            self.assertEqual(
+                self.run_main(['split', '--workers', workers, '--chunk-size', '1']),
+                ''.join(
+                    ''.join(sentence + '\n' for sentence in splitter.split(line)) + '\n'
+                    for line in lines
+                ),
+            )
+            self.assertEqual(
+                [
+                    json.loads(line)
+                    for line in self.run_main([
+                        'tokenise', '--join-lines', '--fix-hyphenated-words', '--format', 'jsonl',
+                        '--workers', workers,
+                    ]).split('\n')[:-1]
+                ],
+                [
+                    {'tokens': tokeniser.tokenise_batch(splitter.split(paragraph))}
+                    for paragraph in paragraphs
+                ],
+            )
+            self.assertEqual(
+                self.run_main(['tokenise', '--no-split', '--workers', workers]),
+                ''.join(
+                    ''.join(token + '\n' for token in tokeniser.tokenise(line)) + '\n'
+                    for line in lines
+                ),
+            )
+
+        self.assertEqual(
+            self.run_main(['tokenise', '--format', 'sentences']).split('\n\n')[0],
+            '\n'.join(
+                ' '.join(tokens) for tokens in tokeniser.tokenise_batch(splitter.split(lines[0]))
+            ),
+        )
+
+    def test_detokenise(
+        self,
+    ) -> None:
+        '''
+        Test that the ``detokenise`` command reads each output format of the ``tokenise``
+        command.
+        '''
+        tokeniser = KMTokeniser()
+        sentences = [
+            sentence
+            for line in TEXT.split('\n') if line != ''
+            for sentence in KMSentSplitter().split(line)
+        ]*2
+        expected_output = ''.join(
+            tokeniser.detokenise(tokeniser.tokenise(sentence)) + '\n' for sentence in sentences
+        )
+
+        for output_format in ['tokens', 'sentences', 'jsonl']:
+            tokens_path = os.path.join(self.input_dir, 'tokens.txt')
+            self.run_main(['tokenise', '--format', output_format])
+            os.replace(self.output_path, tokens_path)
+            self.assertEqual(
+                main([
+                    'detokenise', '--input-format', output_format, tokens_path,
+                    '--output', self.output_path,
+                ]),
+                0,
+            )
+            with open(self.output_path, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), expected_output)
+            os.remove(tokens_path)
+
+    def test_standard_streams(
+        self,
+    ) -> None:
+        '''
+        Test reading from the standard input and writing to the standard output in UTF-8, with
+        the throughput report written to the standard error.
+        '''
+        stdin = io.TextIOWrapper(io.BytesIO(TEXT.encode('utf-8')), encoding='ascii')
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding='ascii')
+        stderr = io.StringIO()
+        with mock.patch.object(sys, 'stdin', stdin), mock.patch.object(sys, 'stdout', stdout), \
+                mock.patch.object(sys, 'stderr', stderr):
+            self.assertEqual(main(['tokenise', '--format', 'sentences', '--report']), 0)
+        self.assertEqual(
+            stdout.buffer.getvalue().decode('utf-8').split('\n')[0],
+            'Il- kelb tiegħi qiegħed id- dar .',
+        )
+        self.assertIn('MB/s', stderr.getvalue())
+        self.assertIn('tokens/s', stderr.getvalue())
+
+    def test_invalid(
+        self,
+    ) -> None:
+        '''
+        Test that invalid arguments are rejected.
+        '''
+        with mock.patch.object(sys, 'stderr', io.StringIO()):
+            for args in [
+                ['split', '--chunk-size', '0'],
+                ['tokenise', '--workers', '0'],
+                ['join', '--workers', '2'],
+                ['detokenise', '--workers', '2'],
+                ['tokenise', '--format', 'text'],
+                ['parse'],
+            ]:
+                with self.assertRaises(SystemExit):
+                    main(args)
+
+
+    def test_missing_file(
+        self,
+    ) -> None:
+        '''
+        Test that an input or output file that cannot be opened is reported in one line on the
+        standard error with a non-zero exit status.
+        '''
+        missing_path = os.path.join(self.tmp_dir.name, 'missing.txt')
+        for args in [
+            ['split', missing_path, '--output', self.output_path],
+            ['join', self.input_dir, '--output', os.path.join(missing_path, 'output.txt')],
+        ]:
+            stderr = io.StringIO()
+            with mock.patch.object(sys, 'stderr', stderr):
+                self.assertEqual(main(args), 1)
+            self.assertTrue(stderr.getvalue().startswith('malti: error: '))
+            self.assertIn('missing.txt', stderr.getvalue())
+            self.assertEqual(stderr.getvalue().count('\n'), 1)
+
+    def test_invalid_input(
+        self,
+    ) -> None:
+        '''
+        Test that an input file that is not valid UTF-8 or not valid JSON Lines for
+        ``detokenise`` is reported in one line with its path on the standard error with a
+        non-zero exit status.
+        '''
+        input_path = os.path.join(self.tmp_dir.name, 'bad.txt')
+        for (args, data) in [
+            (['split'], b'\xff\xfe bad\n'),
+            (['tokenise', '--workers', '2'], b'Tajjeb.\n\xff\xfe bad\n'),
+            (['detokenise', '--input-format', 'jsonl'], b'{"tokens": ["Iva"]}\nmhux JSON\n'),
+            (['detokenise', '--input-format', 'jsonl'], b'{"tokens": ["Iva"]}\n{"tokeni": []}\n'),
+            (['detokenise', '--input-format', 'jsonl'], b'["Iva"]\n'),
+        ]:
+            with open(input_path, 'wb') as f:
+                f.write(data)
+            stderr = io.StringIO()
+            with mock.patch.object(sys, 'stderr', stderr):
+                self.assertEqual(main(args + [input_path, '--output', self.output_path]), 1)
+            self.assertTrue(stderr.getvalue().startswith(f'malti: error: {input_path}: '))
+            self.assertEqual(stderr.getvalue().count('\n'), 1)
+
+        result = subprocess.run(
+            [sys.executable, '-m', 'malti', 'detokenise', '--input-format', 'jsonl'],
+            input=b'{"tokens": ["Iva"]}\n{"tokeni": []}\n', capture_output=True, check=False,
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertTrue(result.stderr.startswith(b'malti: error: <stdin>: '))
+        self.assertEqual(result.stderr.count(b'\n'), 1)
+
+    def test_broken_pipe(
+        self,
+    ) -> None:
+        '''
+        Test that the program stops quietly when whatever reads its standard output stops
+        reading, such as ``head``.
+        '''
+        input_path = os.path.join(self.tmp_dir.name, 'big.txt')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            f.write(TEXT*10000)
+        with subprocess.Popen(
+            [sys.executable, '-m', 'malti', 'tokenise', input_path],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        ) as process:
+            assert process.stdout is not None and process.stderr is not None
+            self.assertEqual(process.stdout.readline(), b'Il-\n')
+            process.stdout.close()
+            stderr = process.stderr.read()
+        self.assertEqual(process.returncode, 1)
+        self.assertEqual(stderr, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+'''
+Test ``split_tokenise_indices``.
+'''
+
+import os
+import json
+import random
+import unittest
+from malti.sent_splitter import KMSentSplitter, RBSentSplitter
+from malti.tokeniser import Tokeniser, KMTokeniser, KMScannerTokeniser, CachedTokeniser
+from malti.corpus import split_tokenise_indices
+
+
+class SplitTokeniseTest(unittest.TestCase):
+    '''
+    Test ``split_tokenise_indices``.
+    '''
+
+    def test_same_as_two_stages(
+        self,
+    ) -> None:
+        '''
+        Test that splitting and tokenising together gives the same sentences and tokens as
+        tokenising each sentence returned by ``split``.
+        '''
+        texts: list[str] = []
+        for name in ['sent_splitter/km_sent_splitter', 'tokeniser/km_tokeniser']:
+            with open(
+                os.path.join(os.path.dirname(__file__), '..', '..', name, 'test_set.json'),
+                'r', encoding='utf-8'
+            ) as f:
+                texts.extend(test_item['text'] for test_item in json.load(f))
+        rng = random.Random(0)
+        pieces = (
+            ['Il-kelb', 'qiegħed', 'Sur', 'eż.', 'U.S.A.', '12', '3.5', 'X’', 'x\'', 'd’', 'l-']
+            + list('      ..?!\'"()«»’“”-\n\n\t\xa0Ab')
+        )
+        texts.extend(''.join(rng.choices(pieces, k=rng.randint(1, 30))) for _ in range(2000))
+        texts.extend(['', ' ', '\n', 'Kelb. X’\xa0\nQattus.'])
+
+        km_splitter = KMSentSplitter()
+        km_tokeniser = KMTokeniser()
+        for text in texts:
+            sentences = km_splitter.split(text)
+            expected = [km_tokeniser.tokenise(sentence) for sentence in sentences]
+            for splitter in [km_splitter, RBSentSplitter()]:
+                for tokeniser in [
+                    km_tokeniser, KMScannerTokeniser(), CachedTokeniser(km_tokeniser),
+                ]:
+                    indices = split_tokenise_indices(text, splitter, tokeniser)
+                    self.assertEqual(
+                        [[text[i:j] for (i, j) in sentence] for sentence in indices],
+                        expected,
+                        msg=repr(text),
+                    )
+                    self.assertEqual(
+                        indices.sentence_indices,
+                        splitter.split_indices(text),
+                        msg=repr(text),
+                    )
+            self.assertEqual(
+                Tokeniser.tokenise_sentences_indices(
+                    km_tokeniser, text, km_splitter.split_indices(text),
+                ).tolist(),
+                split_tokenise_indices(text).tolist(),
+                msg=repr(text),
+            )
+
+        with self.assertRaises(ValueError):
+            km_tokeniser.tokenise_sentences_indices('Kelb. Qattus.', [(6, 13), (0, 5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
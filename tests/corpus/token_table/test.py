@@ -0,0 +1,141 @@
+'''
+Test the ``TokenTable``.
+'''
+
+import os
+import json
+import tempfile
+import unittest
+from malti.corpus import TokenTable
+from malti.sent_splitter import KMSentSplitter
+from malti.tokeniser import KMTokeniser, RegexTokeniser
+
+
+class TokenTableTest(unittest.TestCase):
+    '''
+    Test the ``TokenTable``.
+    '''
+
+    def setUp(
+        self,
+    ) -> None:
+        '''
+        Load the test documents and their nested list representation.
+        '''
+        with open(
+            os.path.join(
+                os.path.dirname(__file__), '..', '..', 'sent_splitter', 'km_sent_splitter',
+                'test_set.json',
+            ),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        splitter = KMSentSplitter()
+        tokeniser = KMTokeniser()
+        self.documents = [test_item['text'] for test_item in test_set] + [
+            '', '«Ħabib» ta\' €5 😀.', 'Tmiem.',
+        ]
+        self.expected = [
+            [tokeniser.tokenise(sentence) for sentence in splitter.split(document)]
+            for document in self.documents
+        ]
+
+    def check_table(
+        self,
+        table: TokenTable,
+    ) -> None:
+        '''
+        Check that a token table has the same tokens as the nested list representation.
+
+        :param table: The token table.
+        '''
+        self.assertEqual(table.num_documents, len(self.expected))
+        self.assertEqual(
+            table.num_sentences,
+            sum(len(sentences) for sentences in self.expected),
+        )
+        for (doc_id, sentences) in enumerate(self.expected):
+            self.assertEqual(table.get_document(doc_id), sentences, msg=doc_id)
+        self.assertEqual(
+            list(table.iter_sentences()),
+            [tokens for sentences in self.expected for tokens in sentences if tokens],
+        )
+        self.assertEqual(
+            [table.get_token(i) for i in range(len(table))],
+            [token for sentences in self.expected for tokens in sentences for token in tokens],
+        )
+
+    def test_build(
+        self,
+    ) -> None:
+        '''
+        Test that a built token table has the same tokens as splitting and tokenising each
+        document, with byte offsets into the UTF-8 text buffer.
+        '''
+        table = TokenTable.build(self.documents, KMSentSplitter(), KMTokeniser())
+        self.check_table(table)
+
+        table = TokenTable.build(['Għandi kelb. Il-kelb.'])
+        self.assertEqual(table.text, 'Għandi kelb.\nIl-kelb.\n'.encode('utf-8'))
+        self.assertEqual(list(table.token_starts), [0, 8, 12, 14, 17, 21])
+        self.assertEqual(list(table.token_ends), [7, 12, 13, 17, 21, 22])
+        self.assertEqual(list(table.sentence_ids), [0, 0, 0, 1, 1, 1])
+        self.assertEqual(list(table.doc_ids), [0, 0, 0, 0, 0, 0])
+
+    def test_sentences_without_tokens(
+        self,
+    ) -> None:
+        '''
+        Test that sentences without tokens at the start and end of a document are kept.
+        '''
+        splitter = KMSentSplitter()
+        tokeniser = RegexTokeniser(r'[^\W\d]+') # Numbers are not tokens.
+        documents = ['2024. Il-kelb jiġri. 123!', '456.', 'Qattus.', '']
+        table = TokenTable.build(documents, splitter, tokeniser)
+        for (doc_id, document) in enumerate(documents):
+            self.assertEqual(
+                table.get_document(doc_id),
+                [tokeniser.tokenise(sentence) for sentence in splitter.split(document)],
+            )
+        self.assertEqual(table.get_document(0), [[], ['Il', 'kelb', 'jiġri'], []])
+        self.assertEqual(table.get_document(1), [[]])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'table.bin')
+            table.save(path)
+            loaded = TokenTable.load(path)
+            self.assertEqual(
+                [loaded.get_document(doc_id) for doc_id in range(len(documents))],
+                [table.get_document(doc_id) for doc_id in range(len(documents))],
+            )
+            loaded.close()
+
+    def test_save_load(
+        self,
+    ) -> None:
+        '''
+        Test that a saved token table is loaded back the same with and without memory mapping.
+        '''
+        table = TokenTable.build(self.documents)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'table.bin')
+            table.save(path)
+
+            loaded = TokenTable.load(path, use_mmap=False)
+            self.check_table(loaded)
+            loaded.save(os.path.join(tmp_dir, 'copy.bin'))
+
+            loaded = TokenTable.load(os.path.join(tmp_dir, 'copy.bin'))
+            self.assertIsInstance(loaded.token_starts, memoryview)
+            self.check_table(loaded)
+            loaded.close()
+
+            with open(path, 'r+b') as f:
+                f.truncate(os.path.getsize(path) - 1)
+            with self.assertRaises(ValueError):
+                TokenTable.load(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+'''
+Test the ``Data``.
+'''
+
+import os
+import json
+import tempfile
+import threading
+import time
+import unittest
+from malti.data import Data, NonBreakingPrefixIndex
+from malti.sent_splitter import KMSentSplitter, RBSentSplitter
+
+
+class DataTest(unittest.TestCase):
+    '''
+    Test the ``Data``.
+    '''
+
+    def test_non_breaking_prefixes(
+        self,
+    ) -> None:
+        '''
+        Test that the non-breaking prefix index is shared by the sentence splitters and that
+        prefixes added to it affect existing sentence splitters.
+        '''
+        index = Data.get_non_breaking_prefixes()
+        self.assertIs(Data.get_non_breaking_prefixes(), index)
+        self.assertIn('Mr', index)
+
+        km_splitter = KMSentSplitter()
+        rb_splitter = RBSentSplitter()
+        self.assertIs(km_splitter.prefix_index, index)
+        self.assertIs(rb_splitter.prefix_index, index)
+
+        text = 'Ħadt kopja minn Mużx. Tal-Arti. Jiena u hu. Daqs Xyzq. 5 drabi.'
+        for splitter in [km_splitter, rb_splitter]:
+            self.assertEqual(
+                splitter.split(text),
+                ['Ħadt kopja minn Mużx.', 'Tal-Arti.', 'Jiena u hu.', 'Daqs Xyzq.', '5 drabi.'],
+            )
+
+        Data.add_non_breaking_prefixes(['Mużx'])
+        Data.add_non_breaking_prefixes(['Xyzq'], numeric_only=True)
+        for splitter in [km_splitter, rb_splitter, KMSentSplitter(), RBSentSplitter()]:
+            self.assertEqual(
+                splitter.split(text),
+                ['Ħadt kopja minn Mużx. Tal-Arti.', 'Jiena u hu.', 'Daqs Xyzq. 5 drabi.'],
+            )
+
+    def test_lazy_loading(
+        self,
+    ) -> None:
+        '''
+        Test that a registered resource is loaded once, even when first requested by several
+        threads at the same time, and again after being cleared.
+        '''
+        calls = []
+
+        def load(
+            path: str,
+        ) -> list[str]:
+            '''
+            Load a resource slowly.
+
+            :param path: The path to the file.
+            :return: The resource.
+            '''
+            calls.append(path)
+            time.sleep(0.05)
+            return ['kelb']
+
+        Data.register('test_lazy_loading', 'kelb.txt', load)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(Data.get('test_lazy_loading')))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, ['kelb.txt'])
+        self.assertEqual(len(results), 5)
+        for result in results:
+            self.assertIs(result, results[0])
+
+        Data.preload(['test_lazy_loading'])
+        self.assertEqual(len(calls), 1)
+        Data.clear(['test_lazy_loading'])
+        Data.preload()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(Data.get('test_lazy_loading'), ['kelb'])
+
+        with self.assertRaises(KeyError):
+            Data.get('test_no_such_resource')
+
+    def test_cache(
+        self,
+    ) -> None:
+        '''
+        Test that compiled resources are loaded from their cache file for as long as their source
+        file is not modified.
+        '''
+        calls = []
+
+        def load(
+            path: str,
+        ) -> set[str]:
+            '''
+            Load a resource from a JSON file.
+
+            :param path: The path to the file.
+            :return: The resource.
+            '''
+            calls.append(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                return set(json.load(f))
+
+        def to_bytes(
+            words: set[str],
+        ) -> bytes:
+            '''
+            Write a resource in a binary form.
+
+            :param words: The resource.
+            :return: The bytes.
+            '''
+            return '\n'.join(sorted(words)).encode('utf-8')
+
+        def from_bytes(
+            data: bytes,
+        ) -> set[str]:
+            '''
+            Read a resource from its binary form.
+
+            :param data: The bytes.
+            :return: The resource.
+            '''
+            return set(data.decode('utf-8').split('\n'))
+
+        with self.assertRaises(ValueError):
+            Data.register('test_cache', 'words.json', load, to_bytes)
+
+        with tempfile.TemporaryDirectory() as path:
+            source_file = os.path.join(path, 'words.json')
+            with open(source_file, 'w', encoding='utf-8') as f:
+                json.dump(['kelb', 'qattus'], f)
+            Data.register('test_cache', source_file, load, to_bytes, from_bytes)
+
+            self.assertEqual(Data.compile(['test_cache']), [source_file + '.cache'])
+            self.assertEqual(len(calls), 1)
+            with open(source_file + '.cache', 'rb') as cache_f:
+                cache_data = cache_f.read()
+            self.assertTrue(cache_data.startswith(Data.CACHE_FILE_MAGIC))
+            self.assertTrue(cache_data.endswith(b'kelb\nqattus'))
+            self.assertEqual(Data.get('test_cache'), {'kelb', 'qattus'})
+            self.assertEqual(len(calls), 1)
+
+            Data.register('test_no_cache', source_file, load)
+            with self.assertRaises(ValueError):
+                Data.compile(['test_no_cache'])
+            self.assertEqual(Data.get('test_no_cache'), {'kelb', 'qattus'})
+            self.assertEqual(len(calls), 2)
+
+            with open(source_file, 'w', encoding='utf-8') as f:
+                json.dump(['kelb', 'qattus', 'ħanżir'], f)
+            Data.clear(['test_cache'])
+            self.assertEqual(Data.get('test_cache'), {'kelb', 'qattus', 'ħanżir'})
+            self.assertEqual(len(calls), 3)
+
+            cache_directory = os.path.join(path, 'cache')
+            os.mkdir(cache_directory)
+            Data.set_cache_directory(cache_directory)
+            try:
+                Data.compile()
+                self.assertEqual(
+                    sorted(os.listdir(cache_directory)),
+                    [
+                        'mt_non_breaking_prefixes.txt.cache',
+                        'tokens_with_dash_end.json.cache',
+                        'words.json.cache',
+                    ],
+                )
+                Data.clear(['test_cache'])
+                self.assertEqual(Data.get('test_cache'), {'kelb', 'qattus', 'ħanżir'})
+                self.assertEqual(len(calls), 4)
+
+                with open(Data.get_cache_path(Data.NON_BREAKING_PREFIX_FILE), 'rb') as cache_f:
+                    self.assertTrue(cache_f.read().startswith(Data.CACHE_FILE_MAGIC))
+                Data.clear(['non_breaking_prefixes'])
+                cached_index = Data.get_non_breaking_prefixes()
+                self.assertIsInstance(cached_index, NonBreakingPrefixIndex)
+                self.assertEqual(
+                    cached_index.non_breaking_prefixes,
+                    NonBreakingPrefixIndex.from_file(
+                        Data.NON_BREAKING_PREFIX_FILE
+                    ).non_breaking_prefixes,
+                )
+                Data.clear(['tokens_with_dash_end'])
+                self.assertIn('il-', Data.get_tokens_with_dash_end())
+            finally:
+                Data.set_cache_directory(None)
+                Data.clear(['non_breaking_prefixes', 'tokens_with_dash_end'])
+
+
+if __name__ == '__main__':
+    unittest.main()
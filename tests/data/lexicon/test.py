@@ -0,0 +1,77 @@
+'''
+Test the ``Lexicon``.
+'''
+
+import os
+import pickle
+import tempfile
+import unittest
+from malti.data import Lexicon
+
+
+class LexiconTest(unittest.TestCase):
+    '''
+    Test the ``Lexicon``.
+    '''
+
+    def test_lookup(
+        self,
+    ) -> None:
+        '''
+        Test that a lexicon contains exactly the words it was built from.
+        '''
+        words = ['kelb', 'qattus', 'ħanżir', 'żiemel', 'ċawla', 'għasfur', 'Kelb', 'a', 'ż']
+        with tempfile.TemporaryDirectory() as path:
+            lexicon_file = os.path.join(path, 'lexicon.bin')
+            Lexicon.build(words + ['', 'kelb'], lexicon_file)
+            self.assertEqual(os.listdir(path), ['lexicon.bin'])
+
+            lexicon = Lexicon(lexicon_file)
+            self.assertEqual(len(lexicon), len(words))
+            self.assertEqual(sorted(lexicon), sorted(words))
+            for word in words:
+                self.assertIn(word, lexicon)
+            for word in ['', 'kel', 'kelbb', 'KELB', 'ħ', 'żiemell', 'b']:
+                self.assertNotIn(word, lexicon)
+            self.assertNotIn(5, lexicon)
+
+            unpickled = pickle.loads(pickle.dumps(lexicon))
+            self.assertEqual(list(unpickled), list(lexicon))
+            unpickled.close()
+            lexicon.close()
+
+    def test_empty(
+        self,
+    ) -> None:
+        '''
+        Test that a lexicon can be empty.
+        '''
+        with tempfile.TemporaryDirectory() as path:
+            lexicon_file = os.path.join(path, 'lexicon.bin')
+            Lexicon.build([], lexicon_file)
+            lexicon = Lexicon(lexicon_file)
+            self.assertEqual(len(lexicon), 0)
+            self.assertNotIn('kelb', lexicon)
+            lexicon.close()
+
+    def test_invalid_file(
+        self,
+    ) -> None:
+        '''
+        Test that opening a file that is not a lexicon raises an error.
+        '''
+        with tempfile.TemporaryDirectory() as path:
+            lexicon_file = os.path.join(path, 'lexicon.bin')
+            Lexicon.build(['kelb', 'qattus'], lexicon_file)
+            with open(lexicon_file, 'rb') as f:
+                data = f.read()
+
+            for invalid_data in [b'MALTI', b'MALTIXX1' + data[8:], data[:-1], data + b'x']:
+                with open(lexicon_file, 'wb') as f:
+                    f.write(invalid_data)
+                with self.assertRaises(ValueError):
+                    Lexicon(lexicon_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
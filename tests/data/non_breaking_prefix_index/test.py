@@ -0,0 +1,146 @@
+'''
+Test the ``NonBreakingPrefixIndex``.
+'''
+
+import os
+import tempfile
+import unittest
+import sentence_splitter
+from malti.data import Data, NonBreakingPrefixIndex
+
+
+class NonBreakingPrefixIndexTest(unittest.TestCase):
+    '''
+    Test the ``NonBreakingPrefixIndex``.
+    '''
+
+    def test_from_file(
+        self,
+    ) -> None:
+        '''
+        Test that reading an index from a text file gives the same prefixes as the
+        ``sentence_splitter`` package.
+        '''
+        with tempfile.TemporaryDirectory() as path:
+            prefix_file = os.path.join(path, 'prefixes.txt')
+            with open(prefix_file, 'w', encoding='utf-8') as f:
+                f.write(
+                    '# A comment.\n'
+                    '\n'
+                    'Sur\n'
+                    '  Dott  # A title.\n'
+                    'Nru #NUMERIC_ONLY#\n'
+                    'Art #NUMERIC_ONLY#\n'
+                    'Art\n'
+                )
+
+            for file_name in [prefix_file, Data.NON_BREAKING_PREFIX_FILE]:
+                index = NonBreakingPrefixIndex.from_file(file_name)
+                splitter = sentence_splitter.SentenceSplitter(
+                    language='it', non_breaking_prefix_file=file_name,
+                )
+                prefixes = getattr(splitter, '_SentenceSplitter__non_breaking_prefixes')
+                prefix_type = sentence_splitter.SentenceSplitter.PrefixType
+                self.assertEqual(
+                    index.non_breaking_prefixes,
+                    {prefix for (prefix, kind) in prefixes.items() if kind == prefix_type.DEFAULT},
+                )
+                self.assertEqual(
+                    index.numeric_only_prefixes,
+                    {
+                        prefix for (prefix, kind) in prefixes.items()
+                        if kind == prefix_type.NUMERIC_ONLY
+                    },
+                )
+                self.assertEqual(index.version, 0)
+
+            index = NonBreakingPrefixIndex.from_file(prefix_file)
+            self.assertEqual(index.non_breaking_prefixes, {'Sur', 'Dott', 'Art'})
+            self.assertEqual(index.numeric_only_prefixes, {'Nru'})
+
+    def test_add(
+        self,
+    ) -> None:
+        '''
+        Test adding prefixes to an index.
+        '''
+        index = NonBreakingPrefixIndex(['Sur', 'Nru'], ['Nru'])
+        self.assertEqual(index.non_breaking_prefixes, {'Sur'})
+        self.assertEqual(index.numeric_only_prefixes, {'Nru'})
+        non_breaking_prefixes = index.non_breaking_prefixes
+
+        index.add('Dott')
+        index.add('Sur', True)
+        self.assertEqual(index.non_breaking_prefixes, {'Dott'})
+        self.assertEqual(index.numeric_only_prefixes, {'Nru', 'Sur'})
+        self.assertEqual(index.version, 2)
+
+        index.add_all(['Nru', 'Prof'])
+        index.add_all(['Art'], True)
+        self.assertEqual(index.non_breaking_prefixes, {'Dott', 'Nru', 'Prof'})
+        self.assertEqual(index.numeric_only_prefixes, {'Sur', 'Art'})
+        self.assertEqual(index.version, 4)
+
+        self.assertIs(index.non_breaking_prefixes, non_breaking_prefixes)
+        self.assertEqual(len(index), 5)
+        self.assertIn('Art', index)
+        self.assertIn('Prof', index)
+        self.assertNotIn('Kelb', index)
+
+    def test_to_text(
+        self,
+    ) -> None:
+        '''
+        Test writing an index as a text in the ``sentence_splitter`` format and reading it back.
+        '''
+        for index in [
+            NonBreakingPrefixIndex.from_file(Data.NON_BREAKING_PREFIX_FILE),
+            NonBreakingPrefixIndex(['Sur', 'Ġen', 'ċ'], ['Nru']),
+            NonBreakingPrefixIndex(),
+        ]:
+            loaded = NonBreakingPrefixIndex.from_text(index.to_text())
+            self.assertEqual(loaded.non_breaking_prefixes, index.non_breaking_prefixes)
+            self.assertEqual(loaded.numeric_only_prefixes, index.numeric_only_prefixes)
+
+        self.assertEqual(
+            NonBreakingPrefixIndex(['Sur', 'Dott'], ['Nru']).to_text(),
+            'Dott\nSur\nNru #NUMERIC_ONLY#\n',
+        )
+        for prefix in ['Kap#1', 'Kap 1', ' Kap']:
+            with self.assertRaises(ValueError):
+                NonBreakingPrefixIndex([prefix]).to_text()
+
+    def test_save_load(
+        self,
+    ) -> None:
+        '''
+        Test saving an index to a binary file and loading it back.
+        '''
+        with tempfile.TemporaryDirectory() as path:
+            file_name = os.path.join(path, 'prefixes.bin')
+            for index in [
+                NonBreakingPrefixIndex.from_file(Data.NON_BREAKING_PREFIX_FILE),
+                NonBreakingPrefixIndex(['Sur', 'Ġen', 'ċ'], ['Nru']),
+                NonBreakingPrefixIndex([], ['Nru']),
+                NonBreakingPrefixIndex(),
+            ]:
+                index.save(file_name)
+                loaded = NonBreakingPrefixIndex.load(file_name)
+                self.assertEqual(loaded.non_breaking_prefixes, index.non_breaking_prefixes)
+                self.assertEqual(loaded.numeric_only_prefixes, index.numeric_only_prefixes)
+
+            with open(file_name, 'wb') as f:
+                f.write(b'MALTITT1' + bytes(16))
+            with self.assertRaises(ValueError):
+                NonBreakingPrefixIndex.load(file_name)
+
+            NonBreakingPrefixIndex(['Sur', 'Ġen'], ['Nru']).save(file_name)
+            with open(file_name, 'rb') as f:
+                data = f.read()
+            with open(file_name, 'wb') as f:
+                f.write(data[:-4])
+            with self.assertRaises(ValueError):
+                NonBreakingPrefixIndex.load(file_name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+'''
+Test the ``Defaults``.
+'''
+
+import subprocess
+import sys
+import time
+import threading
+import unittest
+import malti.tokeniser
+import malti.sent_splitter
+import malti.line_joiner
+from malti.defaults import Defaults
+
+
+class DefaultsTest(unittest.TestCase):
+    '''
+    Test the ``Defaults``.
+    '''
+
+    def test_warm_up(
+        self,
+    ) -> None:
+        '''
+        Test that ``warm_up`` creates the default components used by the convenience functions,
+        including components registered by other modules.
+        '''
+        created: list[object] = []
+
+        def factory(
+        ) -> object:
+            '''
+            Create a new object.
+
+            :return: The object.
+            '''
+            instance = object()
+            created.append(instance)
+            return instance
+
+        Defaults.register('test_warm_up', factory)
+        self.addCleanup(Defaults.unregister, 'test_warm_up')
+        Defaults.clear()
+        Defaults.warm_up()
+        self.assertEqual(len(created), 1)
+        self.assertIs(Defaults.get('test_warm_up'), created[0])
+
+        tokeniser = Defaults.get('tokeniser')
+        splitter = Defaults.get('sent_splitter')
+        line_joiner = Defaults.get('line_joiner')
+        self.assertIsInstance(tokeniser, malti.tokeniser.KMTokeniser)
+        self.assertIsInstance(splitter, malti.sent_splitter.KMSentSplitter)
+        self.assertIsInstance(line_joiner, malti.line_joiner.RBLineJoiner)
+
+        text = 'Dan it-test. Test ieħor.'
+        self.assertEqual(malti.tokeniser.tokenise(text), tokeniser.tokenise(text))
+        self.assertEqual(malti.sent_splitter.split(text), splitter.split(text))
+        self.assertEqual(
+            malti.line_joiner.join_lines(['Dan it-', 'test.'], True),
+            line_joiner.join_lines(['Dan it-', 'test.'], True),
+        )
+        self.assertIs(Defaults.get('tokeniser'), tokeniser)
+
+        Defaults.clear()
+        self.assertIsNot(Defaults.get('tokeniser'), tokeniser)
+
+    def test_warm_up_fresh(
+        self,
+    ) -> None:
+        '''
+        Test that ``warm_up`` creates the default components of the convenience functions in a
+        new process where only ``malti.defaults`` was imported.
+        '''
+        output = subprocess.run(
+            [
+                sys.executable, '-c',
+                'from malti.defaults import Defaults\n'
+                'Defaults.warm_up()\n'
+                'print(sorted(Defaults._Defaults__instances))\n',
+            ],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        self.assertEqual(output.strip(), str(['line_joiner', 'sent_splitter', 'tokeniser']))
+
+    def test_thread_safety(
+        self,
+    ) -> None:
+        '''
+        Test that a default component is only created once when requested by many threads at the
+        same time.
+        '''
+        created: list[object] = []
+
+        def factory(
+        ) -> object:
+            '''
+            Create a new object slowly.
+
+            :return: The object.
+            '''
+            time.sleep(0.01)
+            instance = object()
+            created.append(instance)
+            return instance
+
+        Defaults.register('test_thread_safety', factory)
+        self.addCleanup(Defaults.unregister, 'test_thread_safety')
+        instances: list[object] = []
+        threads = [
+            threading.Thread(target=lambda: instances.append(Defaults.get('test_thread_safety')))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(instances, created*10)
+
+    def test_close(
+        self,
+    ) -> None:
+        '''
+        Test that discarded components are closed when they were registered with a function
+        that closes them.
+        '''
+        closed: list[object] = []
+        Defaults.register('test_close', object, closed.append)
+        self.addCleanup(Defaults.unregister, 'test_close')
+
+        Defaults.clear()
+        self.assertEqual(closed, [])
+        instances = [Defaults.get('test_close')]
+        Defaults.clear()
+        self.assertEqual(closed, instances)
+
+        instances.append(Defaults.get('test_close'))
+        Defaults.register('test_close', object, closed.append)
+        self.assertEqual(closed, instances)
+
+        instances.append(Defaults.get('test_close'))
+        Defaults.unregister('test_close')
+        self.assertEqual(closed, instances)
+        Defaults.register('test_close', object)
+
+    def test_unregistered(
+        self,
+    ) -> None:
+        '''
+        Test that requesting an unregistered component raises an error.
+        '''
+        with self.assertRaises(KeyError):
+            Defaults.get('test_unregistered')
+        with self.assertRaises(KeyError):
+            Defaults.unregister('test_unregistered')
+
+        Defaults.register('test_unregistered', object)
+        Defaults.get('test_unregistered')
+        Defaults.unregister('test_unregistered')
+        with self.assertRaises(KeyError):
+            Defaults.get('test_unregistered')
+
+
+if __name__ == '__main__':
+    unittest.main()
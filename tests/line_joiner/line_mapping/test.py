@@ -0,0 +1,58 @@
+'''
+Test the ``LineMapping``.
+'''
+
+from array import array
+import unittest
+from malti.line_joiner import LineMapping
+
+
+class LineMappingTest(unittest.TestCase):
+    '''
+    Test the ``LineMapping``.
+    '''
+
+    def test_sequence(
+        self,
+    ) -> None:
+        '''
+        Test that ``LineMapping`` behaves like a list of line and column pairs.
+        '''
+        # The lines [' il-', 'kelb impor-', '', 'tanti.'] joined into 'il-kelb importanti.'.
+        pairs = (
+            [(0, 1), (0, 2), (0, 3)]
+            + [(1, i) for i in range(10)]
+            + [(3, i) for i in range(6)]
+        )
+        mapping = LineMapping(
+            19, array('q', [0, 3, 13]), array('q', [0, 1, 3]), array('q', [1, 0, 0]),
+        )
+
+        self.assertEqual(len(mapping), 19)
+        self.assertEqual(mapping.tolist(), pairs)
+        for i in range(-19, 19):
+            self.assertEqual(mapping[i], pairs[i], msg=i)
+        self.assertEqual(mapping[2:5], pairs[2:5])
+        with self.assertRaises(IndexError):
+            mapping[19] # pylint: disable=pointless-statement
+        self.assertEqual(list(mapping.segments()), [(0, 0, 1), (3, 1, 0), (13, 3, 0)])
+        self.assertEqual(mapping.nbytes, 9*8)
+
+        self.assertEqual(mapping.source_spans(0, 3), [(0, 1, 4)])
+        self.assertEqual(mapping.source_spans(0, 7), [(0, 1, 4), (1, 0, 4)])
+        self.assertEqual(mapping.source_spans(8, 19), [(1, 5, 10), (3, 0, 6)])
+        self.assertEqual(mapping.source_spans(5, 5), [])
+        with self.assertRaises(ValueError):
+            mapping.source_spans(5, 20)
+
+        self.assertEqual(LineMapping().tolist(), [])
+        with self.assertRaises(ValueError):
+            LineMapping(1, array('q', [0]), array('q', [0]), array('q'))
+        with self.assertRaises(ValueError):
+            LineMapping(1, array('q', [1]), array('q', [0]), array('q', [0]))
+        with self.assertRaises(ValueError):
+            LineMapping(1, array('i', [0]), array('q', [0]), array('q', [0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,40 @@ Test the ``RBLineJoiner``.
 
 import os
 import json
+import random
+import tempfile
 import unittest
-from malti.line_joiner import RBLineJoiner
+from malti.data import Data, Lexicon
+from malti.line_joiner import LineJoiner, RBLineJoiner
+
+
+class DelegatingLineJoiner(LineJoiner):
+    '''
+    A line joiner that uses ``RBLineJoiner.join_lines`` with the default ``iter_join_lines``.
+    '''
+
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        self.line_joiner = RBLineJoiner()
+
+    def join_lines(
+        self,
+        lines: list[str],
+        fix_hyphenated_words: bool = False,
+    ) -> str:
+        '''
+        Join the lines with ``RBLineJoiner``.
+
+        :param lines: A list of Maltese text lines.
+        :param fix_hyphenated_words: Whether to try to join hyphenated word segments back
+            together as well.
+        :return: The joined lines.
+        '''
+        return self.line_joiner.join_lines(lines, fix_hyphenated_words)
 
 
 class RBLineJoinerTest(unittest.TestCase):
@@ -40,6 +72,240 @@ class RBLineJoinerTest(unittest.TestCase):
                     msg=f'fix_hyphenated_words={fix_hyphenated_words}: {output}',
                 )
 
+    def test_join_lines_rules(
+        self,
+    ) -> None:
+        '''
+        Test that ``join_lines`` gives the same result as applying the rules to whole lines, one
+        line at a time, on random lines.
+        '''
+        line_joiner = RBLineJoiner()
+
+        def is_hyphenated_word_at_end(
+            line: str,
+        ) -> bool:
+            '''
+            Check if the line ends with a hyphenated word by matching the rules against the whole
+            line.
+
+            :param line: The line to check.
+            :return: Whether the line ends with a hyphenated word.
+            '''
+            if line[-1] != '-':
+                return False
+            match = line_joiner.last_word_re.match(line)
+            assert match is not None
+            last_word = match.group('last_word').lower()
+            return not (
+                last_word == '-'
+                or last_word in Data.get_tokens_with_dash_end()
+                or line_joiner.url_re.match(line)
+                or line_joiner.num_re.match(line)
+            )
+
+        def join_lines(
+            lines: list[str],
+            fix_hyphenated_words: bool,
+        ) -> str:
+            '''
+            Join lines one line at a time.
+
+            :param lines: The lines.
+            :param fix_hyphenated_words: Whether to join hyphenated words.
+            :return: The joined lines.
+            '''
+            lines = [line.strip() for line in lines if line.strip() != '']
+            new_lines = []
+            for (i, line) in enumerate(lines):
+                new_lines.append(line)
+                if i == len(lines) - 1:
+                    pass
+                elif line[-1] in '-—/':
+                    if len(line) > 1 and line[-2] == ' ':
+                        new_lines.append(' ')
+                    elif fix_hyphenated_words and is_hyphenated_word_at_end(line):
+                        new_lines[-1] = line[:-1]
+                else:
+                    new_lines.append(' ')
+            return ''.join(new_lines)
+
+        pieces = [
+            'kelb', 'Qattus', 'impor', 'ĦAŻIN', 'ċawla', 'il', 'Il', 'tal', '2023', 'x1', 'http://',
+            'www.', 'kelb.com', '.org', 'ftp:', '/', '—', '-', ' ', ' ', ' ', '\t', '\xa0', '.',
+            ',', '"', '\'', 'K', 'ſ', 'a-b', 'e.g.', 'impor-', 'tal-', 'x.com/a-', '5-',
+        ]
+        rng = random.Random(0)
+        for _ in range(3000):
+            lines = [
+                ''.join(rng.choices(pieces, k=rng.randint(0, 8)))
+                for _ in range(rng.randint(0, 6))
+            ]
+            for fix_hyphenated_words in [False, True]:
+                expected = join_lines(lines, fix_hyphenated_words)
+                self.assertEqual(
+                    line_joiner.join_lines(lines, fix_hyphenated_words), expected, msg=lines,
+                )
+                self.assertEqual(
+                    line_joiner.join_lines_with_mapping(lines, fix_hyphenated_words)[0],
+                    expected,
+                    msg=lines,
+                )
+
+        # Lines that contain new lines are joined one line at a time.
+        self.assertEqual(
+            line_joiner.join_lines(['Il-kelb\nu l-', 'qattus', 'impor-', 'tanti'], True),
+            'Il-kelb\nu l-qattus importanti',
+        )
+
+    def test_join_lines_lexicon(
+        self,
+    ) -> None:
+        '''
+        Test that a lexicon is used to decide whether a word is hyphenated only when exactly one
+        of its joined and dashed forms is known.
+        '''
+        with tempfile.TemporaryDirectory() as path:
+            lexicon_file = os.path.join(path, 'lexicon.bin')
+            Lexicon.build(
+                ['importanti', 'ekonomiku-soċjali', 'soċjo-ekonomiku', 'soċjoekonomiku'],
+                lexicon_file,
+            )
+            lexicon = Lexicon(lexicon_file)
+
+            for (lines, expected_without_lexicon, expected_with_lexicon) in [
+                (['Impor-', 'tanti.'], 'Importanti.', 'Importanti.'),
+                (['L-iżvilupp ekonomiku-', 'soċjali.'], 'L-iżvilupp ekonomikusoċjali.',
+                    'L-iżvilupp ekonomiku-soċjali.'),
+                (['Soċjo-', 'ekonomiku.'], 'Soċjoekonomiku.', 'Soċjoekonomiku.'),
+                (['Il-', 'lum.'], 'Il-lum.', 'Il-lum.'),
+                (['Kelb-', '"qattus".'], 'Kelb"qattus".', 'Kelb"qattus".'),
+            ]:
+                self.assertEqual(
+                    RBLineJoiner().join_lines(lines, fix_hyphenated_words=True),
+                    expected_without_lexicon,
+                )
+                line_joiner = RBLineJoiner(lexicon)
+                self.assertEqual(
+                    line_joiner.join_lines(lines, fix_hyphenated_words=True),
+                    expected_with_lexicon,
+                )
+                self.assertEqual(
+                    list(line_joiner.iter_join_lines(lines, fix_hyphenated_words=True)),
+                    [expected_with_lexicon],
+                )
+                self.assertEqual(
+                    line_joiner.join_lines_with_mapping(lines, fix_hyphenated_words=True)[0],
+                    expected_with_lexicon,
+                )
+            lexicon.close()
+
+    def test_join_lines_with_mapping(
+        self,
+    ) -> None:
+        '''
+        Test that ``join_lines_with_mapping`` gives the same text as ``join_lines`` and maps each
+        character to where it is in the lines.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        line_joiner = RBLineJoiner()
+        for test_item in test_set + [
+            {'lines': []},
+            {'lines': ['', '  ']},
+            {'lines': ['\tDin hija kwistjoni impor- ', '', ' tanti ħafna.  ', 'Il-', 'kelb.']},
+        ]:
+            lines = test_item['lines']
+            for fix_hyphenated_words in [False, True]:
+                (text, mapping) = line_joiner.join_lines_with_mapping(lines, fix_hyphenated_words)
+                self.assertEqual(text, line_joiner.join_lines(lines, fix_hyphenated_words))
+                self.assertEqual(len(mapping), len(text))
+                for (i, (line_index, column)) in enumerate(mapping):
+                    line = lines[line_index]
+                    if column == len(line.rstrip()):
+                        self.assertEqual(text[i], ' ', msg=f'{lines}: {i}')
+                    else:
+                        self.assertEqual(text[i], line[column], msg=f'{lines}: {i}')
+                self.assertEqual(
+                    ''.join(
+                        (lines[line_index].rstrip() + ' ')[start:end]
+                        for (line_index, start, end) in mapping.source_spans(0, len(text))
+                    ),
+                    text,
+                )
+
+    def test_iter_join_lines(
+        self,
+    ) -> None:
+        '''
+        Test that ``iter_join_lines`` gives the same paragraphs as ``join_lines`` on the lines of
+        each paragraph.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        for line_joiner in [RBLineJoiner(), DelegatingLineJoiner()]:
+            for fix_hyphenated_words in [False, True]:
+                for (separator, paragraph_separator) in [
+                    ([''], None),
+                    (['  ', '', '\t'], None),
+                    (['\f'], None),
+                    (['* * *'], '* * *'),
+                ]:
+                    lines = []
+                    for test_item in test_set:
+                        lines.extend(test_item['lines'])
+                        lines.extend(separator)
+                    output = list(line_joiner.iter_join_lines(
+                        iter(lines),
+                        fix_hyphenated_words=fix_hyphenated_words,
+                        paragraph_separator=paragraph_separator,
+                    ))
+                    self.assertEqual(
+                        output,
+                        [
+                            line_joiner.join_lines(test_item['lines'], fix_hyphenated_words)
+                            for test_item in test_set
+                        ],
+                        msg=f'{type(line_joiner).__name__}: {separator}',
+                    )
+
+    def test_iter_join_lines_page_breaks(
+        self,
+    ) -> None:
+        '''
+        Test that ``iter_join_lines`` ends paragraphs at page breaks within lines and at lines
+        ending with a new line character.
+        '''
+        for line_joiner in [RBLineJoiner(), DelegatingLineJoiner()]:
+            for (lines, expected) in [
+                ([], []),
+                (['', ' \n', '\f'], []),
+                (['Il-\n', 'kelb.\n'], ['Il-kelb.']),
+                (['Il-\n', 'kelb.\n', '\n', 'Il-qattus.\n'], ['Il-kelb.', 'Il-qattus.']),
+                (['Il-kelb\fIl-qattus'], ['Il-kelb', 'Il-qattus']),
+                (['Il-kelb impor-\f', 'tanti.'], ['Il-kelb impor-', 'tanti.']),
+                (['\fIl-kelb impor-', 'tanti.\f\f'], ['Il-kelb importanti.']),
+                (['Il-kelb', '* * *', 'Il-qattus'], ['Il-kelb * * * Il-qattus']),
+            ]:
+                self.assertEqual(
+                    list(line_joiner.iter_join_lines(lines, fix_hyphenated_words=True)),
+                    expected,
+                    msg=f'{type(line_joiner).__name__}: {lines}',
+                )
+            self.assertEqual(
+                list(line_joiner.iter_join_lines(
+                    ['Il-kelb', ' * * * ', 'Il-qattus'], paragraph_separator='* * *',
+                )),
+                ['Il-kelb', 'Il-qattus'],
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,124 @@
+'''
+Test the parallel processing functions.
+'''
+
+import os
+import unittest
+from typing import Iterable, Iterator
+from malti.tokeniser import KMTokeniser
+from malti.sent_splitter import KMSentSplitter, RBSentSplitter
+from malti.parallel import process_documents
+
+
+class CountingTokeniser(KMTokeniser):
+    '''
+    A tokeniser that tokenises each text in a batch into the process ID and the number of
+    tokenisers created in the process so far.
+    '''
+
+    num_created = 0
+    '''The number of tokenisers created in this process.'''
+
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Constructor.
+        '''
+        super().__init__()
+        CountingTokeniser.num_created += 1
+
+    def tokenise_batch(
+        self,
+        texts: Iterable[str],
+    ) -> list[list[str]]:
+        '''
+        Tokenise each text into the process ID and the number of tokenisers created.
+
+        :param texts: The texts to tokenise.
+        :return: The list of token lists.
+        '''
+        return [[str(os.getpid()), str(CountingTokeniser.num_created)] for _ in texts]
+
+
+class ParallelTest(unittest.TestCase):
+    '''
+    Test the parallel processing functions.
+    '''
+
+    def test_process_documents(
+        self,
+    ) -> None:
+        '''
+        Test that ``process_documents`` gives the same results as processing the documents one by
+        one, in the same order.
+        '''
+        documents = [
+            f'Dokument numru {i}. Fih {i % 5} sentenzi, eż. din. Sur Borg qal: "Iva!"'
+            for i in range(200)
+        ]
+        splitter = KMSentSplitter()
+        tokeniser = KMTokeniser()
+
+        for (workers, chunksize) in [(1, 1), (2, 3), (3, 16), (4, 1000)]:
+            self.assertEqual(
+                list(process_documents(documents, workers, chunksize)),
+                [tokeniser.tokenise_batch(splitter.split(document)) for document in documents],
+            )
+        self.assertEqual(
+            list(process_documents(
+                documents, 2, 7, tokenise=False, sent_splitter_factory=RBSentSplitter,
+            )),
+            [splitter.split(document) for document in documents],
+        )
+        self.assertEqual(
+            list(process_documents(documents, 2, 7, split=False)),
+            [tokeniser.tokenise(document) for document in documents],
+        )
+        self.assertEqual(list(process_documents([], 2)), [])
+
+        with self.assertRaises(ValueError):
+            list(process_documents(documents, 2, split=False, tokenise=False))
+        with self.assertRaises(ValueError):
+            list(process_documents(documents, 0))
+
+    def test_components_created_once(
+        self,
+    ) -> None:
+        '''
+        Test that each worker process creates its components only once.
+        '''
+        results = list(process_documents(
+            ['Test.']*100, 2, 1, split=False, tokeniser_factory=CountingTokeniser,
+        ))
+        self.assertEqual({num_created for (_, num_created) in results}, {'1'})
+        self.assertNotIn(str(os.getpid()), {pid for (pid, _) in results})
+
+    def test_streaming(
+        self,
+    ) -> None:
+        '''
+        Test that the documents are read as they are needed rather than all at once.
+        '''
+        num_documents_read = 0
+        def documents(
+        ) -> Iterator[str]:
+            '''
+            An endless stream of documents which counts the documents read.
+
+            :return: An iterator of documents.
+            '''
+            nonlocal num_documents_read
+            while True:
+                num_documents_read += 1
+                yield 'Il-kelb qiegħed hawn.'
+
+        results = process_documents(documents(), 2, 10)
+        for _ in range(100):
+            self.assertEqual(next(results), [['Il-', 'kelb', 'qiegħed', 'hawn', '.']])
+        self.assertLessEqual(num_documents_read, 100 + 2*2*10)
+        del results
+
+
+if __name__ == '__main__':
+    unittest.main()
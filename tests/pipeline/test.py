@@ -0,0 +1,132 @@
+'''
+Test the streaming pipeline.
+'''
+
+import unittest
+from typing import Iterator
+from malti.line_joiner import RBLineJoiner
+from malti.sent_splitter import KMSentSplitter, RBSentSplitter
+from malti.tokeniser import KMTokeniser
+from malti.pipeline import Pipeline
+
+
+LINES = [
+    'Il-kelb tiegħi qiegħed id-dar. Sur Borg qal: "Iva!"\n',
+    'Dan huwa eżem-\n',
+    'pju ta\' sentenza.\n',
+    '\n',
+    'Paragrafu ieħor, eż. dan.\n',
+    '***\n',
+    'L-aħħar paragrafu.\n',
+    'B\'żewġ linji.\n',
+]
+'''The lines of a text with three paragraphs separated by a blank line and by a separator line.'''
+
+
+class PipelineTest(unittest.TestCase):
+    '''
+    Test the streaming pipeline.
+    '''
+
+    def test_run(
+        self,
+    ) -> None:
+        '''
+        Test that each combination of stages gives the same outputs as using the components one
+        by one, regardless of the chunk and batch sizes.
+        '''
+        line_joiner = RBLineJoiner()
+        splitter = KMSentSplitter()
+        tokeniser = KMTokeniser()
+        paragraphs = list(line_joiner.iter_join_lines(LINES, True, '***'))
+        self.assertEqual(len(paragraphs), 3)
+        sentence_lists = [splitter.split(paragraph) for paragraph in paragraphs]
+
+        for (chunk_size, batch_size) in [(1, 1), (2, 3), (64, 1024)]:
+            pipeline = Pipeline(
+                outputs=['join_lines', 'split', 'tokenise'], fix_hyphenated_words=True,
+                paragraph_separator='***', chunk_size=chunk_size, batch_size=batch_size,
+            )
+            self.assertEqual(
+                list(pipeline.run(LINES)),
+                [
+                    {
+                        'join_lines': paragraph,
+                        'split': sentences,
+                        'tokenise': tokeniser.tokenise_batch(sentences),
+                    }
+                    for (paragraph, sentences) in zip(paragraphs, sentence_lists)
+                ],
+            )
+
+            pipeline = Pipeline(
+                ['split', 'tokenise'], chunk_size=chunk_size, batch_size=batch_size,
+            )
+            self.assertEqual(
+                list(pipeline.run(paragraphs)),
+                [{'tokenise': tokeniser.tokenise_batch(sentences)} for sentences in sentence_lists],
+            )
+
+            pipeline = Pipeline(
+                ['join_lines', 'tokenise'], fix_hyphenated_words=True, paragraph_separator='***',
+                chunk_size=chunk_size, batch_size=batch_size,
+            )
+            self.assertEqual(
+                list(pipeline.run(LINES)),
+                [{'tokenise': tokeniser.tokenise(paragraph)} for paragraph in paragraphs],
+            )
+
+        pipeline = Pipeline(['split'], sent_splitter=RBSentSplitter())
+        self.assertEqual(
+            list(pipeline.run(paragraphs)),
+            [{'split': RBSentSplitter().split(paragraph)} for paragraph in paragraphs],
+        )
+        self.assertEqual(list(Pipeline().run([])), [])
+
+    def test_invalid(
+        self,
+    ) -> None:
+        '''
+        Test that invalid settings are rejected.
+        '''
+        with self.assertRaises(ValueError):
+            Pipeline(['split', 'parse'])
+        with self.assertRaises(ValueError):
+            Pipeline([])
+        with self.assertRaises(ValueError):
+            Pipeline(['split'], outputs=['tokenise'])
+        with self.assertRaises(ValueError):
+            Pipeline(outputs=[])
+        with self.assertRaises(ValueError):
+            Pipeline(chunk_size=0)
+        with self.assertRaises(ValueError):
+            Pipeline(batch_size=0)
+
+    def test_streaming(
+        self,
+    ) -> None:
+        '''
+        Test that the lines are read as they are needed rather than all at once.
+        '''
+        num_lines_read = 0
+        def lines(
+        ) -> Iterator[str]:
+            '''
+            An endless stream of paragraphs of one line each which counts the lines read.
+
+            :return: An iterator of lines.
+            '''
+            nonlocal num_lines_read
+            while True:
+                num_lines_read += 2
+                yield 'Il-kelb qiegħed hawn.\n'
+                yield '\n'
+
+        results = Pipeline(chunk_size=10).run(lines())
+        for _ in range(100):
+            self.assertEqual(next(results), {'tokenise': [['Il-', 'kelb', 'qiegħed', 'hawn', '.']]})
+        self.assertLessEqual(num_lines_read, 2*(100 + 10 + 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+'''
+Test the ``CachedSentSplitter``.
+'''
+
+import os
+import json
+import unittest
+from malti.sent_splitter import KMSentSplitter, CachedSentSplitter
+
+
+class CachedSentSplitterTest(unittest.TestCase):
+    '''
+    Test the ``CachedSentSplitter``.
+    '''
+
+    def test_split(
+        self,
+    ) -> None:
+        '''
+        Test that the cached sentence splitter gives the same results as the wrapped sentence
+        splitter, counts the cache hits and misses, and returns copied results.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), '..', 'km_sent_splitter', 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        splitter = CachedSentSplitter(KMSentSplitter())
+        for _ in range(2):
+            for test_item in test_set:
+                output = splitter.split(test_item['text'])
+                self.assertEqual(output, test_item['split'], msg=output)
+                output.append('x')
+
+        num_texts = len({test_item['text'] for test_item in test_set})
+        stats = splitter.get_cache_stats()
+        self.assertEqual(stats['misses'], num_texts)
+        self.assertEqual(stats['hits'], 2*len(test_set) - num_texts)
+        self.assertEqual(stats['size'], num_texts)
+
+        for test_item in test_set:
+            self.assertEqual(
+                splitter.split_indices(test_item['text']),
+                splitter.splitter.split_indices(test_item['text']),
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
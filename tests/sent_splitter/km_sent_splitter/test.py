@@ -2,9 +2,13 @@
 Test the ``KMSentenceSplitter``.
 '''
 
+import io
 import os
+import re
 import json
 import unittest
+from typing import Iterator
+from malti.data import NonBreakingPrefixIndex
 from malti.sent_splitter import KMSentSplitter
 
 
@@ -34,6 +38,150 @@ class KMSentenceSplitterTest(unittest.TestCase):
                 msg=output,
             )
 
+    def test_non_breaking_prefixes(
+        self,
+    ) -> None:
+        '''
+        Test that the KM sentence splitter uses the prefixes in its index, including prefixes
+        added after it was created.
+        '''
+        index = NonBreakingPrefixIndex(['Sur'], ['Nru'])
+        splitter = KMSentSplitter(index)
+        other_splitter = KMSentSplitter(index)
+        text = 'Sur. Borg u Kap. Vella. Nru. 5 u Nru. Sitta.'
+        self.assertEqual(
+            splitter.split(text),
+            ['Sur. Borg u Kap.', 'Vella.', 'Nru. 5 u Nru.', 'Sitta.'],
+        )
+
+        index.add('Kap')
+        for s in [splitter, other_splitter]:
+            self.assertEqual(
+                s.split(text),
+                ['Sur. Borg u Kap. Vella.', 'Nru. 5 u Nru.', 'Sitta.'],
+            )
+
+    def test_split_indices(
+        self,
+    ) -> None:
+        '''
+        Test the KM sentence splitter's ``split_indices`` method.
+        The text between the indices of a sentence is exactly the sentence returned by ``split``
+        before its runs of spaces were replaced by a single space, so only spaces are left out
+        at the edges of a sentence and other white space, such as tabs and no-break spaces, is
+        kept (rather than starting and ending at the first and last non-white space characters).
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        splitter = KMSentSplitter()
+        for test_item in test_set:
+            text = test_item['text']
+            indices = splitter.split_indices(text)
+            self.assertEqual(
+                [re.sub(' +', ' ', text[i:j]) for (i, j) in indices],
+                test_item['split'],
+                msg=indices,
+            )
+
+        for (text, expected) in [
+            ('', []),
+            ('  ', [(0, 0)]),
+            ('  Kelb.   Qattus ħelu.  \n', [(2, 7), (10, 22)]),
+            ('Kelb.\n\n  \nQattus.', [(0, 5), (6, 6), (7, 7), (10, 17)]),
+            ('Kelb.\n Qattus.', [(0, 5), (6, 6), (7, 14)]),
+            # The tab and no-break space kept by split are part of the sentences.
+            ('\t Kelb.\xa0 \n \tQattus. \t', [(2, 8), (11, 19)]),
+        ]:
+            self.assertEqual(splitter.split_indices(text), expected, msg=repr(text))
+
+    def test_iter_split(
+        self,
+    ) -> None:
+        '''
+        Test that the KM sentence splitter's ``iter_split`` method gives the same sentences as
+        ``split`` on the whole text and yields sentences before reading the whole stream.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        splitter = KMSentSplitter()
+        for separator in ['\n', '\n\n', ' \n ', ' ', '\r\n', '\r\n  ', '\n  ', '\n\t']:
+            text = separator.join(test_item['text'] for test_item in test_set)
+            expected = splitter.split(text)
+            for chunk_size in [1, 2, 7, 100, 100000]:
+                chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+                self.assertEqual(list(splitter.iter_split(chunks)), expected)
+                self.assertEqual(
+                    list(splitter.iter_split(io.StringIO(text), chunk_size)),
+                    expected,
+                )
+
+        for text in [
+            '', ' ', '\n', '\n\nKelb.\n\n', 'Kelb.\nQattus. \n\n', 'Kelb.\r\nQattus.\r\n',
+            'Kelb.\n  Qattus.', 'Kelb.\n  qattus.', 'Dr.\n  Borg.', 'Kelb.\r\n  Qattus.\r\n\r\n',
+        ]:
+            self.assertEqual(list(splitter.iter_split([text])), splitter.split(text))
+
+        num_chunks_read = 0
+        def stream(
+        ) -> Iterator[str]:
+            '''
+            An endless stream of lines of text which counts the lines read.
+
+            :return: An iterator of lines.
+            '''
+            nonlocal num_chunks_read
+            while True:
+                num_chunks_read += 1
+                yield 'Il-kelb qiegħed hawn. Il-qattus qiegħed hemm.\n'
+
+        sentences = splitter.iter_split(stream())
+        self.assertEqual(next(sentences), 'Il-kelb qiegħed hawn.')
+        self.assertEqual(num_chunks_read, 2)
+
+    def test_iter_split_bounded(
+        self,
+    ) -> None:
+        '''
+        Test that the KM sentence splitter's ``iter_split`` method only splits a few lines at a
+        time when the lines end with a carriage return and new line, are indented with spaces, or
+        are separated by blank lines.
+        '''
+        piece_sizes: list[int] = []
+
+        class RecordingSplitter(KMSentSplitter):
+            '''
+            A sentence splitter that records the size of each text it splits.
+            '''
+
+            def split(
+                self,
+                text: str,
+            ) -> list[str]:
+                '''
+                Split a text into a list of sentences, recording its size.
+
+                :param text: The text to split.
+                :return: The list of sentences.
+                '''
+                piece_sizes.append(len(text))
+                return super().split(text)
+
+        splitter = RecordingSplitter()
+        for line_end in ['\r\n', '\n  ', '\r\n    ', '\r\n\r\n']:
+            text = ''.join(f'Linja numru {i}. Il-kelb qiegħed hawn.{line_end}' for i in range(2000))
+            expected = splitter.split(text)
+            piece_sizes.clear()
+            self.assertEqual(list(splitter.iter_split(io.StringIO(text), 100)), expected)
+            self.assertLess(max(piece_sizes), 300, msg=repr(line_end))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,102 @@
+'''
+Test the ``RBSentSplitter``.
+'''
+
+import os
+import json
+import random
+import re
+import sys
+import unicodedata
+import unittest
+from malti.sent_splitter import KMSentSplitter, RBSentSplitter
+
+
+class RBSentSplitterTest(unittest.TestCase):
+    '''
+    Test the ``RBSentSplitter``.
+    '''
+
+    def test_split(
+        self,
+    ) -> None:
+        '''
+        Test the RB sentence splitter's ``split`` method on the KM sentence splitter's test set.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), '..', 'km_sent_splitter', 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        splitter = RBSentSplitter()
+        for test_item in test_set:
+            output = splitter.split(test_item['text'])
+            self.assertEqual(
+                output,
+                test_item['split'],
+                msg=output,
+            )
+
+    def test_same_as_km(
+        self,
+    ) -> None:
+        '''
+        Test that the RB sentence splitter gives the same sentences (including when streamed) and
+        sentence indices as the KM sentence splitter on random texts made of the characters,
+        words, and prefixes that affect sentence splitting.
+        '''
+        km_splitter = KMSentSplitter()
+        rb_splitter = RBSentSplitter()
+        rng = random.Random(0)
+        pieces = (
+            [rng.choice(sorted(rb_splitter.non_breaking_prefixes)) + '.' for _ in range(50)]
+            + ['Il-kelb', 'qiegħed', 'Malta', 'Sur', 'eż.', 'U.S.A.', '12', '3.5', 'x.', '...']
+            + list('      ..?!\'"()[]«»‘’“”¿¡%-\n\t\xa0_AbĦż30中é́²')
+            + ['\r\n', '\n  ', '\r\n ']
+        )
+        texts = [''.join(rng.choices(pieces, k=rng.randint(1, 25))) for _ in range(10000)]
+        texts.extend(['', ' ', '  \n ', '\n', 'Kelb.  \n  Qattus.', 'Kelb. \n\nQattus.'])
+        for text in texts:
+            self.assertEqual(
+                rb_splitter.split(text),
+                km_splitter.split(text),
+                msg=repr(text),
+            )
+            indices = rb_splitter.split_indices(text)
+            self.assertEqual(indices, km_splitter.split_indices(text), msg=repr(text))
+            # Only the runs of spaces differ between the indexed text and the split sentences.
+            self.assertEqual(
+                [re.sub(' +', ' ', text[i:j]) for (i, j) in indices],
+                km_splitter.split(text),
+                msg=repr(text),
+            )
+            chunk_size = rng.randint(1, 10)
+            self.assertEqual(
+                list(rb_splitter.iter_split(
+                    text[i:i + chunk_size] for i in range(0, len(text), chunk_size)
+                )),
+                km_splitter.split(text),
+                msg=repr(text),
+            )
+
+    def test_punctuation_sets(
+        self,
+    ) -> None:
+        '''
+        Test that the initial and final punctuation sets have all the characters with the
+        corresponding Unicode general category.
+        '''
+        chars = [chr(code_point) for code_point in range(sys.maxunicode + 1)]
+        self.assertEqual(
+            RBSentSplitter.INITIAL_PUNCTUATION,
+            {char for char in chars if unicodedata.category(char) == 'Pi'},
+        )
+        self.assertEqual(
+            RBSentSplitter.FINAL_PUNCTUATION,
+            {char for char in chars if unicodedata.category(char) == 'Pf'},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+'''
+Test the ``CachedTokeniser``.
+'''
+
+import os
+import json
+import unittest
+from malti.tokeniser import KMTokeniser, CachedTokeniser
+
+
+class CachedTokeniserTest(unittest.TestCase):
+    '''
+    Test the ``CachedTokeniser``.
+    '''
+
+    def test_tokenise(
+        self,
+    ) -> None:
+        '''
+        Test that the cached tokeniser gives the same results as the wrapped tokeniser and counts
+        the cache hits and misses.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), '..', 'km_tokeniser', 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMTokeniser()
+        cached_tokeniser = CachedTokeniser(tokeniser)
+        for _ in range(2):
+            for test_item in test_set:
+                self.assertEqual(
+                    cached_tokeniser.tokenise(test_item['text']),
+                    tokeniser.tokenise(test_item['text']),
+                )
+                self.assertEqual(
+                    cached_tokeniser.tokenise_indices(test_item['text']),
+                    tokeniser.tokenise_indices(test_item['text']),
+                )
+
+        num_texts = len({test_item['text'] for test_item in test_set})
+        stats = cached_tokeniser.get_cache_stats()
+        self.assertEqual(stats['misses'], 2*num_texts)
+        self.assertEqual(stats['hits'], 4*len(test_set) - 2*num_texts)
+        self.assertEqual(stats['size'], 2*num_texts)
+
+    def test_copied_results(
+        self,
+    ) -> None:
+        '''
+        Test that modifying a returned result does not modify the cache.
+        '''
+        cached_tokeniser = CachedTokeniser(KMTokeniser())
+        tokens = cached_tokeniser.tokenise('Il-kelb tiegħi.')
+        tokens.append('x')
+        self.assertEqual(
+            cached_tokeniser.tokenise('Il-kelb tiegħi.'),
+            ['Il-', 'kelb', 'tiegħi', '.'],
+        )
+        self.assertEqual(cached_tokeniser.detokenise(['Il-', 'kelb', '.']), 'Il-kelb.')
+
+    def test_retokenise(
+        self,
+    ) -> None:
+        '''
+        Test that re-tokenising is passed on to the wrapped tokeniser without using the cache.
+        '''
+        tokeniser = KMTokeniser()
+        cached_tokeniser = CachedTokeniser(tokeniser)
+        text = 'Il-kelb tiegħi jiġri.'
+        indices = tokeniser.tokenise_indices(text)
+        calls: list[tuple[int, int]] = []
+        original = tokeniser.retokenise_indices
+
+        def retokenise_indices(
+            text: str,
+            indices: list[tuple[int, int]],
+            start: int,
+            end: int,
+            replacement: str,
+        ) -> list[tuple[int, int]]:
+            '''
+            Record the call and re-tokenise with the wrapped tokeniser.
+
+            :param text: The text before the edit.
+            :param indices: The indices of the tokens before the edit.
+            :param start: The index of the start of the replaced part of the text.
+            :param end: The index of the end of the replaced part of the text.
+            :param replacement: The text to put in place of the replaced part.
+            :return: The indices of the tokens in the edited text.
+            '''
+            calls.append((start, end))
+            return original(text, indices, start, end, replacement)
+
+        setattr(tokeniser, 'retokenise_indices', retokenise_indices)
+        self.assertEqual(
+            cached_tokeniser.retokenise_indices(text, indices, 8, 14, 'tagħna'),
+            tokeniser.tokenise_indices('Il-kelb tagħna jiġri.'),
+        )
+        self.assertEqual(calls, [(8, 14)])
+        self.assertEqual(cached_tokeniser.get_cache_stats()['size'], 0)
+
+    def test_eviction(
+        self,
+    ) -> None:
+        '''
+        Test that the cache does not grow beyond its maximum number of entries.
+        '''
+        cached_tokeniser = CachedTokeniser(KMTokeniser(), max_entries=2)
+        for text in ['wieħed', 'tnejn', 'tlieta', 'wieħed']:
+            cached_tokeniser.tokenise(text)
+        stats = cached_tokeniser.get_cache_stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertEqual(stats['hits'], 0)
+
+        cached_tokeniser.clear_cache()
+        self.assertEqual(cached_tokeniser.get_cache_stats()['size'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+'''
+Test the ``KMScannerTokeniser``.
+'''
+
+import os
+import json
+import random
+import unittest
+from malti.tokeniser import KMTokeniser, KMScannerTokeniser
+
+
+class KMScannerTokeniserTest(unittest.TestCase):
+    '''
+    Test the ``KMScannerTokeniser``.
+    '''
+
+    def test_tokenise(
+        self,
+    ) -> None:
+        '''
+        Test the KM scanner tokeniser's ``tokenise`` and ``tokenise_indices`` methods on the KM
+        tokeniser's test set.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), '..', 'km_tokeniser', 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMScannerTokeniser()
+        for test_item in test_set:
+            output = tokeniser.tokenise(test_item['text'])
+            self.assertEqual(
+                output,
+                test_item['tokenised'].split(' '),
+                msg=output,
+            )
+
+            indices = tokeniser.tokenise_indices(test_item['text'])
+            output = [test_item['text'][i:j] for (i, j) in indices]
+            self.assertEqual(
+                output,
+                test_item['tokenised'].split(' '),
+                msg=indices,
+            )
+
+    def test_differential(
+        self,
+    ) -> None:
+        '''
+        Test that the KM scanner tokeniser gives exactly the same output as the KM tokeniser on
+        random texts made up of characters and words that exercise every token kind.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), '..', 'km_tokeniser', 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        words = ' '.join(test_item['text'] for test_item in test_set).split(' ') + [
+            '10/10/2010', '1-2-33', '2017/1/1', '12,5', 'għall-', 'ħdax-il', 'l\'', 'l’',
+            'sant\'Anna', 'x_y', 'a1l-b', 'ſ-', 'ĦDAX-İL', '٣٤/٥',
+        ]
+        chars = 'ailtdżċħ_ſİıIL0123456789٣-/.,\'’`"…?! \n\t()'
+        separators = [' ', '\n', '', '-', '’', '.']
+
+        expected_tokeniser = KMTokeniser()
+        tokeniser = KMScannerTokeniser()
+        rng = random.Random(0)
+        for i in range(20000):
+            if i % 2 == 0:
+                text = ''.join(rng.choice(chars) for _ in range(rng.randint(0, 12)))
+            else:
+                text = ''.join(
+                    rng.choice(words) + rng.choice(separators) for _ in range(rng.randint(1, 6))
+                )
+            self.assertEqual(
+                tokeniser.tokenise(text),
+                expected_tokeniser.tokenise(text),
+                msg=repr(text),
+            )
+            self.assertEqual(
+                tokeniser.tokenise_indices(text),
+                expected_tokeniser.tokenise_indices(text),
+                msg=repr(text),
+            )
+            self.assertEqual(
+                tokeniser.tokenise_indices_compact(text).tolist(),
+                expected_tokeniser.tokenise_indices(text),
+                msg=repr(text),
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,9 +3,11 @@ Test the ``KMTokeniser``.
 '''
 
 import os
+import io
 import json
+import random
 import unittest
-from malti.tokeniser import KMTokeniser
+from malti.tokeniser import KMTokeniser, KMTokenType
 
 
 class KMTokeniserTest(unittest.TestCase):
@@ -56,6 +58,195 @@ class KMTokeniserTest(unittest.TestCase):
                 msg=indices,
             )
 
+    def test_tokenise_indices_compact(
+        self,
+    ) -> None:
+        '''
+        Test the KM tokeniser's ``tokenise_indices_compact`` method.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMTokeniser()
+        for test_item in test_set:
+            indices = tokeniser.tokenise_indices_compact(test_item['text'])
+            self.assertEqual(
+                indices.tolist(),
+                tokeniser.tokenise_indices(test_item['text']),
+                msg=indices,
+            )
+
+    def test_tokenise_typed(
+        self,
+    ) -> None:
+        '''
+        Test the KM tokeniser's ``tokenise_typed`` and ``tokenise_indices_typed`` methods.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMTokeniser()
+        for test_item in test_set:
+            (tokens, token_types) = tokeniser.tokenise_typed(test_item['text'])
+            self.assertEqual(tokens, tokeniser.tokenise(test_item['text']), msg=tokens)
+            (indices, indices_types) = tokeniser.tokenise_indices_typed(test_item['text'])
+            self.assertEqual(indices, tokeniser.tokenise_indices(test_item['text']), msg=indices)
+            self.assertEqual(token_types, indices_types, msg=tokens)
+
+        text = 'Fl-10/10/2010 ħdax-il kelb, 12.5 u 3 -il (x).\nl\'\n'
+        (tokens, token_types) = tokeniser.tokenise_typed(text)
+        self.assertEqual(
+            list(zip(tokens, [KMTokenType(token_type) for token_type in token_types])),
+            [
+                ('Fl-', KMTokenType.DEF_ARTICLE),
+                ('10/10/2010', KMTokenType.NUMERIC_DATE),
+                ('ħdax-', KMTokenType.DEF_ARTICLE),
+                ('il', KMTokenType.WORD),
+                ('kelb', KMTokenType.WORD),
+                (',', KMTokenType.PUNCTUATION),
+                ('12.5', KMTokenType.DECIMAL),
+                ('u', KMTokenType.WORD),
+                ('3', KMTokenType.NUMBER),
+                ('-il', KMTokenType.DEF_NUMERAL),
+                ('(', KMTokenType.PUNCTUATION),
+                ('x', KMTokenType.WORD),
+                (')', KMTokenType.PUNCTUATION),
+                ('.', KMTokenType.PUNCTUATION),
+                ('l\'', KMTokenType.PROCLITIC_PREP),
+            ],
+        )
+
+    def test_tokenise_batch(
+        self,
+    ) -> None:
+        '''
+        Test the KM tokeniser's ``tokenise_batch`` method.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMTokeniser()
+        texts = [test_item['text'] for test_item in test_set] + ['', ' ', '\n']
+        output = tokeniser.tokenise_batch(texts)
+        self.assertEqual(
+            output,
+            [tokeniser.tokenise(text) for text in texts],
+        )
+
+    def test_tokenise_indices_batch(
+        self,
+    ) -> None:
+        '''
+        Test the KM tokeniser's ``tokenise_indices_batch`` method.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMTokeniser()
+        texts = [test_item['text'] for test_item in test_set] + ['', ' ', '\n']
+        output = tokeniser.tokenise_indices_batch(iter(texts))
+        self.assertEqual(
+            output,
+            [tokeniser.tokenise_indices(text) for text in texts],
+        )
+
+    def test_iter_tokenise(
+        self,
+    ) -> None:
+        '''
+        Test the KM tokeniser's ``iter_tokenise`` method with different chunk sizes.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMTokeniser()
+        text = '\n'.join(
+            [test_item['text'] for test_item in test_set]
+            + ['Fl-10/10/2010 għall-\nl\'\n...\' u ħdax-il sant\'Anna']
+        )
+        for chunk_size in [1, 2, 3, 5, 8, 13, 100]:
+            output = list(tokeniser.iter_tokenise(io.StringIO(text), chunk_size))
+            self.assertEqual(
+                output,
+                tokeniser.tokenise(text),
+                msg=f'chunk_size={chunk_size}',
+            )
+
+    def test_iter_tokenise_indices(
+        self,
+    ) -> None:
+        '''
+        Test the KM tokeniser's ``iter_tokenise_indices`` method with different chunk sizes.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMTokeniser()
+        text = '\n'.join(
+            [test_item['text'] for test_item in test_set]
+            + ['Fl-10/10/2010 għall-\nl\'\n...\' u ħdax-il sant\'Anna']
+        )
+        for chunk_size in [1, 2, 3, 5, 8, 13, 100]:
+            chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+            output = list(tokeniser.iter_tokenise_indices(chunks))
+            self.assertEqual(
+                output,
+                tokeniser.tokenise_indices(text),
+                msg=f'chunk_size={chunk_size}',
+            )
+
+    def test_retokenise_indices(
+        self,
+    ) -> None:
+        '''
+        Test the KM tokeniser's ``retokenise_indices`` method against tokenising the whole text
+        after each edit in random sequences of edits.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        tokeniser = KMTokeniser()
+        rng = random.Random(0)
+        pieces = list('abċdeħiżl-.,/\'’`12 \n') + ['il-', 'l’', '10/10/2010', '3.5', ' u ']
+        for test_item in test_set:
+            text = test_item['text'] + '\nFl-10/10/2010 għall-\nl’\n...\' u ħdax-il sant\'Anna'
+            indices = tokeniser.tokenise_indices(text)
+            for _ in range(200):
+                start = rng.randint(0, len(text))
+                end = min(len(text), start + rng.choice([0, 0, 1, 2, 5]))
+                replacement = ''.join(rng.choices(pieces, k=rng.choice([0, 1, 1, 2, 3])))
+                indices = tokeniser.retokenise_indices(text, indices, start, end, replacement)
+                text = text[:start] + replacement + text[end:]
+                self.assertEqual(
+                    indices,
+                    tokeniser.tokenise_indices(text),
+                    msg=(text, start, end, replacement),
+                )
+
+        with self.assertRaises(ValueError):
+            tokeniser.retokenise_indices('abc', [(0, 3)], 2, 4, 'x')
+
     def test_detokenise(
         self,
     ) -> None:
@@ -78,5 +269,49 @@ class KMTokeniserTest(unittest.TestCase):
             )
 
 
+    def test_detokenise_batch(
+        self,
+    ) -> None:
+        '''
+        Test the KM tokeniser's ``detokenise_batch`` method and its classification cache.
+        '''
+        with open(
+            os.path.join(os.path.dirname(__file__), 'test_set.json'),
+            'r', encoding='utf-8'
+        ) as f:
+            test_set = json.load(f)
+
+        token_lists = [test_item['tokenised'].split(' ') for test_item in test_set]
+        expected = [test_item['detokenised'] for test_item in test_set]
+        num_tokens = sum(len(tokens) for tokens in token_lists)
+        num_distinct_tokens = len({token for tokens in token_lists for token in tokens})
+
+        tokeniser = KMTokeniser()
+        self.assertEqual(tokeniser.detokenise_batch(token_lists), expected)
+        self.assertEqual(
+            tokeniser.get_detokenise_cache_stats(),
+            {
+                'hits': num_tokens - num_distinct_tokens,
+                'misses': num_distinct_tokens,
+                'size': num_distinct_tokens,
+                'max_size': 10000,
+            },
+        )
+        self.assertEqual(tokeniser.detokenise_batch(token_lists), expected)
+        self.assertEqual(tokeniser.get_detokenise_cache_stats()['misses'], num_distinct_tokens)
+
+        tokeniser.clear_detokenise_cache()
+        self.assertEqual(tokeniser.get_detokenise_cache_stats()['size'], 0)
+
+        for cache_size in [0, 5, None]:
+            tokeniser = KMTokeniser(detokenise_cache_size=cache_size)
+            self.assertEqual(tokeniser.detokenise_batch(token_lists), expected, msg=cache_size)
+            self.assertEqual(
+                tokeniser.get_detokenise_cache_stats()['size'],
+                num_distinct_tokens if cache_size is None else cache_size,
+                msg=cache_size,
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
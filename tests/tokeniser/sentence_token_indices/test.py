@@ -0,0 +1,49 @@
+'''
+Test the ``SentenceTokenIndices``.
+'''
+
+from array import array
+import unittest
+from malti.tokeniser import TokenIndices, SentenceTokenIndices
+
+
+class SentenceTokenIndicesTest(unittest.TestCase):
+    '''
+    Test the ``SentenceTokenIndices``.
+    '''
+
+    def test_sequence(
+        self,
+    ) -> None:
+        '''
+        Test that ``SentenceTokenIndices`` behaves like a list of lists of index pairs.
+        '''
+        sentences = [[(0, 3), (4, 7), (7, 8)], [], [(10, 14), (14, 15)]]
+        indices = SentenceTokenIndices(
+            TokenIndices.from_pairs([(0, 8), (9, 9), (10, 15)]),
+            TokenIndices.from_pairs(pair for sentence in sentences for pair in sentence),
+            array('q', [0, 3, 3, 5]),
+        )
+
+        self.assertEqual(len(indices), 3)
+        self.assertEqual(indices.tolist(), sentences)
+        self.assertEqual([sentence.tolist() for sentence in indices], sentences)
+        for i in range(-3, 3):
+            self.assertEqual(indices[i], sentences[i], msg=i)
+        self.assertEqual([sentence.tolist() for sentence in indices[1:]], sentences[1:])
+        with self.assertRaises(IndexError):
+            indices[3] # pylint: disable=pointless-statement
+        self.assertEqual(indices.nbytes, 6*8 + 10*8 + 4*8)
+
+        self.assertEqual(SentenceTokenIndices().tolist(), [])
+        with self.assertRaises(ValueError):
+            SentenceTokenIndices(TokenIndices.from_pairs([(0, 8)]), None, array('q', [0]))
+        with self.assertRaises(ValueError):
+            SentenceTokenIndices(
+                TokenIndices.from_pairs([(0, 8)]), TokenIndices.from_pairs([(0, 3)]),
+                array('q', [0, 2]),
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+'''
+Test the ``TokenIndices``.
+'''
+
+from array import array
+import unittest
+from malti.tokeniser import TokenIndices
+
+
+class TokenIndicesTest(unittest.TestCase):
+    '''
+    Test the ``TokenIndices``.
+    '''
+
+    def test_sequence(
+        self,
+    ) -> None:
+        '''
+        Test that ``TokenIndices`` behaves like a list of index pairs.
+        '''
+        pairs = [(0, 3), (3, 7), (8, 11), (12, 18), (19, 29), (29, 30)]
+        indices = TokenIndices.from_pairs(pairs)
+
+        self.assertEqual(len(indices), len(pairs))
+        self.assertEqual(list(indices), pairs)
+        self.assertEqual(indices.tolist(), pairs)
+        self.assertEqual(indices, pairs)
+        for i in range(-len(pairs), len(pairs)):
+            self.assertEqual(indices[i], pairs[i], msg=i)
+        for (start, stop, step) in [
+            (None, None, None), (1, 3, None), (-2, None, None), (None, None, 2),
+            (None, None, -1), (4, 1, None), (5, 0, -2),
+        ]:
+            self.assertEqual(
+                indices[start:stop:step].tolist(),
+                pairs[start:stop:step],
+                msg=(start, stop, step),
+            )
+        with self.assertRaises(IndexError):
+            _ = indices[len(pairs)]
+        self.assertIn((8, 11), indices)
+        self.assertEqual(indices.index((12, 18)), 3)
+
+    def test_arrays(
+        self,
+    ) -> None:
+        '''
+        Test the array-backed properties of ``TokenIndices``.
+        '''
+        indices = TokenIndices()
+        indices.append(0, 3)
+        indices.append(4, 9)
+
+        self.assertEqual(indices.data, array('q', [0, 3, 4, 9]))
+        self.assertEqual(indices.starts.tolist(), [0, 4])
+        self.assertEqual(indices.ends.tolist(), [3, 9])
+        self.assertEqual(indices.nbytes, 32)
+        self.assertEqual(TokenIndices(array('q', [0, 3, 4, 9])), indices)
+        with self.assertRaises(ValueError):
+            TokenIndices(array('q', [0, 3, 4]))
+        with self.assertRaises(ValueError):
+            TokenIndices(array('i', [0, 3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
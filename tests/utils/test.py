@@ -0,0 +1,106 @@
+'''
+Test the utilities.
+'''
+
+import unittest
+from malti.utils import LRUCache, estimate_size, iter_batches
+
+
+class IterBatchesTest(unittest.TestCase):
+    '''
+    Test ``iter_batches``.
+    '''
+
+    def test_iter_batches(
+        self,
+    ) -> None:
+        '''
+        Test that items are grouped into batches of the given size, with a shorter last batch.
+        '''
+        self.assertEqual(list(iter_batches(range(7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(iter_batches(iter('abcd'), 2)), [['a', 'b'], ['c', 'd']])
+        self.assertEqual(list(iter_batches([], 2)), [])
+        with self.assertRaises(ValueError):
+            list(iter_batches('abc', 0))
+
+
+class LRUCacheTest(unittest.TestCase):
+    '''
+    Test the ``LRUCache``.
+    '''
+
+    def test_max_entries(
+        self,
+    ) -> None:
+        '''
+        Test that the least recently used entries are evicted when there are too many entries.
+        '''
+        cache: LRUCache[str, int] = LRUCache(max_entries=3, max_bytes=None)
+        for (i, key) in enumerate('abc'):
+            cache.put(key, i)
+        self.assertEqual(cache.get('a'), 0)
+        cache.put('d', 3)
+
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual([cache.get(key) for key in 'acd'], [0, 2, 3])
+        self.assertEqual(
+            cache.get_stats(),
+            {
+                'hits': 4,
+                'misses': 1,
+                'evictions': 1,
+                'size': 3,
+                'bytes': sum(estimate_size(key) + estimate_size(i) for (i, key) in [
+                    (0, 'a'), (2, 'c'), (3, 'd'),
+                ]),
+            },
+        )
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(
+            cache.get_stats(),
+            {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'bytes': 0},
+        )
+
+    def test_max_bytes(
+        self,
+    ) -> None:
+        '''
+        Test that the least recently used entries are evicted when the entries take too much
+        memory and that entries that are too big on their own are not added.
+        '''
+        entry_size = estimate_size('a') + estimate_size(('x'*100,))
+        cache: LRUCache[str, tuple] = LRUCache(max_entries=None, max_bytes=2*entry_size)
+        for key in 'abc':
+            cache.put(key, ('x'*100,))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('a'))
+        self.assertLessEqual(cache.get_stats()['bytes'], 2*entry_size)
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+
+        cache.put('d', ('x'*1000,))
+        self.assertIsNone(cache.get('d'))
+        self.assertEqual(len(cache), 2)
+
+    def test_replace(
+        self,
+    ) -> None:
+        '''
+        Test that putting an existing key replaces its value without evicting anything.
+        '''
+        cache: LRUCache[str, str] = LRUCache(max_entries=2)
+        cache.put('a', 'x')
+        cache.put('b', 'y')
+        cache.put('a', 'z')
+        self.assertEqual([cache.get('a'), cache.get('b')], ['z', 'y'])
+        self.assertEqual(cache.get_stats()['evictions'], 0)
+        self.assertEqual(
+            cache.get_stats()['bytes'],
+            sum(estimate_size(item) for item in ['a', 'z', 'b', 'y']),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -166,6 +166,7 @@ def main(
     check_init(malti.path)
 
     check_docstrings_dir(os.path.abspath(os.path.join(malti.path, '..', '..', 'tools')))
+    check_docstrings_dir(os.path.abspath(os.path.join(malti.path, '..', '..', 'benchmarks')))
     check_docstrings_dir(os.path.abspath(os.path.join(malti.path, '..', '..', 'tests')))
     check_docstrings_dir(malti.path)
 